@@ -102,7 +102,7 @@ def get(phab: PhabricatorClient, revision_id: int) -> dict[str, Any]:
         revision_diffs = get_diffs_for_revision(revision, stack_data.diffs)
         involved_phids.update(gather_involved_phids(revision, revision_diffs))
 
-    involved_phids = list(involved_phids)
+    involved_phids = sorted(involved_phids)
 
     users = user_search(phab, involved_phids)
     projects = project_search(phab, involved_phids)
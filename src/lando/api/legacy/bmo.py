@@ -1,7 +1,26 @@
+import logging
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
 from typing import Optional
 
 import requests
 from django.conf import settings
+from django.core.cache import cache
+
+from lando.utils.http import create_session
+
+logger = logging.getLogger(__name__)
+
+
+class BugVisibility(str, Enum):
+    """Visibility of a bug on BMO to anonymous users."""
+
+    PUBLIC = "public"
+    PRIVATE = "private"
+    NONEXISTENT = "nonexistent"
+    # BMO returned an unexpected status. This is never cached.
+    UNKNOWN = "unknown"
 
 
 def api_request(
@@ -20,20 +39,21 @@ def api_request(
       used.
     `headers` is the set of HTTP headers to pass to the request.
 
-    All other arguments in *args and **kwargs are passed through to `requests.request`.
+    All other arguments in *args and **kwargs are passed through to
+    `requests.Session.request`. Connections are pooled across requests.
     """
     url = f"{settings.BUGZILLA_URL}/rest/{path}"
 
-    common_headers = {
-        "User-Agent": settings.HTTP_USER_AGENT,
-    }
+    common_headers = {}
     if headers:
         common_headers.update(headers)
 
     if use_api_key:
         common_headers["X-Bugzilla-API-Key"] = settings.BUGZILLA_API_KEY
 
-    return requests.request(method, url, *args, headers=common_headers, **kwargs)
+    # Don't close the session, as that would close the pooled connections.
+    session = create_session("bmo", headers=common_headers)
+    return session.request(method, url, *args, **kwargs)
 
 
 def search_bugs(bug_ids: set[int]) -> set[int]:
@@ -65,6 +85,79 @@ def get_status_code_for_bug(bug_id: int) -> int:
     return code
 
 
+def bug_visibility_cache_key(bug_id: int) -> str:
+    """Return the cache key for the visibility of `bug_id`."""
+    return f"bmo_bug_visibility_{bug_id}"
+
+
+def visibility_for_status_code(status_code: int) -> BugVisibility:
+    """Return the visibility of a bug given the status code of a request for it."""
+    if status_code == 200:
+        return BugVisibility.PUBLIC
+
+    if status_code == 401:
+        return BugVisibility.PRIVATE
+
+    if status_code == 404:
+        return BugVisibility.NONEXISTENT
+
+    return BugVisibility.UNKNOWN
+
+
+def get_bug_visibility(bug_ids: Iterable[int]) -> dict[int, BugVisibility]:
+    """Return the visibility of each of `bug_ids`.
+
+    Known visibilities are read from the cache. Unknown bugs are searched for
+    in a single request, and those which weren't found are then classified
+    concurrently from the status code BMO returns for each of them. Results
+    are cached for `BUGZILLA_VISIBILITY_CACHE_TIMEOUT` seconds.
+
+    Raises `requests.exceptions.RequestException` if BMO can't be contacted.
+    """
+    bug_ids = set(bug_ids)
+    keys = {bug_visibility_cache_key(bug_id): bug_id for bug_id in bug_ids}
+    visibility = {
+        keys[key]: BugVisibility(value) for key, value in cache.get_many(keys).items()
+    }
+
+    missing = bug_ids - visibility.keys()
+    if missing:
+        found = search_bugs(missing)
+        visibility.update(dict.fromkeys(found, BugVisibility.PUBLIC))
+
+        not_found = sorted(missing - found)
+        if not_found:
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(settings.BUGZILLA_CONCURRENCY, len(not_found))),
+                thread_name_prefix="bmo",
+            ) as executor:
+                status_codes = executor.map(get_status_code_for_bug, not_found)
+                visibility.update(
+                    {
+                        bug_id: visibility_for_status_code(status_code)
+                        for bug_id, status_code in zip(
+                            not_found, status_codes, strict=True
+                        )
+                    }
+                )
+
+        cache.set_many(
+            {
+                bug_visibility_cache_key(bug_id): visibility[bug_id].value
+                for bug_id in missing
+                if visibility[bug_id] != BugVisibility.UNKNOWN
+            },
+            timeout=settings.BUGZILLA_VISIBILITY_CACHE_TIMEOUT,
+        )
+
+    logger.debug(
+        "bug visibility resolved",
+        extra={"bugs": len(bug_ids), "cache_misses": len(missing)},
+    )
+
+    return visibility
+
+
 def uplift_get_bug(params: dict) -> dict:
     """Retrieve bug information from the Lando Uplift Automation endpoint."""
     resp_get = api_request("GET", "lando/uplift", use_api_key=True, params=params)
@@ -47,19 +47,10 @@ def project_search(
     if not project_phids:
         return {}
 
-    project_phids = list(project_phids)
-    project_phids.sort()
-    cache_key = ",".join(project_phids)
-
-    if cache.has_key(cache_key):
-        return cache.get(cache_key)
-
-    projects = phabricator.call_conduit(
-        "project.search", constraints={"phids": project_phids}
+    projects = phabricator.cached_search(
+        "project.search", constraints={"phids": sorted(project_phids)}
     )
-    result = result_list_to_phid_dict(phabricator.expect(projects, "data"))
-    cache.set(cache_key, result)
-    return result
+    return result_list_to_phid_dict(phabricator.expect(projects, "data"))
 
 
 def get_project_phid(
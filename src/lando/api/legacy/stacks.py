@@ -9,6 +9,7 @@ import networkx as nx
 from lando.main.models import Repo
 from lando.utils.phabricator import (
     PhabricatorClient,
+    call_concurrently,
     result_list_to_phid_dict,
 )
 
@@ -66,19 +67,29 @@ def request_extended_revision_data(
     if not revision_phids:
         return RevisionData({}, {}, {})
 
-    revs = get_revisions_by_phid(phab, revision_phids)
-    diffs = get_diffs_by_revision_phid(phab, list(revs.keys()))
+    # Use a stable order so repeated requests for a stack are identical.
+    revision_phids = sorted(revision_phids)
+
+    # Diffs are searched by the requested revision PHIDs, which
+    # `get_revisions_by_phid` checks are all returned, so both searches
+    # can be made at once.
+    results = call_concurrently(
+        {
+            "revisions": lambda: get_revisions_by_phid(phab, revision_phids),
+            "diffs": lambda: get_diffs_by_revision_phid(phab, revision_phids),
+        }
+    )
+    revs, diffs = results["revisions"], results["diffs"]
 
     repo_phids = [phab.expect(r, "fields", "repositoryPHID") for r in revs.values()] + [
         phab.expect(d, "fields", "repositoryPHID") for d in diffs.values()
     ]
     repo_phids = {phid for phid in repo_phids if phid is not None}
     if repo_phids:
-        repos = phab.call_conduit(
+        repos = phab.cached_search(
             "diffusion.repository.search",
+            constraints={"phids": sorted(repo_phids)},
             attachments={"projects": True},
-            constraints={"phids": list(repo_phids)},
-            limit=len(repo_phids),
         )
         phab.expect(repos, "data", len(repo_phids) - 1)
         repos = result_list_to_phid_dict(phab.expect(repos, "data"))
@@ -96,11 +107,10 @@ def get_revisions_by_phid(
     Returns a PHID-keyed dict of revision data with reviewer and project
     attachments.  Raises `ValueError` if any PHID is not found.
     """
-    revs = phab.call_conduit_collated(
+    revs = phab.cached_search(
         "differential.revision.search",
         constraints={"phids": revision_phids},
         attachments={"reviewers": True, "reviewers-extra": True, "projects": True},
-        limit=len(revision_phids),
     )
 
     if len(revs["data"]) != len(revision_phids):
@@ -140,7 +150,7 @@ def get_diffs_by_revision_phid(
     Returns a PHID-keyed dict of diff data with the `commits` attachment.
     Raises `ValueError` if fewer diffs than revisions are returned.
     """
-    diffs = phab.call_conduit_collated(
+    diffs = phab.cached_search(
         "differential.diff.search",
         constraints={"revisionPHIDs": revision_phids},
         attachments={"commits": True},
@@ -162,7 +172,7 @@ def get_diffs_by_phid(
     if not diff_phids:
         return {}
 
-    diffs = phab.call_conduit_collated(
+    diffs = phab.cached_search(
         "differential.diff.search",
         constraints={"phids": diff_phids},
         attachments={"commits": True},
@@ -8,7 +8,6 @@ from dataclasses import dataclass
 from typing import Any, Callable, Self
 
 import networkx as nx
-import rs_parsepatch
 from django.conf import settings
 from django.contrib.auth.models import User
 from django.core.cache import cache
@@ -54,10 +53,12 @@ from lando.utils.landing_checks import (
     PreventSymlinksCheck,
     TryTaskConfigCheck,
 )
+from lando.utils.parsed_diffs import get_parsed_diff, hash_diff
 from lando.utils.phabricator import (
     PhabricatorClient,
     PhabricatorRevisionStatus,
     ReviewerStatus,
+    call_concurrently,
 )
 
 logger = logging.getLogger(__name__)
@@ -127,6 +128,7 @@ class StackAssessmentState:
     stack_data: RevisionData
     stack: RevisionStack
     parsed_diffs: dict[int, list[dict]]
+    diff_hashes: dict[int, str]
     landable_stack: RevisionStack
     statuses: dict[str, PhabricatorRevisionStatus]
     landable_repos: dict[str, Repo]
@@ -150,6 +152,7 @@ class StackAssessmentState:
         stack_data: RevisionData,
         stack: RevisionStack,
         parsed_diffs: dict[int, dict],
+        diff_hashes: dict[int, str],
         landable_repos: dict[str, Repo],
         supported_repos: dict[str, Repo],
         reviewers: dict,
@@ -186,6 +189,7 @@ class StackAssessmentState:
             stack=stack,
             statuses=statuses,
             parsed_diffs=parsed_diffs,
+            diff_hashes=diff_hashes,
             landable_stack=landable_stack,
             landable_repos=landable_repos,
             supported_repos=supported_repos,
@@ -854,7 +858,11 @@ def blocker_prevent_nsprnss_files(
 
     # `PreventNSPRNSSCheck` only requires inspecting the diff and the commit message.
     title = PhabricatorClient.expect(revision, "fields", "title")
-    diff_assessor = DiffAssessor(parsed_diff=parsed_diff, commit_message=title)
+    diff_assessor = DiffAssessor(
+        parsed_diff=parsed_diff,
+        commit_message=title,
+        diff_hash=stack_state.diff_hashes.get(diff_id),
+    )
 
     if issues := diff_assessor.run_diff_checks([PreventNSPRNSSCheck]):
         return issues[0]
@@ -868,7 +876,9 @@ def blocker_prevent_submodules(
     parsed_diff = stack_state.parsed_diffs[diff_id]
 
     # `PreventSubmodulesCheck` only requires inspecting the diff.
-    diff_assessor = DiffAssessor(parsed_diff=parsed_diff)
+    diff_assessor = DiffAssessor(
+        parsed_diff=parsed_diff, diff_hash=stack_state.diff_hashes.get(diff_id)
+    )
 
     if issues := diff_assessor.run_diff_checks([PreventSubmodulesCheck]):
         return issues[0]
@@ -881,7 +891,9 @@ def blocker_prevent_symlinks(
     diff_id = PhabricatorClient.expect(diff, "id")
     parsed_diff = stack_state.parsed_diffs[diff_id]
 
-    diff_assessor = DiffAssessor(parsed_diff=parsed_diff)
+    diff_assessor = DiffAssessor(
+        parsed_diff=parsed_diff, diff_hash=stack_state.diff_hashes.get(diff_id)
+    )
 
     if issues := diff_assessor.run_diff_checks([PreventSymlinksCheck]):
         return issues[0]
@@ -895,7 +907,9 @@ def blocker_try_task_config(
     parsed_diff = stack_state.parsed_diffs[diff_id]
 
     # `TryTaskConfigCheck` only requires inspecting the diff.
-    diff_assessor = DiffAssessor(parsed_diff=parsed_diff)
+    diff_assessor = DiffAssessor(
+        parsed_diff=parsed_diff, diff_hash=stack_state.diff_hashes.get(diff_id)
+    )
 
     if issues := diff_assessor.run_diff_checks([TryTaskConfigCheck]):
         return issues[0]
@@ -1034,26 +1048,17 @@ def get_raw_diff_by_id(phab: PhabricatorClient, diff_id: int) -> str:
     return raw_diff
 
 
-def get_parsed_diffs(
-    phab: PhabricatorClient, stack_data: RevisionData
-) -> dict[int, dict]:
-    """Return a mapping of diff PHID to `rs-parsepatch` parsed `diff --git` content."""
-    raw_diffs = {}
-
-    # Get the latest diffs for each revision.
-    latest_diffs = [
-        stack_data.diffs[phab.expect(revision, "fields", "diffPHID")]
+def get_latest_diff_ids(phab: PhabricatorClient, stack_data: RevisionData) -> list[int]:
+    """Return the IDs of the latest diff of each revision in the stack."""
+    return [
+        phab.expect(stack_data.diffs[phab.expect(revision, "fields", "diffPHID")], "id")
         for revision in stack_data.revisions.values()
     ]
 
-    for diff in latest_diffs:
-        diff_id = phab.expect(diff, "id")
 
-        raw_diffs[diff_id] = get_raw_diff_by_id(phab, diff_id)
-
-    return {
-        diff_id: rs_parsepatch.get_diffs(diff) for diff_id, diff in raw_diffs.items()
-    }
+def get_parsed_diffs(raw_diffs: dict[int, str]) -> dict[int, list[dict]]:
+    """Return a mapping of diff ID to `rs-parsepatch` parsed `diff --git` content."""
+    return {diff_id: get_parsed_diff(diff) for diff_id, diff in raw_diffs.items()}
 
 
 def build_stack_assessment_state(
@@ -1068,9 +1073,6 @@ def build_stack_assessment_state(
     """Given the required state information for a stack, build a `StackAssessmentState`"""
     landable_repos = get_landable_repos_for_revision_data(stack_data, supported_repos)
 
-    # Retrieve and parse diffs from Phabricator.
-    parsed_diffs = get_parsed_diffs(phab, stack_data)
-
     involved_phids = set()
     reviewers = {}
     for revision in stack_data.revisions.values():
@@ -1078,21 +1080,42 @@ def build_stack_assessment_state(
         involved_phids.update(gather_involved_phids(revision, revision_diffs))
         reviewers[revision["phid"]] = get_collated_reviewers(revision)
 
-    # Get more Phabricator data.
-    involved_phids = list(involved_phids)
+    involved_phids = sorted(involved_phids)
 
-    users = user_search(phab, involved_phids)
-    projects = project_search(phab, involved_phids)
+    # Get the raw diffs and more Phabricator data. None of these calls depend
+    # on each other, so they are made concurrently.
+    diff_ids = get_latest_diff_ids(phab, stack_data)
+    results = call_concurrently(
+        {
+            **{
+                ("raw_diff", diff_id): functools.partial(
+                    get_raw_diff_by_id, phab, diff_id
+                )
+                for diff_id in diff_ids
+            },
+            "users": lambda: user_search(phab, involved_phids),
+            "projects": lambda: project_search(phab, involved_phids),
+            "secure_project_phid": lambda: get_secure_project_phid(phab),
+            "testing_tag_project_phids": lambda: get_testing_tag_project_phids(phab),
+            "testing_policy_phid": lambda: get_testing_policy_phid(phab),
+        }
+    )
+    raw_diffs = {diff_id: results["raw_diff", diff_id] for diff_id in diff_ids}
+    users = results["users"]
+    projects = results["projects"]
+    secure_project_phid = results["secure_project_phid"]
+    testing_tag_project_phids = results["testing_tag_project_phids"]
+    testing_policy_phid = results["testing_policy_phid"]
 
-    secure_project_phid = get_secure_project_phid(phab)
-    testing_tag_project_phids = get_testing_tag_project_phids(phab)
-    testing_policy_phid = get_testing_policy_phid(phab)
+    parsed_diffs = get_parsed_diffs(raw_diffs)
+    diff_hashes = {diff_id: hash_diff(diff) for diff_id, diff in raw_diffs.items()}
 
     stack_state = StackAssessmentState.from_assessment(
         phab=phab,
         stack_data=stack_data,
         stack=stack,
         parsed_diffs=parsed_diffs,
+        diff_hashes=diff_hashes,
         landable_repos=landable_repos,
         supported_repos=supported_repos,
         reviewers=reviewers,
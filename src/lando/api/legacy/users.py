@@ -13,5 +13,5 @@ def user_search(
     if not user_phids:
         return {}
 
-    users = phabricator.call_conduit("user.search", constraints={"phids": user_phids})
+    users = phabricator.cached_search("user.search", constraints={"phids": user_phids})
     return result_list_to_phid_dict(phabricator.expect(users, "data"))
@@ -1,5 +1,6 @@
 import logging
 
+from django.conf import settings
 from typing_extensions import override
 
 from lando.api.legacy.workers.base import Worker
@@ -102,7 +103,11 @@ class AutomationWorker(Worker):
 
             if not self.skip_checks(job, new_commits) and repo.hooks_enabled:
                 patch_helpers = repo.scm.get_patch_helpers_for_commits(new_commits)
-                landing_checks = LandingChecks(job.requester_email, repo.name)
+                landing_checks = LandingChecks(
+                    job.requester_email,
+                    repo.name,
+                    processes=settings.LANDING_CHECKS_PROCESSES,
+                )
                 try:
                     check_errors = landing_checks.run(repo.hooks, patch_helpers)
                 except Exception as exc:
@@ -6,6 +6,7 @@ from dataclasses import dataclass
 from pathlib import Path
 
 import sentry_sdk
+from django.conf import settings
 from typing_extensions import override
 
 from lando.api.legacy.commit_message import bug_list_to_commit_string, parse_bugs
@@ -311,7 +312,11 @@ class LandingWorker(Worker):
 
         if repo.hooks_enabled:
             patch_helpers = repo.scm.get_patch_helpers_for_commits(new_commits)
-            landing_checks = LandingChecks(job.requester_email, repo.name)
+            landing_checks = LandingChecks(
+                job.requester_email,
+                repo.name,
+                processes=settings.LANDING_CHECKS_PROCESSES,
+            )
             try:
                 check_errors = landing_checks.run(repo.hooks, patch_helpers)
             except Exception as exc:
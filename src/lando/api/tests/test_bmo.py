@@ -1,7 +1,10 @@
+import pytest
 import requests_mock
 from django.conf import settings
+from django.core.cache import cache
+from django.test import override_settings
 
-from lando.api.legacy.bmo import api_request
+from lando.api.legacy.bmo import BugVisibility, api_request, get_bug_visibility
 
 
 def test_api_request_sends_configured_user_agent():
@@ -13,3 +16,41 @@ def test_api_request_sends_configured_user_agent():
         assert response.request.headers["User-Agent"] == settings.HTTP_USER_AGENT, (
             "`api_request` should send the `HTTP_USER_AGENT` from settings."
         )
+
+
+# Enable the local memory cache since we use the dummy cache in tests.
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "test-bmo-bug-visibility",
+        }
+    }
+)
+@pytest.mark.django_db
+def test_get_bug_visibility_is_cached():
+    cache.clear()
+
+    with requests_mock.mock() as mocker:
+        search = mocker.get(
+            f"{settings.BUGZILLA_URL}/rest/bug", json={"bugs": [{"id": 1}]}
+        )
+        mocker.get(f"{settings.BUGZILLA_URL}/rest/bug/2", status_code=401)
+        mocker.get(f"{settings.BUGZILLA_URL}/rest/bug/3", status_code=404)
+        mocker.get(f"{settings.BUGZILLA_URL}/rest/bug/4", status_code=500)
+
+        expected = {
+            1: BugVisibility.PUBLIC,
+            2: BugVisibility.PRIVATE,
+            3: BugVisibility.NONEXISTENT,
+            4: BugVisibility.UNKNOWN,
+        }
+        assert get_bug_visibility({1, 2, 3, 4}) == expected
+        assert search.last_request.qs["id"] == ["1,2,3,4"]
+        request_count = mocker.call_count
+
+        assert get_bug_visibility({1, 2, 3, 4}) == expected
+        assert mocker.call_count - request_count == 2, (
+            "Only the bug of unknown visibility should be looked up again."
+        )
+        assert search.last_request.qs["id"] == ["4"]
@@ -789,10 +789,10 @@ def test_uplift_worker_applies_patches_and_creates_uplift_revision_success_git(
         mock_status_code.return_value = 200
 
     monkeypatch.setattr(
-        "lando.utils.landing_checks.get_status_code_for_bug",
+        "lando.api.legacy.bmo.get_status_code_for_bug",
         mock_status_code,
     )
-    monkeypatch.setattr("lando.utils.landing_checks.search_bugs", mock_bug_search)
+    monkeypatch.setattr("lando.api.legacy.bmo.search_bugs", mock_bug_search)
     # Let update_repo/apply_patch run for real and only mock moz-phab uplift to return new tip D-IDs.
     monkeypatch.setattr(
         uplift_worker,
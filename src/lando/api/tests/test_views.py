@@ -4,9 +4,11 @@ import json
 from unittest import mock
 
 import pytest
-from django.test import Client
+from django.conf import settings
+from django.core.cache import caches
+from django.test import Client, override_settings
 
-from lando.main.models import Repo, SCMType
+from lando.main.models import CommitMap, Repo, SCMType
 
 
 @pytest.fixture
@@ -52,8 +54,10 @@ def test__views__hg2gitCommitMapView_unknown_commit(commit_maps, client, monkeyp
     response = client.get(f"/api/hg2git/git_repo/{'1' * 40}")
     assert response.status_code == 404
     assert response.json().get("error") == "No commits found"
-    assert mock_catch_up.call_count == 1
-    assert mock_catch_up.call_args[0] == ("git_repo",)
+    assert response.json().get("pending") is False
+    assert mock_catch_up.call_count == 0, (
+        "Lookups should not query the pushlog, which is synced in the background."
+    )
 
 
 @pytest.mark.django_db(transaction=True)
@@ -63,8 +67,37 @@ def test__views__git2hgCommitMapView_unknown_commit(commit_maps, client, monkeyp
     response = client.get(f"/api/git2hg/git_repo/{'1' * 40}")
     assert response.status_code == 404
     assert response.json().get("error") == "No commits found"
-    assert mock_catch_up.call_count == 1
-    assert mock_catch_up.call_args[0] == ("git_repo",)
+    assert response.json().get("pending") is False
+    assert mock_catch_up.call_count == 0, (
+        "Lookups should not query the pushlog, which is synced in the background."
+    )
+
+
+# Enable the local memory cache since we use the dummy cache in tests.
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.dummy.DummyCache",
+        },
+        "db": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "test-commit-map-pending",
+        },
+    }
+)
+@pytest.mark.django_db(transaction=True)
+def test__views__git2hgCommitMapView_pending_commit(commit_maps, client, monkeypatch):
+    caches["db"].clear()
+    monkeypatch.setattr("lando.api.views.CommitMap.catch_up", mock.MagicMock())
+    CommitMap.sync("git_repo", timeout=60)
+
+    response = client.get(f"/api/git2hg/git_repo/{'1' * 40}")
+
+    assert response.status_code == 404
+    assert response.json().get("pending") is True, (
+        "Unknown commits should be reported as pending while the repo is synced."
+    )
+    assert response["Retry-After"] == str(settings.COMMIT_MAP_SYNC_INTERVAL)
 
 
 @pytest.mark.django_db(transaction=True)
@@ -86,6 +119,66 @@ def test__views__git2hgCommitMapView_short_hash(commit_maps, client, monkeypatch
     assert response.json() == commit_map.serialize()
 
 
+@pytest.mark.django_db(transaction=True)
+def test__views__git2hgBulkCommitMapView(
+    commit_maps, client, django_assert_num_queries
+):
+    hashes = [commit_maps[2].git_hash, "eeeeeee", "aaaaaaa", "1" * 40]
+
+    with django_assert_num_queries(1):
+        response = client.post(
+            "/api/git2hg/git_repo",
+            data={"hashes": hashes},
+            content_type="application/json",
+        )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "mappings": {
+            commit_maps[2].git_hash: commit_maps[2].serialize(),
+            "eeeeeee": commit_maps[3].serialize(),
+        },
+        "missing": ["1" * 40],
+        "ambiguous": ["aaaaaaa"],
+    }, "All hashes should be mapped in a single query."
+
+
+@pytest.mark.django_db(transaction=True)
+def test__views__hg2gitBulkCommitMapView(commit_maps, client):
+    response = client.post(
+        "/api/hg2git/git_repo",
+        data={"hashes": [commit_map.hg_hash for commit_map in commit_maps]},
+        content_type="application/json",
+    )
+
+    assert response.status_code == 200
+    assert response.json()["mappings"] == {
+        commit_map.hg_hash: commit_map.serialize() for commit_map in commit_maps
+    }
+    assert response.json()["missing"] == []
+    assert response.json()["ambiguous"] == []
+
+
+@pytest.mark.parametrize(
+    "body",
+    (
+        {"hashes": "aaaaaaa"},
+        {"hashes": ["aaa"]},
+        {"hashes": ["not-a-hash"]},
+        {"hashes": ["a" * 40] * 1001},
+        {},
+    ),
+)
+@pytest.mark.django_db
+def test__views__git2hgBulkCommitMapView_invalid(client, body):
+    response = client.post(
+        "/api/git2hg/git_repo", data=body, content_type="application/json"
+    )
+
+    assert response.status_code == 400
+    assert "hashes" in response.json()["errors"]
+
+
 @pytest.mark.django_db(transaction=True)
 def test__views__phabricator_auth_backend(
     phabdouble, client, user, user_phab_api_key, user_linked_to_phab, monkeypatch
@@ -1,5 +1,6 @@
 import json
 import logging
+import re
 from collections import defaultdict
 from datetime import datetime
 from functools import wraps
@@ -52,6 +53,8 @@ from lando.utils.phabricator import PHABRICATOR_API_KEY_HEADER, get_phabricator_
 
 logger = logging.getLogger(__name__)
 
+COMMIT_HASH_RE = re.compile(r"[0-9a-f]{7,40}")
+
 
 class APIView(View):
     """A base class for API views."""
@@ -86,6 +89,8 @@ def generate_warnings_and_blockers(
     do_escape: bool = True,
 ) -> dict[str, list[str]]:
     """Run checks on a pull request and return blockers and warnings."""
+    pull_request.prefetch_check_data()
+
     # PullRequestPatchHelper.diff doesn't include binary changes.
     # This is not considered an issue for checks at the moment, but may need to be kept in
     # mind for the future.
@@ -96,7 +101,12 @@ def generate_warnings_and_blockers(
         target_repo.hooks,
         [patch_helper],
     )
-    pr_checks = PullRequestChecks(pull_request.client, target_repo, request)
+    pr_checks = PullRequestChecks(
+        pull_request.client,
+        target_repo,
+        request,
+        max_workers=settings.GITHUB_CHECKS_CONCURRENCY,
+    )
     pr_blockers = [chk.name() for chk in ALL_PULL_REQUEST_BLOCKERS]
     blockers += pr_checks.run(pr_blockers, pull_request)
     pr_warnings = [chk.name() for chk in ALL_PULL_REQUEST_WARNINGS]
@@ -195,9 +205,19 @@ class CommitMapBaseView(View):
             commit = CommitMap.map_hash_from(self.scm, git_repo_name, commit_hash)
         except CommitMap.DoesNotExist as exc:
             error_detail = f"No commit found in {self.scm} for {commit_hash} in {git_repo_name}: {exc}"
-            return JsonResponse(
-                {"error": "No commits found", "detail": error_detail}, status=404
+            # While the repo is being synced, the commit may just not be mapped yet.
+            pending = CommitMap.last_synced_at(git_repo_name) is not None
+            response = JsonResponse(
+                {
+                    "error": "No commits found",
+                    "detail": error_detail,
+                    "pending": pending,
+                },
+                status=404,
             )
+            if pending:
+                response["Retry-After"] = str(settings.COMMIT_MAP_SYNC_INTERVAL)
+            return response
         except CommitMap.MultipleObjectsReturned as exc:
             error_detail = f"Multiple commits found in {self.scm} for {commit_hash} in {git_repo_name}: {exc}"
             return JsonResponse(
@@ -221,6 +241,84 @@ class hg2gitCommitMapView(CommitMapBaseView):
     scm = SCMType.HG
 
 
+# Maximum number of hashes which can be mapped in a single bulk request.
+COMMIT_MAP_BULK_MAX_HASHES = 1000
+
+
+class CommitMapBulkBaseView(View):
+    """Map a list of commits in bulk, for bidirectional git - hg mapping.
+
+    Expects a JSON body with a `hashes` list, and returns the mapping of each
+    hash that could be resolved, along with lists of `missing` and `ambiguous`
+    hashes.
+    """
+
+    scm: str
+
+    def post(self, request: WSGIRequest, git_repo_name: str) -> JsonResponse:
+        class Form(forms.Form):
+            def hashes_validator(hashes):
+                if not isinstance(hashes, list) or not all(
+                    isinstance(commit_hash, str)
+                    and COMMIT_HASH_RE.fullmatch(commit_hash)
+                    for commit_hash in hashes
+                ):
+                    raise forms.ValidationError(
+                        "`hashes` should be a list of hexadecimal commit hashes "
+                        "of at least 7 characters"
+                    )
+                if len(hashes) > COMMIT_MAP_BULK_MAX_HASHES:
+                    raise forms.ValidationError(
+                        f"At most {COMMIT_MAP_BULK_MAX_HASHES} hashes can be "
+                        "mapped at once"
+                    )
+
+            hashes = forms.JSONField(validators=[hashes_validator])
+
+        try:
+            form = Form(json.loads(request.body))
+        except JSONDecodeError as exc:
+            return JsonResponse({"errors": {"__all__": [str(exc)]}}, status=400)
+
+        if not form.is_valid():
+            return JsonResponse({"errors": dict(form.errors)}, status=400)
+
+        matches = CommitMap.map_hashes_from(
+            self.scm, git_repo_name, form.cleaned_data["hashes"]
+        )
+
+        mappings = {}
+        missing = []
+        ambiguous = []
+        for commit_hash in form.cleaned_data["hashes"]:
+            commit_maps = matches[commit_hash]
+            if len(commit_maps) == 1:
+                mappings[commit_hash] = commit_maps[0].serialize()
+            elif commit_maps:
+                ambiguous.append(commit_hash)
+            else:
+                missing.append(commit_hash)
+
+        return JsonResponse(
+            {"mappings": mappings, "missing": missing, "ambiguous": ambiguous},
+            status=200,
+        )
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class git2hgBulkCommitMapView(CommitMapBulkBaseView):
+    """Return corresponding CommitMaps given a list of git hashes."""
+
+    scm = SCMType.GIT
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class hg2gitBulkCommitMapView(CommitMapBulkBaseView):
+    """Return corresponding CommitMaps given a list of hg hashes."""
+
+    scm = SCMType.HG
+
+
 class PullRequestAPIView(View, PrivateRepoPermissionMixin):
     """Set various common attributes for views that extend this one."""
 
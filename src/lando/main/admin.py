@@ -312,6 +312,11 @@ class RevisionAdmin(admin.ModelAdmin):
         "created_at",
         "updated_at",
     )
+    # Patch blobs can be large; don't load them to render a select widget.
+    exclude = (
+        "patch_blob",
+        "patches_blob",
+    )
     search_fields = ("revision_id",)
 
     def view_on_site(self, instance: Revision) -> str | None:
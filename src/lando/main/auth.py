@@ -1,4 +1,6 @@
 import functools
+import hashlib
+import hmac
 import logging
 from typing import (
     Callable,
@@ -7,6 +9,7 @@ from typing import (
 from django.conf import settings
 from django.contrib.auth.backends import BaseBackend
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.core.exceptions import PermissionDenied, SuspiciousOperation
 from django.core.handlers.wsgi import WSGIRequest
 from django.http import Http404, HttpResponse
@@ -17,7 +20,7 @@ from mozilla_django_oidc.auth import OIDCAuthenticationBackend
 from lando.environments import Environment
 from lando.main.models.profile import Profile, filter_claims
 from lando.utils.github import GitHubAPIClient, verify_github_signature
-from lando.utils.phabricator import PhabricatorClient
+from lando.utils.phabricator import MemoizedPhabricatorClient, PhabricatorClient
 
 logger = logging.getLogger(__name__)
 
@@ -36,18 +39,46 @@ def user_is_conduit_admin(user: User) -> bool:
     )
 
 
+def phabricator_token_cache_key(phabricator_token: str) -> str:
+    """Return the cache key for the verified identity of a Phabricator token.
+
+    The key is an HMAC of the token, so tokens are never stored in the cache.
+    """
+    digest = hmac.new(
+        settings.SECRET_KEY.encode("utf-8"),
+        phabricator_token.encode("utf-8"),
+        hashlib.sha256,
+    ).hexdigest()
+    return f"phabricator_token_{digest}"
+
+
+def forget_phabricator_token(phabricator_token: str | None):
+    """Remove the cached verified identity of a Phabricator token."""
+    if phabricator_token:
+        cache.delete(phabricator_token_cache_key(phabricator_token))
+
+
 class PhabricatorTokenAuthenticationBackend(BaseBackend):
     """Authenticate a user based on their Phabricator PHID and token."""
 
     @staticmethod
     def get_phab_user(phabricator_token: str) -> dict | None:
-        """Verify a Phabricator token and return the `user.whoami` data."""
-        phab = PhabricatorClient(settings.PHABRICATOR_URL, phabricator_token)
+        """Verify a Phabricator token and return the `user.whoami` data.
 
-        if not phab.verify_api_token():
+        Verified identities are cached for `PHABRICATOR_TOKEN_CACHE_TIMEOUT`
+        seconds. Invalid tokens are not cached.
+        """
+        cache_key = phabricator_token_cache_key(phabricator_token)
+        if phab_user := cache.get(cache_key):
+            return phab_user
+
+        phab = PhabricatorClient(settings.PHABRICATOR_URL, phabricator_token)
+        phab_user = phab.verify_api_token()
+        if not phab_user:
             return None
 
-        return phab.call_conduit("user.whoami")
+        cache.set(cache_key, phab_user, settings.PHABRICATOR_TOKEN_CACHE_TIMEOUT)
+        return phab_user
 
     @staticmethod
     def get_user_by_phid(token_phid: str) -> User | None:
@@ -306,7 +337,8 @@ class require_phabricator_api_key:
     will be used. If an API key is provided it will still be verified.
 
     If `provide_client=True`, the first argument is a PhabricatorClient using
-    this API Key.
+    this API Key. The client memoizes read-only Conduit calls for the duration
+    of the request, and the number of calls made is logged.
     """
 
     def __init__(self, optional: bool = False, provide_client: bool = True):
@@ -329,18 +361,28 @@ class require_phabricator_api_key:
             if api_key is None and not self.optional:
                 return HttpResponse("Phabricator API key is required", status=401)
 
-            phab = PhabricatorClient(
+            phab = MemoizedPhabricatorClient(
                 settings.PHABRICATOR_URL,
                 api_key or settings.PHABRICATOR_UNPRIVILEGED_API_KEY,
             )
             if api_key is not None and not phab.verify_api_token():
                 return HttpResponse("Phabricator API key is invalid", status=403)
 
-            if self.provide_client:
-                return f(phab, request, *args, **kwargs)
-            else:
+            if not self.provide_client:
                 return f(request, *args, **kwargs)
 
+            try:
+                return f(phab, request, *args, **kwargs)
+            finally:
+                logger.info(
+                    "conduit calls for request",
+                    extra={
+                        "path": request.path,
+                        "conduit_requests": phab.conduit_requests,
+                        "conduit_memo_hits": phab.conduit_memo_hits,
+                    },
+                )
+
         return wrapped
 
 
@@ -0,0 +1,61 @@
+import argparse
+import logging
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from lando.main.models import CommitMap
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Keep CommitMaps up to date with the HgMO pushlog."
+    name = "sync_commit_maps"
+
+    def add_arguments(self, parser: argparse.ArgumentParser):
+        parser.add_argument(
+            "--repo",
+            "-r",
+            action="append",
+            dest="repos",
+            help="Repository to sync (can be repeated). Defaults to all repositories in CommitMap.REPO_MAPPING.",
+        )
+        parser.add_argument(
+            "--interval",
+            "-i",
+            type=int,
+            default=settings.COMMIT_MAP_SYNC_INTERVAL,
+            help="Number of seconds to wait between syncs",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Sync once and exit, rather than looping",
+        )
+
+    def sync_repos(self, repos: list[str], interval: int):
+        """Catch up the CommitMaps of each of `repos`."""
+        for git_repo_name in repos:
+            try:
+                # The sync record outlives a couple of intervals, so lookups stop
+                # reporting unknown hashes as pending if this loop stops.
+                CommitMap.sync(git_repo_name, timeout=interval * 3)
+            except Exception as exc:
+                logger.exception(f"Could not sync CommitMap for {git_repo_name}: {exc}")
+
+    def handle(self, *args, **options):
+        interval = options["interval"]
+        repos = options["repos"] or [
+            git_repo_name for git_repo_name, _hg_repo_name in CommitMap.REPO_MAPPING
+        ]
+
+        while True:
+            logger.debug(f"Syncing CommitMaps for {', '.join(repos)}...")
+            self.sync_repos(repos, interval)
+
+            if options["once"]:
+                break
+
+            time.sleep(interval)
@@ -0,0 +1,118 @@
+# Generated by Django 6.0.6 on 2026-10-18 09:12
+
+import hashlib
+from compression import zstd
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# The helpers below are copies of those in `lando.main.models.patch_blob` at the time
+# of this migration, so later changes to the model don't change what it does.
+PATCH_BLOB_COMPRESSION_LEVEL = 10
+
+
+def hash_patch_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def compress_patch_text(text: str) -> bytes:
+    return zstd.compress(text.encode("utf-8"), level=PATCH_BLOB_COMPRESSION_LEVEL)
+
+
+def decompress_patch_text(data: bytes) -> str:
+    return zstd.decompress(bytes(data)).decode("utf-8")
+
+
+def move_patches_to_blobs(apps, schema_editor):  # noqa: ANN001
+    """Store existing `Revision` patch text in deduplicated `PatchBlob` rows."""
+    PatchBlob = apps.get_model("main", "PatchBlob")
+    Revision = apps.get_model("main", "Revision")
+
+    blob_ids = {}
+
+    def blob_id_for_text(text: str) -> int | None:
+        if not text:
+            return None
+        sha256 = hash_patch_text(text)
+        if sha256 not in blob_ids:
+            blob, _created = PatchBlob.objects.get_or_create(
+                sha256=sha256,
+                defaults={
+                    "size": len(text.encode("utf-8")),
+                    "data": compress_patch_text(text),
+                },
+            )
+            blob_ids[sha256] = blob.id
+        return blob_ids[sha256]
+
+    revisions = Revision.objects.only("id", "patch", "patches").order_by("id")
+    for revision in revisions.iterator(chunk_size=500):
+        Revision.objects.filter(id=revision.id).update(
+            patch_blob_id=blob_id_for_text(revision.patch),
+            patches_blob_id=blob_id_for_text(revision.patches),
+        )
+
+
+def move_blobs_to_patches(apps, schema_editor):  # noqa: ANN001
+    """Copy `PatchBlob` content back into the `Revision` text fields."""
+    Revision = apps.get_model("main", "Revision")
+
+    revisions = Revision.objects.select_related("patch_blob", "patches_blob").order_by(
+        "id"
+    )
+    for revision in revisions.iterator(chunk_size=500):
+        Revision.objects.filter(id=revision.id).update(
+            patch=(
+                decompress_patch_text(revision.patch_blob.data)
+                if revision.patch_blob
+                else ""
+            ),
+            patches=(
+                decompress_patch_text(revision.patches_blob.data)
+                if revision.patches_blob
+                else ""
+            ),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0064_alter_repo_force_push'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PatchBlob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('sha256', models.CharField(max_length=64, unique=True)),
+                ('size', models.PositiveBigIntegerField()),
+                ('data', models.BinaryField()),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.AddField(
+            model_name='revision',
+            name='patch_blob',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='main.patchblob'),
+        ),
+        migrations.AddField(
+            model_name='revision',
+            name='patches_blob',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='main.patchblob'),
+        ),
+        migrations.RunPython(move_patches_to_blobs, move_blobs_to_patches),
+        migrations.RemoveField(
+            model_name='revision',
+            name='patch',
+        ),
+        migrations.RemoveField(
+            model_name='revision',
+            name='patches',
+        ),
+    ]
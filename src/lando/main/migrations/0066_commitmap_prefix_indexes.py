@@ -0,0 +1,24 @@
+# Generated by Django 6.0.6 on 2026-10-18 14:05
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Build the indexes without locking writes to the (large) CommitMap table.
+    atomic = False
+
+    dependencies = [
+        ('main', '0065_patchblob_revision_patch_blob_and_more'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='commitmap',
+            index=models.Index(fields=['git_repo_name', 'git_hash'], name='main_commitmap_git_prefix_idx', opclasses=['varchar_pattern_ops', 'varchar_pattern_ops']),
+        ),
+        AddIndexConcurrently(
+            model_name='commitmap',
+            index=models.Index(fields=['git_repo_name', 'hg_hash'], name='main_commitmap_hg_prefix_idx', opclasses=['varchar_pattern_ops', 'varchar_pattern_ops']),
+        ),
+    ]
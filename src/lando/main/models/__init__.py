@@ -3,6 +3,7 @@ from lando.main.models.base import *
 from lando.main.models.configuration import *
 from lando.main.models.jobs import *
 from lando.main.models.landing_job import *
+from lando.main.models.patch_blob import *
 from lando.main.models.profile import *
 from lando.main.models.revision import *
 from lando.main.models.repo import *
@@ -1,15 +1,36 @@
+import copy
 import logging
+from collections.abc import Iterable
+from datetime import datetime
 from typing import Any, Self
 
 import requests
 import sentry_sdk
+from django.conf import settings
+from django.core.cache import caches
 from django.db import IntegrityError, models
+from django.db.models import Q
+from django.utils import timezone
 
 from lando.main.models.base import BaseModel
 from lando.main.scm.consts import SCMType
+from lando.utils.cache import LRUCache
 
 logger = logging.getLogger(__name__)
 
+# The sync command records when it last synced each repo in the shared database
+# cache, so that web processes see it, unlike with the per-process default cache.
+COMMIT_MAP_SYNC_CACHE = "db"
+
+# Length of a full Git or Mercurial hash.
+FULL_HASH_LENGTH = 40
+
+# Mappings between full hashes never change, so recent lookups are kept in
+# memory, keyed by (source SCM, git repo name, source hash).
+commit_map_lookups: LRUCache[tuple[str, str, str], "CommitMap"] = LRUCache(
+    settings.COMMIT_MAP_LRU_SIZE
+)
+
 
 class CommitMap(BaseModel):
     """Map a git hash to an hg hash, based on a specific repo."""
@@ -31,6 +52,9 @@ class CommitMap(BaseModel):
         "try-comm-central": "thunderbird-desktop",
     }
 
+    # Maximum number of objects created per query when catching up.
+    BULK_CREATE_BATCH_SIZE = 1000
+
     git_hash = models.CharField(default="", max_length=40, db_index=True)
     hg_hash = models.CharField(default="", max_length=40, db_index=True)
 
@@ -44,6 +68,20 @@ class CommitMap(BaseModel):
             ("git_repo_name", "git_hash"),
             ("git_repo_name", "hg_hash"),
         )
+        indexes = [
+            # Serve prefix (`LIKE 'abc%'`) lookups of short hashes, which the
+            # default operator class doesn't under non-C collations.
+            models.Index(
+                fields=["git_repo_name", "git_hash"],
+                name="main_commitmap_git_prefix_idx",
+                opclasses=["varchar_pattern_ops", "varchar_pattern_ops"],
+            ),
+            models.Index(
+                fields=["git_repo_name", "hg_hash"],
+                name="main_commitmap_hg_prefix_idx",
+                opclasses=["varchar_pattern_ops", "varchar_pattern_ops"],
+            ),
+        ]
 
     @classmethod
     def get_hg_repo_name(cls, git_repo_name: str) -> str:
@@ -63,7 +101,10 @@ class CommitMap(BaseModel):
     @classmethod
     def _find_last_node(cls, git_repo_name: str) -> "CommitMap":
         """Return last CommitMap object that was stored for given repo."""
-        return cls.objects.filter(git_repo_name=git_repo_name).latest("created_at")
+        # Objects created in bulk may share a creation time, so break ties by ID.
+        return cls.objects.filter(git_repo_name=git_repo_name).latest(
+            "created_at", "id"
+        )
 
     @classmethod
     def find_last_hg_node(cls, git_repo_name: str) -> str:
@@ -88,17 +129,79 @@ class CommitMap(BaseModel):
     ) -> Self:
         """Return destination hash for the given repo and source (SCMType.*) hash.
 
+        This only reads the database, which is kept up to date by the
+        `sync_commit_maps` command, so a hash may not be mapped yet. Lookups of
+        full hashes are cached in `commit_map_lookups`.
+
         This method can raise CommitMap.DoesNotExist.
         """
-        hash_field = f"{src_scm}_hash__startswith"
+        full_hash = len(src_commit_hash) == FULL_HASH_LENGTH
+        lookup_key = (src_scm, git_repo_name, src_commit_hash)
+        if full_hash and (commit_map := commit_map_lookups.get(lookup_key)):
+            return copy.copy(commit_map)
+
+        if full_hash:
+            filters = {f"{src_scm}_hash": src_commit_hash}
+        else:
+            filters = {f"{src_scm}_hash__startswith": src_commit_hash}
+        commit_map = CommitMap.objects.get(git_repo_name=git_repo_name, **filters)
 
-        filters = {hash_field: src_commit_hash, "git_repo_name": git_repo_name}
-        commit_query = CommitMap.objects.filter(**filters)
+        if full_hash:
+            commit_map_lookups.set(lookup_key, copy.copy(commit_map))
 
-        if not commit_query.exists():
-            cls.catch_up(git_repo_name)
+        return commit_map
 
-        return commit_query.get()
+    @classmethod
+    def map_hashes_from(
+        cls, src_scm: str, git_repo_name: str, src_commit_hashes: Iterable[str]
+    ) -> dict[str, list[Self]]:
+        """Return the CommitMaps matching each of the given (SCMType.*) source hashes.
+
+        Hashes may be short, and may therefore match several CommitMaps. All
+        hashes are looked up in a single query, without waiting for them to be
+        synced.
+        """
+        hash_field = f"{src_scm}_hash"
+        hashes = set(src_commit_hashes)
+        matches = {src_commit_hash: [] for src_commit_hash in hashes}
+        if not hashes:
+            return matches
+
+        full_hashes = {h for h in hashes if len(h) == FULL_HASH_LENGTH}
+        query = Q(**{f"{hash_field}__in": full_hashes}) if full_hashes else Q()
+        for short_hash in sorted(hashes - full_hashes):
+            query |= Q(**{f"{hash_field}__startswith": short_hash})
+
+        lengths = {len(h) for h in hashes}
+        for commit_map in cls.objects.filter(query, git_repo_name=git_repo_name):
+            src_hash = getattr(commit_map, hash_field)
+            for length in lengths:
+                if src_hash[:length] in matches:
+                    matches[src_hash[:length]].append(commit_map)
+
+        return matches
+
+    @classmethod
+    def sync_cache_key(cls, git_repo_name: str) -> str:
+        """Return the cache key recording when the given repo was last synced."""
+        return f"commit_map_synced_at_{git_repo_name}"
+
+    @classmethod
+    def last_synced_at(cls, git_repo_name: str) -> datetime | None:
+        """Return when the given repo was last synced, if it is being synced."""
+        return caches[COMMIT_MAP_SYNC_CACHE].get(cls.sync_cache_key(git_repo_name))
+
+    @classmethod
+    def sync(cls, git_repo_name: str, timeout: int):
+        """Catch up the given repo, and record that it is being synced.
+
+        The record expires after `timeout` seconds, after which lookups of
+        unknown hashes are no longer reported as pending.
+        """
+        cls.catch_up(git_repo_name)
+        caches[COMMIT_MAP_SYNC_CACHE].set(
+            cls.sync_cache_key(git_repo_name), timezone.now(), timeout=timeout
+        )
 
     def serialize(self) -> dict[str, str]:
         """Return a simple dictionary containing the git and hg hashes."""
@@ -120,11 +223,63 @@ class CommitMap(BaseModel):
 
         cls.fetch_push_data(git_repo_name=git_repo_name, **params)
 
+    @classmethod
+    def _bulk_create_pairs(cls, git_repo_name: str, pairs: list[tuple[str, str]]):
+        """Create CommitMap objects for (hg, git) `pairs` that don't exist yet.
+
+        Pairs which conflict with a different existing mapping are skipped and
+        reported to Sentry.
+        """
+        if not pairs:
+            return
+
+        cls.objects.bulk_create(
+            [
+                cls(hg_hash=hg_hash, git_hash=git_hash, git_repo_name=git_repo_name)
+                for hg_hash, git_hash in pairs
+            ],
+            ignore_conflicts=True,
+        )
+
+        stored = set(
+            cls.objects.filter(
+                git_repo_name=git_repo_name,
+                hg_hash__in=[hg_hash for hg_hash, _git_hash in pairs],
+            ).values_list("hg_hash", "git_hash")
+        )
+        for hg_hash, git_hash in pairs:
+            if (hg_hash, git_hash) in stored:
+                continue
+
+            params = {
+                "hg_hash": hg_hash,
+                "git_hash": git_hash,
+                "git_repo_name": git_repo_name,
+            }
+            # We don't want the whole exception in the logs, but it's worth
+            # capturing in Sentry.
+            sentry_sdk.capture_exception(
+                IntegrityError(
+                    f"CommitMap entry for {params} conflicts with an existing entry"
+                )
+            )
+            logger.warning(
+                f"Could not create complete CommitMap entry for {params}, skipping ..."
+            )
+
+    @classmethod
+    def _bulk_create_all_pairs(cls, git_repo_name: str, pairs: list[tuple[str, str]]):
+        """Create CommitMap objects for (hg, git) `pairs`, in batches."""
+        for start in range(0, len(pairs), cls.BULK_CREATE_BATCH_SIZE):
+            cls._bulk_create_pairs(
+                git_repo_name, pairs[start : start + cls.BULK_CREATE_BATCH_SIZE]
+            )
+
     @classmethod
     def fetch_push_data(cls, git_repo_name: str, **kwargs: dict[str, Any]):
         """Query the pushlog and create corresponding CommitMap objects."""
         url = cls.get_pushlog_url(git_repo_name)
-        response = requests.get(url, params=kwargs)
+        response = requests.get(url, params=kwargs, timeout=settings.HTTP_TIMEOUT)
         try:
             response.raise_for_status()
         except Exception as exc:
@@ -140,34 +295,25 @@ class CommitMap(BaseModel):
         # NOTE: multiple changesets may be included in the response.
 
         pushes = sorted(push_data.keys())
-        for push_id in pushes:
-            hg_changesets = push_data[push_id]["changesets"]
-            git_changesets = push_data[push_id]["git_changesets"]
-
-            if len(hg_changesets) != len(git_changesets):
-                raise ValueError(
-                    "Number of hg changesets does not match number of git changesets: "
-                    f"{len(hg_changesets)} vs {len(git_changesets)}"
-                )
-
-            for hg_changeset, git_changeset in zip(
-                hg_changesets, git_changesets, strict=True
-            ):
-                params = {
-                    "hg_hash": hg_changeset,
-                    "git_hash": git_changeset,
-                    "git_repo_name": git_repo_name,
-                }
-                if not cls.objects.filter(**params).exists():
-                    try:
-                        cls.objects.create(**params)
-                    except IntegrityError as exc:
-                        # We don't want the whole exception in the logs, but it's worth
-                        # capturing in Sentry.
-                        sentry_sdk.capture_exception(exc)
-                        logger.warning(
-                            f"Could not create complete CommitMap entry for {params}, skipping ..."
-                        )
+        pairs = []
+        try:
+            for push_id in pushes:
+                hg_changesets = push_data[push_id]["changesets"]
+                git_changesets = push_data[push_id]["git_changesets"]
+
+                if len(hg_changesets) != len(git_changesets):
+                    raise ValueError(
+                        "Number of hg changesets does not match number of git changesets: "
+                        f"{len(hg_changesets)} vs {len(git_changesets)}"
+                    )
+
+                pairs.extend(zip(hg_changesets, git_changesets, strict=True))
+        except ValueError:
+            # Store the pairs from the pushes preceding the invalid one.
+            cls._bulk_create_all_pairs(git_repo_name, pairs)
+            raise
+
+        cls._bulk_create_all_pairs(git_repo_name, pairs)
 
         logger.info(
             f"CommitMap for {git_repo_name} caught up {len(pushes)} pushes from {url} up to {push_data[pushes[-1]]}"
@@ -0,0 +1,79 @@
+"""
+This module provides content-addressed, compressed storage for patch text.
+
+The same diff is often stored several times (re-landings, uplifts, try pushes).
+`PatchBlob` stores each distinct patch once, compressed with zstd, keyed by the
+SHA-256 of its content. `Revision` references blobs rather than storing text.
+"""
+
+import hashlib
+from compression import zstd
+from functools import cached_property
+from typing import Self
+
+from django.db import IntegrityError, models, transaction
+
+from lando.main.models.base import BaseModel
+
+# Patches are written once and read rarely; favour ratio over speed.
+PATCH_BLOB_COMPRESSION_LEVEL = 10
+
+
+def hash_patch_text(text: str) -> str:
+    """Return the hex SHA-256 digest of the given patch text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def compress_patch_text(text: str) -> bytes:
+    """Return the zstd-compressed UTF-8 encoding of the given patch text."""
+    return zstd.compress(text.encode("utf-8"), level=PATCH_BLOB_COMPRESSION_LEVEL)
+
+
+def decompress_patch_text(data: bytes) -> str:
+    """Return the patch text stored in the given compressed bytes."""
+    return zstd.decompress(bytes(data)).decode("utf-8")
+
+
+class PatchBlob(BaseModel):
+    """A deduplicated, zstd-compressed patch, keyed by the hash of its content."""
+
+    # Hex SHA-256 of the uncompressed UTF-8 patch text.
+    sha256 = models.CharField(max_length=64, unique=True)
+
+    # Length of the uncompressed patch, in bytes.
+    size = models.PositiveBigIntegerField()
+
+    # zstd-compressed UTF-8 patch text.
+    data = models.BinaryField()
+
+    def __str__(self) -> str:
+        return f"PatchBlob {self.sha256[:12]} ({self.size} bytes)"
+
+    @cached_property
+    def text(self) -> str:
+        """Return the decompressed patch text."""
+        return decompress_patch_text(self.data)
+
+    @classmethod
+    def for_text(cls, text: str) -> Self:
+        """Return the blob storing `text`, creating it if it doesn't exist yet."""
+        sha256 = hash_patch_text(text)
+
+        if blob := cls.one_or_none(sha256=sha256):
+            return blob
+
+        blob = cls(
+            sha256=sha256,
+            size=len(text.encode("utf-8")),
+            data=compress_patch_text(text),
+        )
+        try:
+            with transaction.atomic():
+                blob.save()
+        except IntegrityError:
+            # Another process stored the same content concurrently.
+            return cls.objects.get(sha256=sha256)
+
+        # Avoid decompressing what we already have.
+        blob.text = text
+        return blob
@@ -15,6 +15,7 @@ from django.db import models
 from django.utils.translation import gettext_lazy
 
 from lando.main.models.base import BaseModel
+from lando.main.models.patch_blob import PatchBlob
 from lando.main.scm.exceptions import NoDiffStartLine
 from lando.main.scm.helpers import HgPatchHelper, build_patch_for_revision
 
@@ -62,11 +63,25 @@ class Revision(BaseModel):
 
     # The generated patch with Mercurial metadata format.
     # This patch is generated by combining a diff and patch metadata.
-    patch = models.TextField(blank=True, default="")
+    # Access the text via `Revision.patch`; the blob is only loaded when needed.
+    patch_blob = models.ForeignKey(
+        PatchBlob,
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
 
     # Raw patch data that could contain multiple patches.
     # These patches are fetched and stored directly (e.g., from GitHub).
-    patches = models.TextField(blank=True, default="")
+    # Access the text via `Revision.patches`; the blob is only loaded when needed.
+    patches_blob = models.ForeignKey(
+        PatchBlob,
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
 
     # Patch metadata, such as
     # - author_name
@@ -84,6 +99,10 @@ class Revision(BaseModel):
 
     _patch_helper: Optional[HgPatchHelper] = None
 
+    # Patch text set on the instance, but not yet stored in a `PatchBlob`.
+    _unsaved_patch: Optional[str] = None
+    _unsaved_patches: Optional[str] = None
+
     def __str__(self) -> str:
         if self.is_phabricator_revision:
             return f"D{self.revision_id} (diff {self.diff_id})"
@@ -117,6 +136,50 @@ class Revision(BaseModel):
         """Indicate if this revision is tied to Phabricator."""
         return self.revision_id is not None
 
+    @property
+    def patch(self) -> str:
+        """Return the generated patch with Mercurial metadata."""
+        if self._unsaved_patch is not None:
+            return self._unsaved_patch
+        if self.patch_blob_id is None:
+            return ""
+        return self.patch_blob.text
+
+    @patch.setter
+    def patch(self, value: str):
+        self._unsaved_patch = value or ""
+
+    @property
+    def patches(self) -> str:
+        """Return the raw patch data, possibly containing multiple patches."""
+        if self._unsaved_patches is not None:
+            return self._unsaved_patches
+        if self.patches_blob_id is None:
+            return ""
+        return self.patches_blob.text
+
+    @patches.setter
+    def patches(self, value: str):
+        self._unsaved_patches = value or ""
+
+    def save(self, *args, **kwargs):
+        """Store any pending patch text in deduplicated blobs before saving."""
+        if self._unsaved_patch is not None:
+            self.patch_blob = (
+                PatchBlob.for_text(self._unsaved_patch) if self._unsaved_patch else None
+            )
+            self._unsaved_patch = None
+
+        if self._unsaved_patches is not None:
+            self.patches_blob = (
+                PatchBlob.for_text(self._unsaved_patches)
+                if self._unsaved_patches
+                else None
+            )
+            self._unsaved_patches = None
+
+        super().save(*args, **kwargs)
+
     @property
     def patch_bytes(self) -> bytes:
         return self.patch.encode("utf-8")
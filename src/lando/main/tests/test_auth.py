@@ -1,7 +1,16 @@
 import pytest
 from django.contrib.auth.models import AnonymousUser, Group, User
+from django.core.cache import cache
+from django.test import override_settings
 
-from lando.main.auth import CONDUIT_ADMIN_GROUP_NAME, user_is_conduit_admin
+from lando.main.auth import (
+    CONDUIT_ADMIN_GROUP_NAME,
+    PhabricatorTokenAuthenticationBackend,
+    forget_phabricator_token,
+    phabricator_token_cache_key,
+    user_is_conduit_admin,
+)
+from lando.utils.phabricator import PhabricatorClient
 
 
 @pytest.mark.parametrize(
@@ -31,3 +40,41 @@ def test_user_is_conduit_admin_anonymous():
     assert user_is_conduit_admin(AnonymousUser()) is False, (
         "An unauthenticated user should not be a Conduit admin."
     )
+
+
+# Enable the local memory cache since we use the dummy cache in tests.
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "test-phabricator-token-cache",
+        }
+    }
+)
+def test_get_phab_user_caches_verified_tokens(monkeypatch):
+    cache.clear()
+    whoami = {"phid": "PHID-USER-1", "primaryEmail": "user@example.org"}
+    calls = []
+
+    def verify_api_token(self):
+        calls.append(self.api_token)
+        return whoami if self.api_token == "api-valid" else None
+
+    monkeypatch.setattr(PhabricatorClient, "verify_api_token", verify_api_token)
+
+    get_phab_user = PhabricatorTokenAuthenticationBackend.get_phab_user
+    assert get_phab_user("api-valid") == whoami
+    assert get_phab_user("api-valid") == whoami
+    assert calls == ["api-valid"], "A verified token should only be checked once."
+
+    assert get_phab_user("api-invalid") is None
+    assert get_phab_user("api-invalid") is None
+    assert calls.count("api-invalid") == 2, "Invalid tokens should not be cached."
+
+    assert "api-valid" not in phabricator_token_cache_key("api-valid"), (
+        "Tokens should not appear in cache keys."
+    )
+
+    forget_phabricator_token("api-valid")
+    assert get_phab_user("api-valid") == whoami
+    assert calls.count("api-valid") == 2, "A forgotten token should be verified again."
@@ -1,8 +1,16 @@
+import hashlib
+import os
+import time
+from collections.abc import Callable
 from unittest import mock
 
 import pytest
+from django.core.management import call_command
+from django.db import connection
 
 from lando.main.models import CommitMap
+from lando.main.models import commit_map as commit_map_module
+from lando.utils.cache import LRUCache
 
 
 @pytest.mark.django_db(transaction=True)
@@ -12,15 +20,15 @@ def test_CommitMap_git2hg(commit_maps):
 
 
 @pytest.mark.django_db(transaction=True)
-def test_CommitMap_git2hg_catchup(monkeypatch):
+def test_CommitMap_git2hg_no_catchup(monkeypatch):
     mock_catch_up = mock.MagicMock()
     monkeypatch.setattr("lando.main.models.CommitMap.catch_up", mock_catch_up)
 
     with pytest.raises(CommitMap.DoesNotExist):
         CommitMap.git2hg("git_test_repo", "z" * 40)
 
-    assert mock_catch_up.assert_called, (
-        "CommitMap.catch_up wasn't called for a missing Git commit"
+    assert mock_catch_up.call_count == 0, (
+        "CommitMap.catch_up shouldn't be called for a missing Git commit"
     )
 
 
@@ -31,15 +39,15 @@ def test_CommitMap_hg2git(commit_maps):
 
 
 @pytest.mark.django_db(transaction=True)
-def test_CommitMap_hg2git_catchup(monkeypatch):
+def test_CommitMap_hg2git_no_catchup(monkeypatch):
     mock_catch_up = mock.MagicMock()
     monkeypatch.setattr("lando.main.models.CommitMap.catch_up", mock_catch_up)
 
     with pytest.raises(CommitMap.DoesNotExist):
         CommitMap.hg2git("git_test_repo", "z" * 40)
 
-    assert mock_catch_up.assert_called, (
-        "CommitMap.catch_up wasn't called for a missing Hg commit"
+    assert mock_catch_up.call_count == 0, (
+        "CommitMap.catch_up shouldn't be called for a missing Hg commit"
     )
 
 
@@ -57,3 +65,79 @@ def test_CommitMap_get_hg_repo_name():
 def test_CommitMap_git2hg_multiple(commit_maps):
     with pytest.raises(CommitMap.MultipleObjectsReturned):
         assert CommitMap.git2hg(commit_maps[0].git_repo_name, "aaaaa")
+
+
+@pytest.mark.django_db(transaction=True)
+def test_sync_commit_maps(commit_maps, monkeypatch):
+    monkeypatch.setattr(
+        "lando.main.models.CommitMap.REPO_MAPPING",
+        (("git_repo", "hg_repo"), ("other_repo", "other_hg_repo")),
+    )
+    mock_catch_up = mock.MagicMock()
+    monkeypatch.setattr("lando.main.models.CommitMap.catch_up", mock_catch_up)
+
+    call_command("sync_commit_maps", once=True)
+
+    assert [call.args for call in mock_catch_up.call_args_list] == [
+        ("git_repo",),
+        ("other_repo",),
+    ], "All repositories in the REPO_MAPPING should be synced."
+
+
+@pytest.mark.django_db(transaction=True)
+def test_CommitMap_full_hash_lookups_are_cached(commit_maps, monkeypatch):
+    monkeypatch.setattr(commit_map_module, "commit_map_lookups", LRUCache(10))
+    cmap = commit_maps[1]
+
+    assert CommitMap.git2hg("git_repo", cmap.git_hash) == cmap.hg_hash
+    CommitMap.objects.filter(id=cmap.id).delete()
+
+    assert CommitMap.git2hg("git_repo", cmap.git_hash) == cmap.hg_hash, (
+        "Full hash lookups should be served from memory."
+    )
+    with pytest.raises(CommitMap.DoesNotExist):
+        CommitMap.git2hg("git_repo", cmap.git_hash[:12])
+
+
+@pytest.mark.skipif(
+    not os.getenv("LANDO_BENCHMARKS"), reason="Set LANDO_BENCHMARKS=1 to run."
+)
+@pytest.mark.django_db(transaction=True)
+def test_CommitMap_short_hash_lookup_benchmark(
+    record_property: Callable[[str, object], None],
+):
+    """Time short hash lookups in a firefox-sized CommitMap.
+
+    Timings are recorded as test properties, e.g. in the `--junitxml` report.
+    """
+    rows = 1_000_000
+    for start in range(0, rows, 10_000):
+        CommitMap.objects.bulk_create(
+            CommitMap(
+                git_hash=hashlib.sha1(f"git{i}".encode()).hexdigest(),
+                hg_hash=hashlib.sha1(f"hg{i}".encode()).hexdigest(),
+                git_repo_name="firefox",
+            )
+            for i in range(start, start + 10_000)
+        )
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE main_commitmap")
+
+    short_hashes = [
+        hashlib.sha1(f"git{i}".encode()).hexdigest()[:12] for i in range(0, rows, 997)
+    ]
+    start = time.perf_counter()
+    for short_hash in short_hashes:
+        CommitMap.git2hg("firefox", short_hash)
+    elapsed = time.perf_counter() - start
+
+    query = CommitMap.objects.filter(
+        git_repo_name="firefox", git_hash__startswith=short_hashes[0]
+    )
+    plan = query.explain()
+
+    record_property("lookup_ms", elapsed / len(short_hashes) * 1000)
+    record_property("plan", plan)
+    assert "main_commitmap_git_prefix_idx" in plan, (
+        "Short hash lookups should use the prefix index."
+    )
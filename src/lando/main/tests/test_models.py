@@ -11,6 +11,7 @@ from django.core.exceptions import ValidationError
 
 from lando.main.models import CommitMap, Repo
 from lando.main.models.base import CryptographyMixin
+from lando.main.models.patch_blob import PatchBlob, hash_patch_text
 from lando.main.models.profile import Profile
 from lando.main.models.repo import (
     get_default_autoformat_run_command,
@@ -353,6 +354,34 @@ def test__models__Revision__metadata():
     assert r.diff == DIFF_ONLY
 
 
+@pytest.mark.django_db()
+def test__models__Revision__patch_stored_in_deduplicated_blob():
+    first = Revision(patch=DIFF_ONLY)
+    first.save()
+    second = Revision.objects.create(patch=DIFF_ONLY, patches=DIFF_ONLY)
+
+    assert PatchBlob.objects.count() == 1, "Identical patches should share a blob."
+    blob = PatchBlob.objects.get()
+    assert blob.sha256 == hash_patch_text(DIFF_ONLY)
+    assert blob.size == len(DIFF_ONLY.encode("utf-8"))
+    assert bytes(blob.data) != DIFF_ONLY.encode("utf-8"), "Blob should be compressed."
+    assert second.patch_blob_id == second.patches_blob_id == first.patch_blob_id
+
+    reloaded = Revision.objects.get(id=second.id)
+    assert reloaded.patch == DIFF_ONLY
+    assert reloaded.patches == DIFF_ONLY
+
+
+@pytest.mark.django_db()
+def test__models__Revision__empty_patch_has_no_blob():
+    revision = Revision.objects.create(patch="")
+
+    assert revision.patch_blob is None
+    assert Revision.objects.get(id=revision.id).patch == ""
+    assert Revision.objects.get(id=revision.id).patches == ""
+    assert not PatchBlob.objects.exists()
+
+
 @pytest.mark.parametrize(
     "branch,expected_branch", [(None, "main"), ("non-default", "non-default")]
 )
@@ -493,6 +522,57 @@ def test__models__CommitMap__fetch_push_data(commit_maps, monkeypatch):
     assert CommitMap.find_last_hg_node("git_repo") == "1" * 40
 
 
+@pytest.mark.django_db(transaction=True)
+def test__models__CommitMap__fetch_push_data_bulk(
+    commit_maps, monkeypatch, django_assert_max_num_queries
+):
+    last_hg_node = commit_maps[-1].hg_hash
+    previous_commit_map_count = CommitMap.objects.all().count()
+    mock_requests_get = MagicMock()
+    mock_requests_get.return_value.json.return_value = {
+        "1": {
+            "changesets": [f"{i:040x}" for i in range(1, 50)],
+            "git_changesets": [f"{i:040x}" for i in range(1001, 1050)],
+        },
+        "2": {
+            # Already stored.
+            "changesets": [commit_maps[0].hg_hash],
+            "git_changesets": [commit_maps[0].git_hash],
+        },
+        "3": {
+            "changesets": [f"{i:040x}" for i in range(50, 100)],
+            "git_changesets": [f"{i:040x}" for i in range(1050, 1100)],
+        },
+    }
+    monkeypatch.setattr("lando.main.models.commit_map.requests.get", mock_requests_get)
+    mock_capture_exception = MagicMock()
+    monkeypatch.setattr(
+        "lando.main.models.commit_map.sentry_sdk.capture_exception",
+        mock_capture_exception,
+    )
+
+    with django_assert_max_num_queries(2):
+        CommitMap.fetch_push_data("git_repo", fromchange=last_hg_node)
+
+    assert CommitMap.objects.all().count() == previous_commit_map_count + 99, (
+        "All new changesets should be stored, and existing ones skipped."
+    )
+    assert CommitMap.find_last_hg_node("git_repo") == f"{99:040x}", (
+        "The last changeset of the last push should be the last node."
+    )
+    assert mock_capture_exception.call_count == 0
+
+    # The hg changeset is known, but mapped to another git changeset.
+    mock_requests_get.return_value.json.return_value = {
+        "4": {"changesets": [f"{1:040x}"], "git_changesets": ["f" * 40]}
+    }
+    CommitMap.fetch_push_data("git_repo", fromchange=f"{99:040x}")
+
+    assert mock_capture_exception.call_count == 1, (
+        "Conflicting entries should be reported to Sentry."
+    )
+
+
 @pytest.mark.django_db(transaction=True)
 def test__models__CommitMap__fetch_push_data_invalid_response(commit_maps, monkeypatch):
     last_hg_node = commit_maps[-1].hg_hash
@@ -512,6 +592,28 @@ def test__models__CommitMap__fetch_push_data_invalid_response(commit_maps, monke
     )
     assert CommitMap.objects.all().count() == previous_commit_map_count
 
+    # Pushes preceding an invalid one are stored.
+    mock_requests_get.return_value.json.return_value = {
+        "1": {"changesets": ["4" * 40], "git_changesets": ["5" * 40]},
+        "2": {"changesets": ["1" * 40, "2" * 40], "git_changesets": ["3" * 40]},
+    }
+    with pytest.raises(ValueError):
+        CommitMap.fetch_push_data("git_repo", fromchange=last_hg_node)
+    assert CommitMap.objects.filter(hg_hash="4" * 40, git_hash="5" * 40).exists(), (
+        "Pairs from pushes before the invalid one should be stored."
+    )
+
+    # Nothing is stored if the response is malformed in another way.
+    mock_requests_get.return_value.json.return_value = {
+        "3": {"changesets": ["6" * 40], "git_changesets": ["7" * 40]},
+        "4": {"changesets": ["8" * 40]},
+    }
+    with pytest.raises(KeyError):
+        CommitMap.fetch_push_data("git_repo", fromchange=last_hg_node)
+    assert not CommitMap.objects.filter(hg_hash="6" * 40).exists(), (
+        "No pairs should be stored for malformed responses."
+    )
+
 
 def test_hook_choices_all_checks():
     """Ensure that all existing checks are available as configurable hooks."""
@@ -0,0 +1,61 @@
+import argparse
+import logging
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from lando.pulse.pulse import PulseNotifier
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = """Send Pulse notifications for all un-notified Pushes.
+
+        Pushes are notified in order for each repository, reusing a single connection
+        to the broker. Several instances can run at once, as each repository is only
+        notified by one of them at a time.
+        """
+    name = "pulse_notify_pending"
+
+    def add_arguments(self, parser: argparse.ArgumentParser):
+        parser.add_argument(
+            "--interval",
+            "-i",
+            type=int,
+            default=settings.PULSE_NOTIFY_INTERVAL,
+            help="Number of seconds to wait between checks for un-notified pushes",
+        )
+        parser.add_argument(
+            "--batch-size",
+            "-b",
+            type=int,
+            default=settings.PULSE_NOTIFY_BATCH_SIZE,
+            help="Maximum number of pushes notified per repository in each check",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Notify pending pushes once and exit, rather than looping",
+        )
+
+    def handle(self, *args, **options):
+        notifier = PulseNotifier()
+
+        while True:
+            try:
+                count, backlog = notifier.notify_pending(options["batch_size"])
+            except Exception as exc:
+                logger.exception(f"Could not notify pending pushes: {exc}")
+                count, backlog = 0, False
+
+            if count:
+                self.stdout.write(f"Notified {count} pushes.")
+
+            if options["once"]:
+                break
+
+            # Keep going without waiting while a repository has a backlog.
+            if not backlog:
+                time.sleep(options["interval"])
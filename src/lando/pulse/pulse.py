@@ -1,12 +1,19 @@
 import logging
+from urllib.parse import urlencode
 
 import kombu
 from django.conf import settings
+from django.db import connection, transaction
+from django.urls import reverse
 
 from lando.pushlog.models import Push
 
 logger = logging.getLogger(__name__)
 
+# First key of the Postgres advisory locks taken while notifying the Pushes of a Repo,
+# the second being the Repo ID.
+NOTIFY_LOCK_NAMESPACE = 0x50554C53  # "PULS"
+
 
 class PulseNotifier:
     """Class to generate and send Pulse notification based on Push objects."""
@@ -37,8 +44,8 @@ class PulseNotifier:
         self.producer.exchange.declare()
         return self.producer.exchange
 
-    def notify_push(self, push: Push):
-        """Send a Pulse notification for the given Push."""
+    def publish(self, push: Push):
+        """Send a Pulse notification for the given Push, without marking it notified."""
         message = self.pulse_message_for_push(push)
 
         # Determine if a non-default routing key should be used.
@@ -46,8 +53,6 @@ class PulseNotifier:
         if push.repo:
             push_routing_key = push.repo.pulse_routing_key or push_routing_key
 
-        # XXX: make a separate notification worker that loops around un-notified
-        # Push entries.
         logger.info(f"Sending {message} (routing key: {push_routing_key} ...")
 
         self.producer.publish(
@@ -62,9 +67,74 @@ class PulseNotifier:
             },
         )
 
+    def notify_push(self, push: Push):
+        """Send a Pulse notification for the given Push."""
+        self.publish(push)
+
         push.notified = True
         push.save()
 
+    def notify_pending(self, batch_size: int) -> tuple[int, bool]:
+        """Send Pulse notifications for un-notified Pushes.
+
+        Returns how many were sent, and whether any Repo reached `batch_size`, in
+        which case more of its Pushes may be pending.
+
+        Pushes of each Repo are notified in push_id order, up to `batch_size` per Repo.
+        If a notification fails, later Pushes of that Repo are left for the next call,
+        so they are never notified out of order. Pushes are marked as notified once
+        the batch is published, so a crash may lead to a Push being notified again,
+        but never to it being skipped.
+        """
+        repo_ids = (
+            Push.objects.filter(notified=False)
+            .order_by()
+            .values_list("repo", flat=True)
+            .distinct()
+        )
+
+        counts = [
+            self._notify_pending_for_repo(repo_id, batch_size) for repo_id in repo_ids
+        ]
+        return sum(counts), any(count >= batch_size for count in counts)
+
+    @transaction.atomic
+    def _notify_pending_for_repo(self, repo_id: int | None, batch_size: int) -> int:
+        """Notify the pending Pushes of a Repo, unless another worker already is.
+
+        The advisory lock is held until the Pushes are marked as notified, so
+        concurrent workers never publish the Pushes of a Repo out of order.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_try_advisory_xact_lock(%s::integer, %s::integer)",
+                [NOTIFY_LOCK_NAMESPACE, repo_id or 0],
+            )
+            if not cursor.fetchone()[0]:
+                logger.debug(
+                    f"Pushes for repo {repo_id} are notified by another worker"
+                )
+                return 0
+
+        pushes = (
+            Push.objects.filter(repo=repo_id, notified=False)
+            .select_related("repo")
+            .order_by("push_id")[:batch_size]
+        )
+
+        published = []
+        for push in pushes:
+            try:
+                self.publish(push)
+            except Exception as exc:
+                logger.warning(f"Failed to notify push {push}: {exc}")
+                break
+            published.append(push.id)
+
+        Push.objects.filter(id__in=published).update(notified=True)
+
+        return len(published)
+
     @classmethod
     def pulse_message_for_push(cls, push: Push) -> dict:
         """Generate Pulse notification payload for the given Push.
@@ -96,9 +166,25 @@ class PulseNotifier:
                 "time": push.datetime.strftime("%s"),
                 "push_id": push.push_id,
                 "user": push.user,
-                # XXX: https://bugzilla.mozilla.org/show_bug.cgi?id=1957549
-                "push_json_url": "FIXME",
-                "push_full_json_url": "FIXME",
+                "push_json_url": cls.push_json_url(push),
+                "push_full_json_url": cls.push_json_url(push, full=True),
             }
         }
         return message
+
+    @classmethod
+    def push_json_url(cls, push: Push, full: bool = False) -> str:
+        """Return the URL of the given Push in the json-pushes pushlog API."""
+        if not push.repo:
+            return ""
+
+        path = reverse("pushlog-json-pushes", args=[push.repo.name])
+        params = {
+            "version": 2,
+            "startID": push.push_id - 1,
+            "endID": push.push_id,
+        }
+        if full:
+            params["full"] = 1
+
+        return f"{settings.SITE_URL}{path}?{urlencode(params)}"
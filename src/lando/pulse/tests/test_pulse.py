@@ -1,6 +1,7 @@
 from collections.abc import Callable
 
 import pytest
+from django.conf import settings
 
 from lando.pulse.pulse import PulseNotifier
 
@@ -46,6 +47,8 @@ def test__PulseNotifier(
     assert tag_name in message["tags"]
     assert message["tags"][tag_name] == commit.hash
     assert message["user"] == push.user
-    # XXX: https://bugzilla.mozilla.org/show_bug.cgi?id=1957549
-    # assert message['push_json_url'] == push.push_json_url
-    # assert message['push_full_json_url'] == push.push_full_json_url
+    assert message["push_json_url"] == (
+        f"{settings.SITE_URL}/api/pushlog/{repo.name}/json-pushes"
+        f"?version=2&startID={push.push_id - 1}&endID={push.push_id}"
+    )
+    assert message["push_full_json_url"] == f"{message['push_json_url']}&full=1"
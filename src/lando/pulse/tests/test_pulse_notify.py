@@ -1,11 +1,15 @@
 from io import StringIO
 from typing import Callable
+from unittest import mock
 
 import kombu
 import pytest
 from django.core.management import call_command
 from django.core.management.base import CommandError
 
+from lando.pulse.pulse import PulseNotifier
+from lando.pushlog.models import Push
+
 
 def test_pulse_notify_no_repo():
     with pytest.raises(CommandError, match="required: -r"):
@@ -173,3 +177,82 @@ def test_pulse_notify_push_id_force(
     assert len(messages) == 1
     message_dict = messages[0][0]
     assert message_dict["payload"]["push_id"] == push.push_id
+
+
+@pytest.mark.django_db
+def test_pulse_notify_pending(
+    kombu_queue_maker: Callable,
+    make_commit: Callable,
+    make_push: Callable,
+    make_repo: Callable,
+    mock_notifier_producer: Callable,
+):
+    repo = make_repo(1)
+
+    pushes = []
+    for seqno in range(1, 4):
+        push = make_push(repo, [make_commit(repo, seqno)])
+        pushes.append(push)
+    pushes[0].notified = True
+    pushes[0].save()
+
+    queue = kombu_queue_maker(repo.pulse_routing_key)
+    producer = next(queue)
+    mock_notifier_producer(producer)
+
+    out = StringIO()
+    call_command("pulse_notify_pending", once=True, stdout=out)
+
+    assert "Notified 2 pushes." in out.getvalue()
+
+    messages = next(queue)
+    assert [message[0]["payload"]["push_id"] for message in messages] == [2, 3], (
+        "Only un-notified pushes should be notified, in order."
+    )
+    assert not Push.objects.filter(repo=repo, notified=False).exists()
+
+
+@pytest.mark.django_db
+def test_pulse_notify_pending_keeps_order_on_failure(
+    make_commit: Callable,
+    make_push: Callable,
+    make_repo: Callable,
+    mock_notifier_producer: Callable,
+):
+    repo = make_repo(1)
+    pushes = [make_push(repo, [make_commit(repo, seqno)]) for seqno in range(1, 4)]
+
+    producer = mock.MagicMock()
+    producer.publish.side_effect = [None, ConnectionError("Broker unavailable")]
+    mock_notifier_producer(producer)
+
+    call_command("pulse_notify_pending", once=True, stdout=StringIO())
+
+    assert producer.publish.call_count == 2, (
+        "Later pushes should not be notified after a failure."
+    )
+    assert list(
+        Push.objects.filter(repo=repo, notified=False)
+        .order_by("push_id")
+        .values_list("push_id", flat=True)
+    ) == [pushes[1].push_id, pushes[2].push_id]
+
+
+@pytest.mark.django_db
+def test_pulse_notify_pending_reports_backlog(
+    make_commit: Callable,
+    make_push: Callable,
+    make_repo: Callable,
+):
+    repos = [make_repo(1), make_repo(2)]
+    for repo in repos:
+        for seqno in range(1, 3):
+            make_push(repo, [make_commit(repo, seqno)])
+    notifier = PulseNotifier(producer=mock.MagicMock())
+
+    assert notifier.notify_pending(batch_size=1) == (2, True), (
+        "Repos with more pending pushes than the batch size have a backlog."
+    )
+    assert notifier.notify_pending(batch_size=5) == (2, False), (
+        "The total across repos should not count as a backlog."
+    )
@@ -1,7 +1,8 @@
 from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import transaction
 
 from lando.main.models.repo import Repo
-from lando.pushlog.models import Push
+from lando.pushlog.models import Push, PushIdCounter
 
 
 class Command(BaseCommand):
@@ -41,8 +42,14 @@ class Command(BaseCommand):
             )
             return
 
-        push = Push.objects.create(repo=repo, user="pushlog_add_gap@lando-cli")
-        # We need to override the push_id which is auto-generated on first save().
-        push.push_id = stub_push_id
-        push.save()
+        with transaction.atomic():
+            # The stub push has no content, so there is nothing to notify about.
+            push = Push.objects.create(
+                repo=repo, user="pushlog_add_gap@lando-cli", notified=True
+            )
+            # We need to override the push_id which is auto-generated on first save(),
+            # and have the counter carry on from there.
+            push.push_id = stub_push_id
+            push.save()
+            PushIdCounter.reset(repo, stub_push_id)
         self.stdout.write(f"Created Push with ID {stub_push_id} for {repo_name}")
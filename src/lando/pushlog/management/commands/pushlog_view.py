@@ -21,6 +21,19 @@ class Command(BaseCommand):
         )
         parser.add_argument("-l", "--limit", type=int, default=0)
         parser.add_argument("-p", "--push-id", type=int, default=0)
+        parser.add_argument(
+            "-P",
+            "--path",
+            default="",
+            help="Only show pushes touching files under this path",
+        )
+        parser.add_argument(
+            "-b",
+            "--before",
+            type=int,
+            default=0,
+            help="Only show pushes with a lower push_id, to page through results",
+        )
         parser.add_argument("-r", "--repo", required=True)
         parser.add_argument(
             "-c", "--with-commits", default=True, action=argparse.BooleanOptionalAction
@@ -31,7 +44,9 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         commits_only = options["commits_only"]
+        before = options["before"]
         limit = options["limit"]
+        path = options["path"]
         push_id = options["push_id"]
         repo_name = options["repo"]
         tags_only = options["tags_only"]
@@ -45,7 +60,13 @@ class Command(BaseCommand):
         if push_id:
             pushes = Push.objects.filter(repo=repo, push_id=push_id)
         else:
-            pushes = Push.objects.filter(repo=repo)
+            if path:
+                pushes = Push.touching_path(repo, path)
+            else:
+                pushes = Push.objects.filter(repo=repo)
+
+            if before:
+                pushes = pushes.filter(push_id__lt=before)
 
             if commits_only:
                 pushes = pushes.annotate(num_commits=Count("commits")).filter(
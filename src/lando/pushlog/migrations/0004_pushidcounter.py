@@ -0,0 +1,45 @@
+# Generated by Django 6.0 on 2026-10-18 10:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Max
+
+
+def initialise_push_id_counters(apps, schema_editor):  # noqa: ANN001
+    """Start each Repo's counter from its highest existing push_id."""
+    Push = apps.get_model("pushlog", "Push")
+    PushIdCounter = apps.get_model("pushlog", "PushIdCounter")
+    PushIdCounter.objects.bulk_create(
+        PushIdCounter(repo_id=row["repo"], last_push_id=row["last_push_id"])
+        for row in Push.objects.filter(repo__isnull=False)
+        .values("repo")
+        .annotate(last_push_id=Max("push_id"))
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0020_repo_pushlog_disabled"),
+        ("pushlog", "0003_push_tags"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PushIdCounter",
+            fields=[
+                (
+                    "repo",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="+",
+                        serialize=False,
+                        to="main.repo",
+                    ),
+                ),
+                ("last_push_id", models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(initialise_push_id_counters, migrations.RunPython.noop),
+    ]
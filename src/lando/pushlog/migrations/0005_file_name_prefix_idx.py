@@ -0,0 +1,24 @@
+# Generated by Django 6.0.6 on 2026-10-18 16:20
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Build the index without locking writes to the (large) File table.
+    atomic = False
+
+    dependencies = [
+        ("pushlog", "0004_pushidcounter"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="file",
+            index=models.Index(
+                fields=["repo", "name"],
+                name="pushlog_file_name_prefix_idx",
+                opclasses=["int8_ops", "varchar_pattern_ops"],
+            ),
+        ),
+    ]
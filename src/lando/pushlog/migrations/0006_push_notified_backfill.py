@@ -0,0 +1,25 @@
+# Generated by Django 6.0.6 on 2026-10-19 09:00
+
+from django.db import migrations
+
+
+def mark_existing_pushes_notified(apps, schema_editor):  # noqa: ANN001
+    """Mark all existing Pushes as notified, so the worker doesn't replay them.
+
+    Pushes recorded before this point were either notified when they were recorded,
+    predate the `notified` field, failed to notify, or are `pushlog_add_gap` stubs.
+    None of them should be sent now.
+    """
+    Push = apps.get_model("pushlog", "Push")
+    Push.objects.filter(notified=False).update(notified=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("pushlog", "0005_file_name_prefix_idx"),
+    ]
+
+    operations = [
+        migrations.RunPython(mark_existing_pushes_notified, migrations.RunPython.noop),
+    ]
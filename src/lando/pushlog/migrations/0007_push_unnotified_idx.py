@@ -0,0 +1,24 @@
+# Generated by Django 6.0.6 on 2026-10-19 09:00
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Build the index without locking writes to the Push table.
+    atomic = False
+
+    dependencies = [
+        ("pushlog", "0006_push_notified_backfill"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="push",
+            index=models.Index(
+                condition=models.Q(("notified", False)),
+                fields=["repo", "push_id"],
+                name="pushlog_push_unnotified_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 6.0.6 on 2026-10-19 11:30
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Build the index without locking writes to the (large) Commit table.
+    atomic = False
+
+    dependencies = [
+        ("pushlog", "0007_push_unnotified_idx"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="commit",
+            index=models.Index(
+                fields=["repo", "hash"],
+                name="pushlog_commit_hash_prefix_idx",
+                opclasses=["int8_ops", "varchar_pattern_ops"],
+            ),
+        ),
+    ]
@@ -3,7 +3,7 @@ from .commit import (
     File,
     Tag,
 )
-from .push import Push
+from .push import Push, PushIdCounter
 
 __all__ = [
     # commits
@@ -12,4 +12,5 @@ __all__ = [
     "Tag",
     # push
     "Push",
+    "PushIdCounter",
 ]
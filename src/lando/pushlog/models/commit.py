@@ -1,4 +1,5 @@
 import logging
+from itertools import batched
 from typing import Self
 
 from django.core.validators import (
@@ -17,6 +18,9 @@ from .consts import MAX_FILENAME_LENGTH, MAX_PATH_LENGTH
 
 logger = logging.getLogger(__name__)
 
+# Number of rows written or looked up per query when saving commits in bulk.
+BULK_BATCH_SIZE = 1000
+
 
 class File(models.Model):
     """A file in a repository.
@@ -34,6 +38,15 @@ class File(models.Model):
 
     class Meta:
         unique_together = ("repo", "name")
+        indexes = [
+            # Serve path prefix (`LIKE 'dir/%'`) lookups, which the default operator
+            # class doesn't under non-C collations.
+            models.Index(
+                fields=["repo", "name"],
+                name="pushlog_file_name_prefix_idx",
+                opclasses=["int8_ops", "varchar_pattern_ops"],
+            ),
+        ]
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(repo={self.repo!r}, name={self.name})"
@@ -41,6 +54,33 @@ class File(models.Model):
     def __str__(self) -> str:
         return f"File {self.name} in {self.repo}"
 
+    @classmethod
+    def get_or_create_ids(cls, repo: Repo, names: set[str]) -> dict[str, int]:
+        """Return the IDs of the named Files in `repo`, creating any missing ones."""
+        file_ids = {}
+        for batch in batched(names, BULK_BATCH_SIZE, strict=False):
+            file_ids.update(
+                cls.objects.filter(repo=repo, name__in=batch).values_list("name", "id")
+            )
+
+        missing = names - file_ids.keys()
+        if not missing:
+            return file_ids
+
+        # Files may be created concurrently by another push, so we let the DB ignore
+        # duplicates, and query all the missing IDs back.
+        cls.objects.bulk_create(
+            [cls(repo=repo, name=name) for name in missing],
+            batch_size=BULK_BATCH_SIZE,
+            ignore_conflicts=True,
+        )
+        for batch in batched(missing, BULK_BATCH_SIZE, strict=False):
+            file_ids.update(
+                cls.objects.filter(repo=repo, name__in=batch).values_list("name", "id")
+            )
+
+        return file_ids
+
 
 class Commit(models.Model):
     """An SCM commit.
@@ -99,6 +139,15 @@ class Commit(models.Model):
         ordering = ["id"]
         get_latest_by = "id"
         unique_together = ("repo", "hash")
+        indexes = [
+            # Serve abbreviated hash (`LIKE 'abc%'`) lookups, which the default
+            # operator class doesn't under non-C collations.
+            models.Index(
+                fields=["repo", "hash"],
+                name="pushlog_commit_hash_prefix_idx",
+                opclasses=["int8_ops", "varchar_pattern_ops"],
+            ),
+        ]
 
     def __init__(self, *args, **kwargs):
         self._unsaved_parents = set()
@@ -179,6 +228,64 @@ class Commit(models.Model):
 
         super().save(*args, **kwargs)
 
+    @classmethod
+    def bulk_save(cls, repo: Repo, commits: list[Self]):
+        """Save a list of Commits, and their parents and files, to the DB at once.
+
+        This produces the same data as calling `save()` on each Commit in turn, but
+        uses a fixed number of queries per batch rather than a few per parent and
+        file. Commits are expected to be in DAG order, so a parent can only be found
+        if it was already in the DB, or comes earlier in the list.
+        """
+        new_commits = [commit for commit in commits if not commit.id]
+        cls.objects.bulk_create(new_commits, batch_size=BULK_BATCH_SIZE)
+
+        position = {commit.hash: index for index, commit in enumerate(commits)}
+        parent_hashes = set().union(*(commit._unsaved_parents for commit in commits))
+        parent_ids = {}
+        for batch in batched(parent_hashes, BULK_BATCH_SIZE, strict=False):
+            parent_ids.update(
+                cls.objects.filter(repo=repo, hash__in=batch).values_list("hash", "id")
+            )
+
+        parents = []
+        for index, commit in enumerate(commits):
+            for parent_hash in commit._unsaved_parents:
+                parent_id = parent_ids.get(parent_hash)
+                if parent_id is None or position.get(parent_hash, -1) >= index:
+                    # XXX: This MUST be an exception, but it's problematic for
+                    # pre-existing repos with un-imported history.
+                    logger.warning(
+                        f"Parent commit not found for repo. commit={commit.hash} parent_commit={parent_hash} repo={repo}"
+                    )
+                    continue
+
+                parents.append(
+                    cls._parents.through(
+                        from_commit_id=commit.id, to_commit_id=parent_id
+                    )
+                )
+            commit._unsaved_parents.clear()
+
+        cls._parents.through.objects.bulk_create(
+            parents, batch_size=BULK_BATCH_SIZE, ignore_conflicts=True
+        )
+
+        file_ids = File.get_or_create_ids(
+            repo, set().union(*(commit._unsaved_files for commit in commits))
+        )
+        files = []
+        for commit in commits:
+            files.extend(
+                cls._files.through(commit_id=commit.id, file_id=file_ids[name])
+                for name in commit._unsaved_files
+            )
+            commit._unsaved_files.clear()
+
+        cls._files.through.objects.bulk_create(
+            files, batch_size=BULK_BATCH_SIZE, ignore_conflicts=True
+        )
+
     @property
     def parents(self) -> list[str]:
         """Return a deduplicated Python list of parent hashes as strings."""
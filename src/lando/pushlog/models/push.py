@@ -1,11 +1,67 @@
-from django.db import models
+from typing import Self
+
+from django.db import connection, models, transaction
+from django.db.models import QuerySet
 
 from lando.main.models import Repo
 
-from .commit import Commit, Tag
+from .commit import Commit, File, Tag
 from .consts import MAX_BRANCH_LENGTH, MAX_URL_LENGTH
 
 
+class PushIdCounter(models.Model):
+    """The last push_id allocated for a Repo.
+
+    Incrementing this counter is atomic, so concurrent pushes to the same Repo get
+    distinct and consecutive push_ids without having to scan existing Pushes.
+    """
+
+    repo = models.OneToOneField(
+        Repo,
+        primary_key=True,
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+
+    last_push_id = models.PositiveIntegerField(default=0)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(repo={self.repo!r}, last_push_id={self.last_push_id})"
+
+    @classmethod
+    def increment(cls, repo: Repo) -> int:
+        """Allocate and return the next push_id for the Repo.
+
+        The counter row stays locked until the current transaction ends, so the
+        push_id of a rolled back Push is reused by the next one. Counters are created
+        on first use, starting after any Push already recorded for the Repo.
+        """
+        counter_table = cls._meta.db_table
+        push_table = Push._meta.db_table
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {counter_table} (repo_id, last_push_id)
+                VALUES (
+                    %s,
+                    COALESCE(
+                        (SELECT MAX(push_id) FROM {push_table} WHERE repo_id = %s), 0
+                    ) + 1
+                )
+                ON CONFLICT (repo_id) DO UPDATE
+                SET last_push_id = {counter_table}.last_push_id + 1
+                RETURNING last_push_id
+                """,
+                [repo.id, repo.id],
+            )
+            return cursor.fetchone()[0]
+
+    @classmethod
+    def reset(cls, repo: Repo, last_push_id: int):
+        """Set the last push_id allocated for the Repo, e.g., to create a gap."""
+        cls.objects.update_or_create(repo=repo, defaults={"last_push_id": last_push_id})
+
+
 class Push(models.Model):
     """A Push object records the list of Commits pushed at once."""
 
@@ -47,6 +103,15 @@ class Push(models.Model):
     class Meta:
         unique_together = ("push_id", "repo")
         verbose_name_plural = "Pushes"
+        indexes = [
+            # Serve the Pulse notification worker's frequent scans for un-notified
+            # Pushes, which are only ever a handful.
+            models.Index(
+                fields=["repo", "push_id"],
+                name="pushlog_push_unnotified_idx",
+                condition=models.Q(notified=False),
+            ),
+        ]
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(push_id={self.push_id}, repo={self.repo})"
@@ -55,28 +120,34 @@ class Push(models.Model):
         return f"Push {self.push_id} in {self.repo}"
 
     def save(self, *args, **kwargs):
-        if not self.id:
-            # Determine the next push_id on first save
-            next_push_id = self._next_push_id(self.repo)
-            self.push_id = next_push_id
-
         if not self.repo_url:
             self.repo_url = self.repo.url
         if not self.branch:
             self.branch = self.repo.default_branch
 
-        super(Push, self).save(*args, **kwargs)
+        # Allocate the push_id in the same transaction as the Push, so it is released
+        # if the Push fails to be saved.
+        with transaction.atomic():
+            if not self.id:
+                # Determine the next push_id on first save
+                self.push_id = self._next_push_id(self.repo)
+
+            super(Push, self).save(*args, **kwargs)
+
+    @classmethod
+    def touching_path(cls, repo: Repo, path: str) -> QuerySet[Self]:
+        """Return the Pushes to the Repo with commits touching files under `path`.
+
+        `path` is a prefix of file names, so it can be either a file or a directory.
+        Each step is an indexed semi-join (files by name prefix, then commits by file,
+        then pushes by commit), so no Push is returned more than once.
+        """
+        files = File.objects.filter(repo=repo, name__startswith=path)
+        commits = Commit._files.through.objects.filter(file__in=files).values("commit")
+        pushes = cls.commits.through.objects.filter(commit__in=commits).values("push")
+        return cls.objects.filter(repo=repo, id__in=pushes)
 
     @classmethod
     def _next_push_id(cls, repo: Repo) -> int:
         """Generate a monotonically increasing sequence of push_id, scoped by Repo."""
-        max_push_id = (
-            cls.objects.filter(repo=repo)
-            .order_by("-push_id")
-            .values_list("push_id", flat=True)
-        )
-
-        if max_push_id:
-            return max_push_id[0] + 1
-
-        return 1
+        return PushIdCounter.increment(repo)
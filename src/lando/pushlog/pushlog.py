@@ -6,7 +6,6 @@ from django.db import transaction
 
 from lando.main.models.repo import Repo
 from lando.main.scm.commit import CommitData
-from lando.pulse.pulse import PulseNotifier
 from lando.pushlog.models import Commit, Push, Tag
 
 logger = logging.getLogger(__name__)
@@ -104,13 +103,19 @@ class PushLog:
             f"Commits in push {push.push_id} to {push.repo_url}: {self.commits}"
         )
 
-        for commit in self.commits:
-            # We need to save the commit before we can associate files to it.
-            logger.debug(
-                f"Saving commit {commit.hash} for push {push.push_id} to {push.repo_url} ..."
-            )
-            commit.save()
-            push.commits.add(commit)
+        # Large pushes can touch tens of thousands of files, so commits, as well as
+        # their parents and files, are written in bulk rather than one by one.
+        logger.debug(
+            f"Saving {len(self.commits)} commits for push {push.push_id} to {push.repo_url} ..."
+        )
+        Commit.bulk_save(self.repo, self.commits)
+        Push.commits.through.objects.bulk_create(
+            [
+                Push.commits.through(push_id=push.id, commit_id=commit.id)
+                for commit in self.commits
+            ],
+            ignore_conflicts=True,
+        )
 
         for tag in self.tags:
             logger.debug(
@@ -123,15 +128,10 @@ class PushLog:
         self.push = push
         self.is_recorded = True
 
+        # The Pulse notification is sent by the `pulse_notify_pending` worker, so the
+        # landing doesn't wait on the broker.
         logger.info(f"Successfully saved {push}")
 
-        try:
-            # XXX: share this instance
-            notifier = PulseNotifier()
-            notifier.notify_push(push)
-        except Exception as exc:
-            logger.warning(f"Failed to notify push {push}: {exc}")
-
         return push
 
 
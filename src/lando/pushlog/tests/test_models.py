@@ -1,7 +1,8 @@
 import pytest
+from django.db import transaction
 from django.db.utils import IntegrityError
 
-from lando.pushlog.models import Commit, File, Tag
+from lando.pushlog.models import Commit, File, Push, PushIdCounter, Tag
 
 
 @pytest.mark.django_db()
@@ -212,3 +213,26 @@ def test__pushlog__models__Push(make_repo, make_commit, make_push):
     assert push12.push_id == 2, (
         "second push_id on first repository has changed on re-save"
     )
+
+
+@pytest.mark.django_db()
+def test__pushlog__models__PushIdCounter(make_repo, make_push):
+    repo = make_repo(1)
+
+    # Pushes recorded before the counter existed.
+    make_push(repo)
+    make_push(repo)
+    PushIdCounter.objects.filter(repo=repo).delete()
+
+    push = make_push(repo)
+    assert push.push_id == 3, "The counter should start after existing pushes."
+
+    with pytest.raises(RuntimeError), transaction.atomic():
+        rolled_back_push = make_push(repo)
+        assert rolled_back_push.push_id == 4
+        raise RuntimeError("Push failed")
+
+    push = make_push(repo)
+    assert push.push_id == 4, "The push_id of a rolled back push should be reused."
+    assert PushIdCounter.objects.get(repo=repo).last_push_id == 4
+    assert Push.objects.filter(repo=repo).count() == 4
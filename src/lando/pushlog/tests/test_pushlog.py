@@ -234,3 +234,50 @@ def test__pushlog__PushLog_tag_to_non_existent_commit(make_repo, make_scm_commit
     assert push.commits.count() == 0
     assert push.tags.count() == 1
     assert tag in push.tags.all()
+
+
+@pytest.mark.django_db()
+def test__pushlog__PushLog_bulk_record(
+    make_repo, make_scm_commit, django_assert_max_num_queries
+):
+    bulk_repo = make_repo(1)
+    serial_repo = make_repo(2)
+
+    scm_commits = [make_scm_commit(seqno) for seqno in range(1, 6)]
+    # A large commit, e.g. vendoring a library.
+    scm_commits[-1].files.extend(f"/vendor/file-{i}" for i in range(2000))
+
+    # Only the first commit already exists, with its files already known.
+    for repo in (bulk_repo, serial_repo):
+        Commit.from_scm_commit(repo, scm_commits[0]).save()
+
+    pushlog = PushLog(bulk_repo, "user@moz.test")
+    for scm_commit in scm_commits:
+        pushlog.add_commit(scm_commit)
+    pushlog.confirm()
+
+    with django_assert_max_num_queries(30):
+        push = pushlog.record_push()
+
+    for scm_commit in scm_commits[1:]:
+        Commit.from_scm_commit(serial_repo, scm_commit).save()
+
+    def commit_data(repo):
+        return [
+            (
+                commit.hash,
+                commit.author,
+                commit.datetime,
+                commit.desc,
+                sorted(commit.parents),
+                sorted(commit.files),
+            )
+            for commit in Commit.objects.filter(repo=repo)
+        ]
+
+    assert commit_data(bulk_repo) == commit_data(serial_repo), (
+        "Bulk recording should produce the same data as saving commits one by one."
+    )
+    assert list(push.commits.values_list("hash", flat=True)) == [
+        scm_commit.hash for scm_commit in scm_commits
+    ], "All commits should be associated to the push, in order."
@@ -0,0 +1,38 @@
+from io import StringIO
+from typing import Callable
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from lando.pushlog.models import Push
+
+
+@pytest.mark.django_db
+def test_pushlog_add_gap(make_push: Callable, make_repo: Callable):
+    repo = make_repo(1)
+    make_push(repo)
+
+    out = StringIO()
+    call_command("pushlog_add_gap", repo=repo.name, next_push_id=10, stdout=out)
+
+    assert f"Created Push with ID 9 for {repo.name}" in out.getvalue()
+    assert Push.objects.get(repo=repo, push_id=9).notified, (
+        "The stub push should not be sent to Pulse."
+    )
+    assert make_push(repo).push_id == 10, "The next push should follow the gap."
+    assert list(
+        Push.objects.filter(repo=repo)
+        .order_by("push_id")
+        .values_list("push_id", flat=True)
+    ) == [1, 9, 10]
+
+
+@pytest.mark.django_db
+def test_pushlog_add_gap_existing_pushes(make_push: Callable, make_repo: Callable):
+    repo = make_repo(1)
+    make_push(repo)
+    make_push(repo)
+
+    with pytest.raises(CommandError):
+        call_command("pushlog_add_gap", repo=repo.name, next_push_id=2)
@@ -0,0 +1,220 @@
+import json
+from typing import Callable
+from unittest import mock
+
+import pytest
+from django.contrib.auth.models import Permission
+from django.test import override_settings
+
+from lando.main.models import Repo, SCMType
+from lando.pushlog.models import Push
+
+
+def pushlog_json(response) -> dict:
+    return json.loads(b"".join(response.streaming_content))
+
+
+@pytest.fixture
+def pushes(make_commit: Callable, make_push: Callable, make_repo: Callable, make_tag):
+    repo = make_repo(1)
+    pushes = []
+    for seqno in range(1, 6):
+        commit = make_commit(repo, seqno)
+        if seqno > 1:
+            commit.add_parents([pushes[-1].commits.get().hash])
+        commit.add_files([f"file-{seqno}", "common-file"])
+        commit.save()
+
+        tags = [make_tag(repo, seqno, commit)] if seqno == 3 else []
+        pushes.append(make_push(repo, [commit], tags))
+
+    return pushes
+
+
+@pytest.mark.django_db
+def test_json_pushes_range(client, pushes: list[Push], django_assert_max_num_queries):
+    repo = pushes[0].repo
+
+    with django_assert_max_num_queries(10):
+        response = client.get(
+            f"/api/pushlog/{repo.name}/json-pushes",
+            {"version": 2, "startID": 1, "endID": 3},
+        )
+        data = pushlog_json(response)
+
+    assert response.status_code == 200
+    assert data["lastpushid"] == 5
+    assert list(data["pushes"]) == ["2", "3"], "startID should be exclusive."
+    assert data["pushes"]["2"] == {
+        "changesets": [pushes[1].commits.get().hash],
+        "date": int(pushes[1].datetime.timestamp()),
+        "user": pushes[1].user,
+    }
+    assert "immutable" not in response["Cache-Control"], (
+        "Version 2 responses include the changing lastpushid."
+    )
+
+    response = client.get(
+        f"/api/pushlog/{repo.name}/json-pushes", {"startID": 1, "endID": 3}
+    )
+    assert "immutable" in response["Cache-Control"], (
+        "Ranges of existing pushes should be cacheable."
+    )
+    assert "public" in response["Cache-Control"]
+
+
+@mock.patch("lando.pushlog.views.GitHubAPIClient")
+@pytest.mark.django_db
+def test_json_pushes_private_repo(
+    github_api_client, client, user, user_plaintext_password, make_push, make_commit
+):
+    github_api_client.return_value.repo_is_private = True
+    repo = Repo.objects.create(
+        name="private-repo",
+        scm_type=SCMType.GIT,
+        url="https://github.com/mozilla-conduit/private-repo",
+    )
+    make_push(repo, [make_commit(repo, 1)])
+    url = f"/api/pushlog/{repo.name}/json-pushes"
+
+    response = client.get(url, {"startID": 0, "endID": 1})
+    assert response.status_code == 404, "Private repos should be hidden."
+
+    user.user_permissions.add(Permission.objects.get(codename="can_view_private_repos"))
+    client.login(username=user.username, password=user_plaintext_password)
+    response = client.get(url, {"startID": 0, "endID": 1})
+
+    assert response.status_code == 200
+    assert list(pushlog_json(response)) == ["1"]
+    assert "private" in response["Cache-Control"], (
+        "Shared caches should not keep private pushes."
+    )
+    assert "public" not in response["Cache-Control"]
+
+
+@pytest.mark.django_db
+def test_json_pushes_full(client, pushes: list[Push]):
+    repo = pushes[0].repo
+    commit = pushes[2].commits.get()
+    parent = pushes[1].commits.get()
+
+    response = client.get(
+        f"/api/pushlog/{repo.name}/json-pushes",
+        {"fromchange": parent.hash, "tochange": commit.hash[:12], "full": 1},
+    )
+
+    assert response.status_code == 200
+    assert pushlog_json(response) == {
+        "3": {
+            "changesets": [
+                {
+                    "node": commit.hash,
+                    "author": commit.author,
+                    "desc": commit.desc,
+                    "branch": repo.default_branch,
+                    "tags": ["tag-3"],
+                    "files": ["common-file", "file-3"],
+                    "parents": [parent.hash],
+                }
+            ],
+            "date": int(pushes[2].datetime.timestamp()),
+            "user": pushes[2].user,
+        }
+    }
+
+
+@pytest.mark.django_db
+def test_json_pushes_not_full(client, pushes: list[Push]):
+    repo = pushes[0].repo
+    commit = pushes[2].commits.get()
+
+    response = client.get(
+        f"/api/pushlog/{repo.name}/json-pushes",
+        {"startID": 2, "endID": 3, "full": 0},
+    )
+
+    assert response.status_code == 200
+    assert pushlog_json(response)["3"]["changesets"] == [commit.hash], (
+        "full=0 should only return commit hashes."
+    )
+
+
+@pytest.mark.django_db
+def test_json_pushes_latest(client, pushes: list[Push]):
+    response = client.get(f"/api/pushlog/{pushes[0].repo.name}/json-pushes")
+
+    assert response.status_code == 200
+    assert list(pushlog_json(response)) == ["1", "2", "3", "4", "5"]
+    assert "no-cache" in response["Cache-Control"], (
+        "The latest pushes change as new pushes are recorded."
+    )
+
+
+@override_settings(PUSHLOG_API_MAX_PUSHES=2)
+@pytest.mark.django_db
+def test_json_pushes_pagination(client, pushes: list[Push]):
+    url = f"/api/pushlog/{pushes[0].repo.name}/json-pushes"
+
+    response = client.get(url, {"startID": 0, "endID": 4})
+    assert list(pushlog_json(response)) == ["1", "2"]
+    assert response["Link"] == f'<{url}?endID=4&startID=2>; rel="next"'
+
+    response = client.get(url, {"startID": 2, "endID": 4})
+    assert list(pushlog_json(response)) == ["3", "4"]
+    assert "Link" not in response, "The last page should not link to another."
+
+
+@pytest.mark.parametrize(
+    "params",
+    (
+        {"startID": "one"},
+        {"version": 3},
+        {"full": "yes"},
+        {"tochange": "0" * 40},
+    ),
+)
+@pytest.mark.django_db
+def test_json_pushes_invalid(client, pushes: list[Push], params: dict):
+    response = client.get(f"/api/pushlog/{pushes[0].repo.name}/json-pushes", params)
+
+    assert response.status_code == 400
+    assert "error" in response.json()
+
+
+@pytest.mark.django_db
+def test_json_pushes_unknown_repo(client):
+    response = client.get("/api/pushlog/unknown/json-pushes")
+
+    assert response.status_code == 404
+
+
+@pytest.mark.django_db
+def test_json_pushes_path(client, pushes: list[Push]):
+    url = f"/api/pushlog/{pushes[0].repo.name}/json-pushes"
+
+    response = client.get(url, {"path": "file-3"})
+    assert list(pushlog_json(response)) == ["3"], (
+        "Only pushes touching the path should be returned."
+    )
+
+    response = client.get(url, {"path": "common", "startID": 3})
+    assert list(pushlog_json(response)) == ["4", "5"], (
+        "Path prefixes should match, and be combinable with ranges."
+    )
+
+    response = client.get(url, {"path": "unknown/"})
+    assert pushlog_json(response) == {}
+
+
+@pytest.mark.django_db
+def test_Push_touching_path(pushes: list[Push]):
+    repo = pushes[0].repo
+    # Add a second commit touching `common-file` to the last push.
+    pushes[-1].commits.add(pushes[0].commits.get())
+
+    assert list(
+        Push.touching_path(repo, "common-file")
+        .order_by("push_id")
+        .values_list("push_id", flat=True)
+    ) == [1, 2, 3, 4, 5], "Each push should only be returned once."
+    assert list(Push.touching_path(repo, "file-5")) == [pushes[-1]]
@@ -113,3 +113,35 @@ def test_pushlog_view_filtering(
     assert str(push2) in output
     assert str(commit) not in output, "Commits found in --tags-only output."
     assert str(tag) in output
+
+
+@pytest.mark.django_db
+def test_pushlog_view_path(
+    make_commit: Callable,
+    make_push: Callable,
+    make_repo: Callable,
+) -> None:
+    repo = make_repo(1)
+    pushes = []
+    for seqno in range(1, 4):
+        commit = make_commit(repo, seqno)
+        commit.add_files([f"dir-{seqno % 2}/file-{seqno}"])
+        commit.save()
+        pushes.append(make_push(repo, [commit]))
+
+    out = StringIO()
+    call_command("pushlog_view", stdout=out, repo=repo.name, path="dir-1/")
+    output = out.getvalue()
+
+    assert str(pushes[0]) in output
+    assert str(pushes[1]) not in output, "Push not touching the path found in output."
+    assert str(pushes[2]) in output
+
+    out = StringIO()
+    call_command(
+        "pushlog_view", stdout=out, repo=repo.name, path="dir-1/", before=3, limit=1
+    )
+    output = out.getvalue()
+
+    assert str(pushes[0]) in output
+    assert str(pushes[2]) not in output, "Pushes after --before found in output."
@@ -0,0 +1,278 @@
+import json
+import logging
+from collections.abc import Iterator
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIRequest
+from django.db.models import Prefetch, QuerySet
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.utils.cache import patch_cache_control
+from django.views import View
+
+from lando.main.models import Repo
+from lando.main.scm import COMMIT_ID_HEX_LENGTH
+from lando.pushlog.models import Commit, Push
+from lando.utils.github import GitHubAPIClient
+
+logger = logging.getLogger(__name__)
+
+# Number of pushes loaded, with their commits, per query while streaming a response.
+PUSHES_BATCH_SIZE = 100
+
+# Number of pushes returned when no range is requested, as json-pushes does.
+DEFAULT_PUSHES_COUNT = 10
+
+
+class PushlogRequestError(Exception):
+    """The pushlog request parameters are invalid."""
+
+
+class JsonPushesView(View):
+    """Return pushes to a repository, in the format of HgMO's `json-pushes`.
+
+    Supported parameters are
+
+    - `startID` and `endID`: return pushes with `startID < push_id <= endID`,
+    - `fromchange` and `tochange`: return pushes after the one containing
+      `fromchange`, up to and including the one containing `tochange`,
+    - `version`: 1 (default) for a mapping of push_ids to pushes, or 2 to nest them
+      under `pushes` along with the `lastpushid`,
+    - `full`: `1` or `true` to return commit details rather than only their hashes,
+    - `path`: only return pushes with commits touching files whose names start with
+      `path`, i.e., that file or the files in that directory.
+
+    At most `PUSHLOG_API_MAX_PUSHES` pushes are returned. If more pushes match, a
+    `Link` header points to the next page, which starts after the last push in the
+    response.
+    """
+
+    def get(self, request: WSGIRequest, repo_name: str) -> HttpResponse:
+        try:
+            repo = Repo.objects.get(name=repo_name)
+        except Repo.DoesNotExist:
+            return JsonResponse(
+                {"error": f"Unknown repository {repo_name}"}, status=404
+            )
+
+        private = self._repo_is_private(repo)
+        if private and not request.user.has_perm("main.can_view_private_repos"):
+            return JsonResponse(
+                {"error": f"Unknown repository {repo_name}"}, status=404
+            )
+
+        pushes = Push.objects.filter(repo=repo)
+        last_push_id = (
+            pushes.order_by("-push_id").values_list("push_id", flat=True).first() or 0
+        )
+
+        try:
+            version = self._parse_version(request.GET.get("version", "1"))
+            full = self._parse_full(request.GET.get("full", ""))
+            start_id, end_id = self._parse_range(request, repo, pushes, last_push_id)
+        except PushlogRequestError as exc:
+            return JsonResponse({"error": str(exc)}, status=400)
+
+        if path := request.GET.get("path"):
+            pushes = Push.touching_path(repo, path)
+
+        # Keyset pagination: find the last push of this page, and only ever query
+        # pushes by their push_id range.
+        page_ids = list(
+            pushes.filter(push_id__gt=start_id, push_id__lte=end_id)
+            .order_by("push_id")
+            .values_list("push_id", flat=True)[
+                settings.PUSHLOG_API_MAX_PUSHES - 1 : settings.PUSHLOG_API_MAX_PUSHES
+                + 1
+            ]
+        )
+        page_end_id = page_ids[0] if page_ids else end_id
+
+        response = StreamingHttpResponse(
+            self._stream_pushes(
+                pushes, start_id, page_end_id, last_push_id, version, full
+            ),
+            content_type="application/json",
+        )
+
+        if len(page_ids) > 1:
+            params = request.GET.copy()
+            params.pop("fromchange", None)
+            params.pop("tochange", None)
+            params["startID"] = page_end_id
+            params["endID"] = end_id
+            response["Link"] = (
+                f'<{request.path}?{urlencode(sorted(params.items()))}>; rel="next"'
+            )
+
+        end_requested = "endID" in request.GET or "tochange" in request.GET
+        if version == 1 and end_requested and end_id <= last_push_id:
+            # Existing pushes never change, so the response can be cached for good.
+            # Version 2 responses include the `lastpushid`, which changes with every
+            # push. Responses for private repos are only cached by the client.
+            patch_cache_control(
+                response,
+                **({"private": True} if private else {"public": True}),
+                max_age=settings.PUSHLOG_API_CACHE_MAX_AGE,
+                immutable=True,
+            )
+        else:
+            patch_cache_control(response, no_cache=True)
+
+        return response
+
+    @staticmethod
+    def _repo_is_private(repo: Repo) -> bool:
+        """Return whether the repo is private.
+
+        Only GitHub repositories can be private. Like `PrivateRepoPermissionMixin`,
+        repos are considered private if this can't be determined.
+        """
+        if not repo.is_github:
+            return False
+
+        return GitHubAPIClient(repo.url).repo_is_private
+
+    @staticmethod
+    def _parse_version(value: str) -> int:
+        if value not in ("1", "2"):
+            raise PushlogRequestError(f"Unsupported version: {value}")
+        return int(value)
+
+    @staticmethod
+    def _parse_full(value: str) -> bool:
+        if value.lower() in ("", "0", "false"):
+            return False
+        if value.lower() in ("1", "true"):
+            return True
+        raise PushlogRequestError(f"Invalid full: {value}")
+
+    def _parse_range(
+        self, request: WSGIRequest, repo: Repo, pushes: QuerySet, last_push_id: int
+    ) -> tuple[int, int]:
+        """Return the requested (exclusive) start and (inclusive) end push_ids."""
+        start_id = self._push_id_param(request, repo, pushes, "startID", "fromchange")
+        end_id = self._push_id_param(request, repo, pushes, "endID", "tochange")
+
+        if start_id is None:
+            # Only default to the latest pushes if no other criteria were given.
+            start_id = (
+                max(last_push_id - DEFAULT_PUSHES_COUNT, 0)
+                if end_id is None and not request.GET.get("path")
+                else 0
+            )
+        if end_id is None:
+            end_id = last_push_id
+
+        return start_id, end_id
+
+    @staticmethod
+    def _push_id_param(
+        request: WSGIRequest,
+        repo: Repo,
+        pushes: QuerySet,
+        id_param: str,
+        change_param: str,
+    ) -> int | None:
+        """Return the push_id given directly, or that of the push containing a commit."""
+        if value := request.GET.get(id_param):
+            try:
+                return int(value)
+            except ValueError:
+                raise PushlogRequestError(f"Invalid {id_param}: {value}") from None
+
+        if commit_hash := request.GET.get(change_param):
+            # Full hashes are looked up exactly, abbreviated ones by prefix. Both are
+            # served by indexes on the commit's (repo, hash).
+            if len(commit_hash) == COMMIT_ID_HEX_LENGTH:
+                commits = {"commits__hash": commit_hash}
+            else:
+                commits = {"commits__hash__startswith": commit_hash}
+            push_ids = set(
+                pushes.filter(commits__repo=repo, **commits).values_list(
+                    "push_id", flat=True
+                )[:2]
+            )
+            if len(push_ids) != 1:
+                raise PushlogRequestError(
+                    f"Unknown or ambiguous {change_param}: {commit_hash}"
+                )
+            return push_ids.pop()
+
+        return None
+
+    def _stream_pushes(
+        self,
+        pushes: QuerySet,
+        start_id: int,
+        end_id: int,
+        last_push_id: int,
+        version: int,
+        full: bool,
+    ) -> Iterator[str]:
+        """Yield the JSON response, serialising a batch of pushes at a time."""
+        if version == 2:
+            yield f'{{"lastpushid": {last_push_id}, "pushes": {{'
+        else:
+            yield "{"
+
+        separator = ""
+        for push in self._iter_pushes(pushes, start_id, end_id):
+            yield f'{separator}"{push.push_id}": {json.dumps(self._serialize(push, full))}'
+            separator = ", "
+
+        yield "}}" if version == 2 else "}"
+
+    @staticmethod
+    def _iter_pushes(pushes: QuerySet, start_id: int, end_id: int) -> Iterator[Push]:
+        """Yield pushes in the range, prefetching their commits in bulk per batch."""
+        pushes = (
+            pushes.filter(push_id__lte=end_id)
+            .order_by("push_id")
+            .prefetch_related(
+                Prefetch(
+                    "commits",
+                    queryset=Commit.objects.order_by("id").prefetch_related(
+                        "_files", "_parents"
+                    ),
+                ),
+                "tags__commit",
+            )
+        )
+
+        last_id = start_id
+        while batch := list(pushes.filter(push_id__gt=last_id)[:PUSHES_BATCH_SIZE]):
+            yield from batch
+            if len(batch) < PUSHES_BATCH_SIZE:
+                break
+            last_id = batch[-1].push_id
+
+    @staticmethod
+    def _serialize(push: Push, full: bool) -> dict:
+        commits = push.commits.all()
+        data = {
+            "date": int(push.datetime.timestamp()),
+            "user": push.user,
+        }
+
+        if not full:
+            data["changesets"] = [commit.hash for commit in commits]
+            return data
+
+        tags = {}
+        for tag in push.tags.all():
+            tags.setdefault(tag.commit.hash, []).append(tag.name)
+
+        data["changesets"] = [
+            {
+                "node": commit.hash,
+                "author": commit.author,
+                "desc": commit.desc,
+                "branch": push.branch,
+                "tags": sorted(tags.get(commit.hash, [])),
+                "files": sorted(commit.files),
+                "parents": sorted(commit.parents),
+            }
+            for commit in commits
+        ]
+        return data
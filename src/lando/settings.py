@@ -266,6 +266,13 @@ OIDC_RP_SCOPES = "openid lando profile email"
 
 BUGZILLA_URL = os.getenv("BUGZILLA_URL", "http://bmo.test")
 BUGZILLA_API_KEY = os.getenv("BUGZILLA_API_KEY", "")
+# Number of seconds the visibility (public, private or nonexistent) of a bug is
+# cached for. Keep this short, as bugs can be made private at any time.
+BUGZILLA_VISIBILITY_CACHE_TIMEOUT = int(
+    os.getenv("BUGZILLA_VISIBILITY_CACHE_TIMEOUT", "300")
+)
+# Maximum number of bugs whose visibility is looked up concurrently.
+BUGZILLA_CONCURRENCY = int(os.getenv("BUGZILLA_CONCURRENCY", "8"))
 
 AUTHENTICATION_BACKENDS = [
     "django.contrib.auth.backends.ModelBackend",
@@ -283,6 +290,13 @@ STATIC_LINT_PATHS = (BASE_DIR.parent.parent,)
 PHABRICATOR_URL = os.getenv("PHABRICATOR_URL", "http://phabricator.test")
 PHABRICATOR_ADMIN_API_KEY = os.getenv("PHABRICATOR_ADMIN_API_KEY", "")
 PHABRICATOR_UNPRIVILEGED_API_KEY = os.getenv("PHABRICATOR_UNPRIVILEGED_API_KEY", "")
+# Maximum number of independent Conduit calls issued concurrently while
+# assessing a stack. Set to 1 to issue calls one after another.
+PHABRICATOR_CONDUIT_CONCURRENCY = int(os.getenv("PHABRICATOR_CONDUIT_CONCURRENCY", "8"))
+# Number of seconds a verified Phabricator API token identity is cached for.
+PHABRICATOR_TOKEN_CACHE_TIMEOUT = int(
+    os.getenv("PHABRICATOR_TOKEN_CACHE_TIMEOUT", "120")
+)
 
 TREEHERDER_URL = os.getenv("TREEHERDER_URL", "https://treeherder.mozilla.org")
 
@@ -294,6 +308,12 @@ WHATTRAINISITNOW_UPLIFT_TRAIN_API_URL = os.getenv(
     "https://whattrainisitnow.com/api/lando/uplift/train/",
 )
 
+# Number of seconds between CommitMap syncs from the HgMO pushlog (see the
+# `sync_commit_maps` command).
+COMMIT_MAP_SYNC_INTERVAL = int(os.getenv("COMMIT_MAP_SYNC_INTERVAL", "30"))
+# Number of full-hash CommitMap lookups cached in each process.
+COMMIT_MAP_LRU_SIZE = int(os.getenv("COMMIT_MAP_LRU_SIZE", "10000"))
+
 CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", "redis://lando.redis:6379")
 CELERY_RESULT_BACKEND = CELERY_BROKER_URL
 CELERY_ACCEPT_CONTENT = ["json"]
@@ -312,6 +332,17 @@ PULSE_QUEUE = os.getenv("PULSE_QUEUE", "queue/suite/git-hg-sync")
 # Note that the routing_key set on individual repos takes precedence.
 PULSE_ROUTING_KEY = os.getenv("PULSE_ROUTING_KEY", "gitpushes")
 PULSE_SSL = os.getenv("PULSE_SSL", True)
+# Number of seconds between checks for un-notified pushes (see the
+# `pulse_notify_pending` command).
+PULSE_NOTIFY_INTERVAL = int(os.getenv("PULSE_NOTIFY_INTERVAL", "5"))
+# Maximum number of pushes per repository notified in each check.
+PULSE_NOTIFY_BATCH_SIZE = int(os.getenv("PULSE_NOTIFY_BATCH_SIZE", "100"))
+
+# Maximum number of pushes returned by a single pushlog API (json-pushes) request.
+PUSHLOG_API_MAX_PUSHES = int(os.getenv("PUSHLOG_API_MAX_PUSHES", "1000"))
+# Number of seconds clients may cache pushlog API responses for ranges of pushes
+# which already exist, and therefore won't change.
+PUSHLOG_API_CACHE_MAX_AGE = int(os.getenv("PUSHLOG_API_CACHE_MAX_AGE", "86400"))
 
 LANDO_USER_NAME = os.getenv("LANDO_USER_NAME", "Lando")
 LANDO_USER_EMAIL = os.getenv("LANDO_USER_EMAIL", "lando@lando.test")
@@ -327,6 +358,9 @@ LANDING_WORKER_TARGET_SSH_PORT = os.getenv("LANDING_WORKER_TARGET_SSH_PORT", "22
 LANDING_WORKER_DEFAULT_GRACE_SECONDS = int(
     os.environ.get("DEFAULT_GRACE_SECONDS", 60 * 2)
 )
+# Number of processes the workers use to run per-patch landing checks. Checks on
+# large stacks are CPU-bound; 1 runs them serially in the worker process.
+LANDING_CHECKS_PROCESSES = int(os.getenv("LANDING_CHECKS_PROCESSES", "1"))
 
 EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
 
@@ -335,12 +369,39 @@ COMMITTER_EMAIL = os.getenv("LANDO_COMMITTER_EMAIL", LANDO_USER_EMAIL)
 
 GITHUB_APP_ID = os.getenv("GITHUB_APP_ID")
 GITHUB_APP_PRIVKEY = os.getenv("GITHUB_APP_PRIVKEY")
+# Maximum number of pull request attributes fetched, and checks evaluated,
+# concurrently when checking a pull request. Set to 1 to run them in order.
+GITHUB_CHECKS_CONCURRENCY = int(os.getenv("GITHUB_CHECKS_CONCURRENCY", "4"))
 
 HTTP_USER_AGENT = f"Lando/{version} ({ENVIRONMENT})"
 
+# Outbound HTTP connection pools (Phabricator, BMO, GitHub) are per process and
+# shared by the 8 uWSGI threads of a worker (see uwsgi.ini), one of which may fan
+# out concurrent requests to a service. The default pool size covers both.
+HTTP_POOL_MAXSIZE = int(
+    os.getenv(
+        "HTTP_POOL_MAXSIZE",
+        str(
+            7
+            + max(
+                BUGZILLA_CONCURRENCY,
+                PHABRICATOR_CONDUIT_CONCURRENCY,
+                GITHUB_CHECKS_CONCURRENCY,
+            )
+        ),
+    )
+)
+HTTP_RETRIES = int(os.getenv("HTTP_RETRIES", "3"))
+# Maximum number of seconds to wait before retrying a request, even if the upstream
+# asks for longer in a `Retry-After` header.
+HTTP_RETRY_AFTER_MAX = float(os.getenv("HTTP_RETRY_AFTER_MAX", "10"))
+# Default timeout, in seconds, for outbound HTTP requests.
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "60"))
+
 AUDITLOG_INCLUDE_ALL_MODELS = True
 AUDITLOG_EXCLUDE_TRACKING_MODELS = (
     "main.CommitMap",
+    "main.PatchBlob",
     "main.Revision",
     "pushlog",
     "headless_api.AutomationAction",
@@ -29,3 +29,6 @@ DEFAULT_FROM_EMAIL = "Lando <lando@lando.test>"
 EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
 
 LANDING_WORKER_DEFAULT_GRACE_SECONDS = 0
+
+# Don't keep CommitMap lookups across tests, which reuse the same hashes.
+COMMIT_MAP_LRU_SIZE = 0
@@ -4,7 +4,7 @@ from django.core.handlers.wsgi import WSGIRequest
 from django.db import IntegrityError
 from django.http import HttpResponseNotAllowed, JsonResponse
 
-from lando.main.auth import require_authenticated_user
+from lando.main.auth import forget_phabricator_token, require_authenticated_user
 from lando.main.models.profile import Profile
 from lando.ui.legacy.forms import UserSettingsForm
 from lando.utils.phabricator import get_phabricator_client
@@ -46,8 +46,10 @@ def manage_api_key(request: WSGIRequest) -> JsonResponse:
         return JsonResponse({"errors": form.errors}, status=400)
 
     profile = request.user.profile
+    previous_api_key = profile.phabricator_api_key
     if form.cleaned_data["reset_key"]:
         profile.clear_phabricator_elements()
+        forget_phabricator_token(previous_api_key)
     else:
         api_key = form.cleaned_data["phabricator_api_key"]
 
@@ -75,4 +77,7 @@ def manage_api_key(request: WSGIRequest) -> JsonResponse:
         except IntegrityError:
             return phid_conflict_response(phid)
 
+        # The previous key may have been revoked; stop accepting it.
+        forget_phabricator_token(previous_api_key)
+
     return JsonResponse({"success": True}, status=200)
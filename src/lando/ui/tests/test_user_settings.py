@@ -1,7 +1,9 @@
 import pytest
 from django.contrib.auth.models import User
-from django.test import Client
+from django.core.cache import cache
+from django.test import Client, override_settings
 
+from lando.main.auth import phabricator_token_cache_key
 from lando.main.models.profile import Profile
 
 VALID_API_KEY = "api-aaaaaaaaaaaaaaaaaaaaaaaaaaaa"
@@ -69,3 +71,34 @@ def test_manage_api_key_phid_conflict_returns_error(
             ]
         }
     }, "Response body should describe the PHID conflict."
+
+
+# Enable the local memory cache since we use the dummy cache in tests.
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "test-manage-api-key",
+        }
+    }
+)
+@pytest.mark.django_db(transaction=True)
+def test_manage_api_key_forgets_previous_key(
+    client: Client,
+    user,
+    phabdouble,
+):
+    """Changing the API key drops the cached identity of the previous key."""
+    cache.clear()
+    previous_key = "api-bbbbbbbbbbbbbbbbbbbbbbbbbbbb"
+    user.profile.save_phabricator_elements(previous_key)
+    cache.set(phabricator_token_cache_key(previous_key), {"phid": "PHID-USER-1"})
+    phabdouble.user(username="phab_user", api_key=VALID_API_KEY)
+
+    client.force_login(user)
+    response = post_api_key(client)
+
+    assert response.status_code == 200
+    assert cache.get(phabricator_token_cache_key(previous_key)) is None, (
+        "The previous key's verified identity should no longer be cached."
+    )
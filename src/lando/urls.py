@@ -27,12 +27,15 @@ from lando.api.views import (
     PullRequestChecksAPIView,
     PullRequestContentAPIView,
     PullRequestUpdateWebhook,
+    git2hgBulkCommitMapView,
     git2hgCommitMapView,
+    hg2gitBulkCommitMapView,
     hg2gitCommitMapView,
 )
 from lando.headless_api.api import (
     api as headless_api,
 )
+from lando.pushlog.views import JsonPushesView
 from lando.treestatus.api import treestatus_api
 from lando.treestatus.views import (
     TreestatusDashboardView,
@@ -104,6 +107,16 @@ urlpatterns += [
         LegacyDiffWarningView.as_view(),
         name="diff-warnings",
     ),
+    path(
+        "api/git2hg/<str:git_repo_name>",
+        git2hgBulkCommitMapView.as_view(),
+        name="git2hg-bulk",
+    ),
+    path(
+        "api/hg2git/<str:git_repo_name>",
+        hg2gitBulkCommitMapView.as_view(),
+        name="hg2git-bulk",
+    ),
     re_path(
         r"api/git2hg/(?P<git_repo_name>.*)/(?P<commit_hash>[0-9a-f]{7,40})",
         git2hgCommitMapView.as_view(),
@@ -116,6 +129,14 @@ urlpatterns += [
     ),
 ]
 
+urlpatterns += [
+    path(
+        "api/pushlog/<str:repo_name>/json-pushes",
+        JsonPushesView.as_view(),
+        name="pushlog-json-pushes",
+    ),
+]
+
 urlpatterns += [
     path(
         "api/pulls/<str:repo_name>/<int:pull_number>/landing_jobs",
@@ -1,6 +1,10 @@
 import functools
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
 from typing import (
     Callable,
+    Generic,
     TypeVar,
 )
 
@@ -8,6 +12,7 @@ from django.core.cache import caches
 
 # Generic type representing the content being cached.
 T = TypeVar("T")
+K = TypeVar("K", bound=Hashable)
 
 
 def cache_method(
@@ -44,3 +49,43 @@ def cache_method(
         return wrapper
 
     return decorator
+
+
+class LRUCache(Generic[K, T]):
+    """A thread-safe, process-local cache evicting least recently used entries.
+
+    Only suitable for values which never change once computed, as entries are
+    never invalidated across processes. A `maxsize` of 0 disables the cache.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[K, T] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> T | None:
+        """Return the value cached for `key`, if any, and mark it as recently used."""
+        with self._lock:
+            if key not in self._entries:
+                return None
+
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def set(self, key: K, value: T):
+        """Cache `value` for `key`, evicting the least recently used entries."""
+        if self.maxsize <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
@@ -7,8 +7,11 @@ import json
 import logging
 import math
 import re
-from collections import Counter
-from collections.abc import Callable, Iterator
+import threading
+import time
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from enum import Enum
 from itertools import count
@@ -16,16 +19,18 @@ from json.decoder import JSONDecodeError
 
 import requests
 from django.conf import settings
+from django.core.cache import cache
 from django.core.handlers.wsgi import WSGIRequest
 from django.http import HttpResponse
 from django.views import View
-from simple_github import AppAuth, AppInstallationAuth
+from simple_github import AppAuth
 from typing_extensions import override
 
 from lando.main.models.configuration import ConfigurationKey, ConfigurationVariable
 from lando.main.scm.helpers import PatchHelper, PatchHelperMetadata
 from lando.utils.cache import cache_method
 from lando.utils.const import URL_USERINFO_RE
+from lando.utils.http import create_session
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +40,94 @@ PR_DELIMITER = (
 )
 
 
+# Cached installation tokens are refreshed a little before GitHub's `expires_at`, so
+# they don't expire while in use.
+INSTALLATION_TOKEN_REFRESH_MARGIN = 5 * 60
+
+
+class InstallationTokenCache:
+    """Cache of GitHub App installation tokens, keyed by (owner, repo).
+
+    Tokens can push to their repo, so they are only kept in the memory of this
+    process, and never written to a shared cache. Only one thread per process mints
+    a token for a given repo at a time.
+    """
+
+    def __init__(self):
+        self._tokens: dict[tuple[str, str], dict] = {}
+        self._locks: defaultdict[tuple[str, str], threading.Lock] = defaultdict(
+            threading.Lock
+        )
+        self._locks_lock = threading.Lock()
+
+    @staticmethod
+    def key(owner: str, repo: str) -> tuple[str, str]:
+        return (owner.lower(), repo.lower())
+
+    @staticmethod
+    def is_fresh(entry: dict | None) -> bool:
+        return bool(entry) and entry["refresh_at"] > time.time()
+
+    def get_token(
+        self,
+        owner: str,
+        repo: str,
+        mint: Callable[[], tuple[str, datetime] | None],
+    ) -> str | None:
+        """Return a cached token for the repo, calling `mint` if there is none.
+
+        `mint` returns a new token and the time it expires at.
+        """
+        key = self.key(owner, repo)
+
+        entry = self._tokens.get(key)
+        if self.is_fresh(entry):
+            return entry["token"]
+
+        with self._locks_lock:
+            lock = self._locks[key]
+
+        with lock:
+            # Another thread may have minted a token meanwhile.
+            entry = self._tokens.get(key)
+            if self.is_fresh(entry):
+                return entry["token"]
+
+            minted = mint()
+            if not minted:
+                return None
+
+            token, expires_at = minted
+            self._tokens[key] = {
+                "token": token,
+                "refresh_at": expires_at.timestamp()
+                - INSTALLATION_TOKEN_REFRESH_MARGIN,
+            }
+            return token
+
+    def invalidate(self, owner: str, repo: str, token: str):
+        """Forget the token for the repo, e.g., after GitHub rejected it.
+
+        The cached token is only dropped if it is still `token`, so a token minted
+        by another thread meanwhile is kept.
+        """
+        key = self.key(owner, repo)
+        with self._locks_lock:
+            lock = self._locks[key]
+
+        with lock:
+            entry = self._tokens.get(key)
+            if entry and entry["token"] == token:
+                del self._tokens[key]
+
+    def clear(self):
+        """Forget all tokens held in memory by this process."""
+        self._tokens.clear()
+
+
+installation_tokens = InstallationTokenCache()
+
+
 class GitHub:
     """Work with authentication to GitHub repositories."""
 
@@ -86,7 +179,7 @@ class GitHub:
             return self.repo_url
 
         logger.info(
-            f"Obtaining fresh GitHub token for GitHub repo at {self.repo_url}",
+            f"Obtaining GitHub token for GitHub repo at {self.repo_url}",
         )
 
         token = self._fetch_token()
@@ -101,8 +194,20 @@ class GitHub:
         return self.repo_url
 
     def _fetch_token(self) -> str | None:
+        """Obtain a GitHub token to push to the specified repo.
+
+        Tokens are cached until shortly before they expire, see
+        `InstallationTokenCache`.
+        """
+        return installation_tokens.get_token(
+            self.repo_owner, self.repo_name, self._mint_token
+        )
+
+    def _mint_token(self) -> tuple[str, datetime] | None:
         """Obtain a fresh GitHub token to push to the specified repo.
 
+        Returns the token and the time it expires at.
+
         This relies on GITHUB_APP_ID and GITHUB_APP_PRIVKEY to be set in the
         environment. Returns None if those are missing.
 
@@ -118,19 +223,43 @@ class GitHub:
             )
             return None
 
-        app_auth = AppAuth(
-            app_id,
-            private_key,
+        app_jwt = asyncio.run(AppAuth(app_id, private_key).get_token())
+        session = create_session(
+            "github",
+            headers={
+                "Authorization": f"Bearer {app_jwt}",
+                "Accept": "application/vnd.github+json",
+                "X-GitHub-Api-Version": "2022-11-28",
+            },
         )
-        session = AppInstallationAuth(
-            app_auth, self.repo_owner, repositories=[self.repo_name]
+
+        base_url = GitHubAPI.GITHUB_BASE_URL
+        response = session.get(
+            f"{base_url}/repos/{self.repo_owner}/{self.repo_name}/installation"
+        )
+        response.raise_for_status()
+        installation_id = response.json()["id"]
+
+        # Only request access to the current repo.
+        response = session.post(
+            f"{base_url}/app/installations/{installation_id}/access_tokens",
+            json={"repositories": [self.repo_name]},
         )
-        return asyncio.run(self._async_get_token(session))
+        response.raise_for_status()
+        data = response.json()
 
-    async def _async_get_token(self, session: AppInstallationAuth) -> str:
-        token = await session.get_token()
-        await session.close()
-        return token
+        return data["token"], datetime.fromisoformat(data["expires_at"])
+
+
+# Cached GitHub API responses are revalidated with conditional requests, so
+# the timeout only bounds how long unused responses are kept.
+GITHUB_HTTP_CACHE_TIMEOUT = 24 * 60 * 60
+
+# Larger responses, such as the diffs of big pull requests, aren't cached.
+GITHUB_HTTP_CACHE_MAX_SIZE = 5 * 1024 * 1024
+
+# Warn when less than this proportion of the rate limit is left.
+RATE_LIMIT_WARNING_RATIO = 0.1
 
 
 class GitHubAPI(GitHub):
@@ -138,35 +267,206 @@ class GitHubAPI(GitHub):
 
     session: requests.Session
 
+    # The most recent rate limit reported by GitHub, if any.
+    rate_limit: dict | None = None
+
     GITHUB_BASE_URL = "https://api.github.com"
 
     def __init__(self, repo_url: str):
         super().__init__(repo_url)
 
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "Authorization": f"Bearer {self._fetch_token()}",
-                "User-Agent": settings.HTTP_USER_AGENT,
+        self.token = self._fetch_token()
+        self.session = create_session(
+            "github",
+            headers={
+                "Authorization": f"Bearer {self.token}",
                 "Accept": "application/vnd.github+json",
                 "X-GitHub-Api-Version": "2022-11-28",
-            }
+            },
         )
 
+    def _request(self, method: str, url: str, *args, **kwargs) -> requests.Response:
+        """Send a request, minting a new token once if GitHub rejects ours.
+
+        Installation tokens can be revoked before they expire, e.g. when the app's
+        permissions change.
+        """
+        response = self.session.request(method, url, *args, **kwargs)
+        if response.status_code != 401 or self.userinfo or not self.token:
+            return response
+
+        installation_tokens.invalidate(self.repo_owner, self.repo_name, self.token)
+        self.token = self._fetch_token()
+        if not self.token:
+            return response
+
+        self.session.headers["Authorization"] = f"Bearer {self.token}"
+        return self.session.request(method, url, *args, **kwargs)
+
     def get(self, path: str, *args, **kwargs) -> requests.Response:
-        """Send a GET request to the GitHub API with given args and kwargs."""
+        """Send a GET request to the GitHub API with given args and kwargs.
+
+        Responses with an `ETag` or `Last-Modified` header are kept in the
+        `default` cache, and later requests for the same URL are made
+        conditional. A `304 Not Modified` response is answered from the cache,
+        and doesn't count against the rate limit.
+        """
         url = f"{self.GITHUB_BASE_URL}/{path}"
-        return self.session.get(url, *args, **kwargs)
+        headers = dict(kwargs.pop("headers", None) or {})
+        cache_key = self._http_cache_key(url, headers, kwargs.get("params"))
+
+        cached = cache.get(cache_key)
+        if cached:
+            if cached["etag"]:
+                headers["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        response = self._request("GET", url, *args, headers=headers, **kwargs)
+        self._update_rate_limit(response)
+
+        if cached and response.status_code == 304:
+            return self._response_from_cache(response, cached)
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if (
+            response.status_code == 200
+            and (etag or last_modified)
+            and len(response.content) <= GITHUB_HTTP_CACHE_MAX_SIZE
+        ):
+            cache.set(
+                cache_key,
+                {
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "content_type": response.headers.get("content-type"),
+                    "content": response.content,
+                    "encoding": response.encoding,
+                },
+                GITHUB_HTTP_CACHE_TIMEOUT,
+            )
+
+        return response
+
+    def _http_cache_key(self, url: str, headers: dict, params: dict | None) -> str:
+        """Return the HTTP cache key for a GET request.
+
+        Representations vary by `Accept` header (e.g. diffs and patches of the
+        same pull request), so it is part of the key.
+        """
+        accept = headers.get("Accept", self.session.headers.get("Accept"))
+        request = json.dumps([url, accept, params], sort_keys=True, default=str)
+        digest = hashlib.sha256(request.encode("utf-8")).hexdigest()
+        return f"github_http_{digest}"
+
+    @staticmethod
+    def _response_from_cache(
+        not_modified: requests.Response, cached: dict
+    ) -> requests.Response:
+        """Build a `200` response for a `304` from the cached representation."""
+        response = requests.Response()
+        response.status_code = 200
+        response.url = not_modified.url
+        response.request = not_modified.request
+        response.headers = not_modified.headers.copy()
+        if cached["content_type"]:
+            response.headers["content-type"] = cached["content_type"]
+        response._content = cached["content"]
+        response.encoding = cached["encoding"]
+        return response
+
+    def _update_rate_limit(self, response: requests.Response):
+        """Record the rate limit reported in the response headers."""
+        headers = response.headers
+        if "X-RateLimit-Remaining" not in headers:
+            return
+
+        try:
+            self.rate_limit = {
+                "resource": headers.get("X-RateLimit-Resource", "core"),
+                "limit": int(headers.get("X-RateLimit-Limit", 0)),
+                "remaining": int(headers["X-RateLimit-Remaining"]),
+                "reset": int(headers.get("X-RateLimit-Reset", 0)),
+            }
+        except ValueError:
+            return
+
+        limit = self.rate_limit["limit"]
+        if limit and self.rate_limit["remaining"] < limit * RATE_LIMIT_WARNING_RATIO:
+            logger.warning(
+                "GitHub API rate limit is running low",
+                extra={"repo_url": self.repo_url, **self.rate_limit},
+            )
 
     def post(self, path: str, *args, **kwargs) -> requests.Response:
         """Send a POST request to the GitHub API with given args and kwargs."""
         url = f"{self.GITHUB_BASE_URL}/{path}"
-        return self.session.post(url, *args, **kwargs)
+        return self._request("POST", url, *args, **kwargs)
 
     def patch(self, path: str, *args, **kwargs) -> requests.Response:
         """Send a PATCH request to the GitHub API with given args and kwargs."""
         url = f"{self.GITHUB_BASE_URL}/{path}"
-        return self.session.patch(url, *args, **kwargs)
+        return self._request("PATCH", url, *args, **kwargs)
+
+
+# Everything `PullRequestChecks` needs beyond the pull request itself. See
+# `GitHubAPIClient.get_pull_request_check_data`.
+PULL_REQUEST_CHECK_DATA_QUERY = """
+  query($owner: String!, $repo: String!, $number: Int!) {
+    repository(owner: $owner, name: $repo) {
+      pullRequest(number: $number) {
+        updatedAt
+        commits(first: 100) {
+          pageInfo { hasNextPage }
+          nodes {
+            commit {
+              oid
+              message
+              author { name email date }
+              committer { name email date }
+            }
+          }
+        }
+        reviews(first: 100) {
+          pageInfo { hasNextPage }
+          nodes {
+            databaseId
+            author { login }
+            state
+            body
+            submittedAt
+            commit { oid }
+          }
+        }
+        comments(first: 100) {
+          pageInfo { hasNextPage }
+          nodes {
+            databaseId
+            author { login }
+            body
+            url
+            updatedAt
+          }
+        }
+        reviewThreads(first: 100) {
+          pageInfo { hasNextPage }
+          nodes {
+            comments(first: 1) {
+              nodes {
+                id
+                body
+                url
+                updatedAt
+              }
+            }
+            isResolved
+          }
+        }
+      }
+    }
+  }
+  """
 
 
 class GitHubAPIClient:
@@ -338,35 +638,94 @@ class GitHubAPIClient:
             }
           }
           """
-        comments_response = self.session.post(
-            "https://api.github.com/graphql",
-            json={
-                "query": comments_query,
-                "variables": {
-                    "owner": self.repo_owner,
-                    "repo": self.repo_name,
-                    "number": pull_number,
+        pull_request = self._graphql(
+            comments_query,
+            {"owner": self.repo_owner, "repo": self.repo_name, "number": pull_number},
+        )["repository"]["pullRequest"]
+
+        return self._review_threads_to_comments(pull_request["reviewThreads"]["nodes"])
+
+    def get_pull_request_check_data(self, pull_number: int) -> dict[str, list]:
+        """Fetch the data pull request checks need with a single GraphQL query.
+
+        Returns a dict with `commits`, `reviews`, `comments` and `commit_comments`
+        in the same shape as the matching `get_pull_request_*` methods. Lists
+        which didn't fit in a single page are left out, so callers fall back to
+        the REST API for them.
+        """
+        pull_request = self._graphql(
+            PULL_REQUEST_CHECK_DATA_QUERY,
+            {"owner": self.repo_owner, "repo": self.repo_name, "number": pull_number},
+        )["repository"]["pullRequest"]
+
+        def login(node: dict) -> str | None:
+            return (node["author"] or {}).get("login")
+
+        converters = {
+            "commits": lambda node: {
+                "sha": node["commit"]["oid"],
+                "commit": {
+                    "author": node["commit"]["author"],
+                    "committer": node["commit"]["committer"],
+                    "message": node["commit"]["message"],
                 },
             },
+            "reviews": lambda node: {
+                "id": node["databaseId"],
+                "user": {"login": login(node)},
+                "state": node["state"],
+                "body": node["body"],
+                "commit_id": (node["commit"] or {}).get("oid"),
+                "submitted_at": node["submittedAt"],
+            },
+            "comments": lambda node: {
+                "id": node["databaseId"],
+                "user": {"login": login(node)},
+                "body": node["body"],
+                "html_url": node["url"],
+                "updated_at": node["updatedAt"],
+            },
+        }
+
+        data = {}
+        for key, convert in converters.items():
+            connection = pull_request[key]
+            if not connection["pageInfo"]["hasNextPage"]:
+                data[key] = [convert(node) for node in connection["nodes"]]
+
+        # Pending reviews aren't returned by the REST API.
+        if "reviews" in data:
+            data["reviews"] = [r for r in data["reviews"] if r["submitted_at"]]
+
+        threads = pull_request["reviewThreads"]
+        if not threads["pageInfo"]["hasNextPage"]:
+            data["commit_comments"] = self._review_threads_to_comments(threads["nodes"])
+
+        return data
+
+    def _graphql(self, query: str, variables: dict) -> dict:
+        """Run a GraphQL query and return its `data`."""
+        response = self._request(
+            "POST",
+            f"{self.GITHUB_BASE_URL}/graphql",
+            json={"query": query, "variables": variables},
         )
-        comments_response.raise_for_status()
-        comments_response_json = comments_response.json()
-        if "errors" in comments_response_json:
-            raise self.UpstreamError(
-                f"Error from GitHub GraphQL: {comments_response_json}"
-            )
+        response.raise_for_status()
+        response_json = response.json()
+        if "errors" in response_json:
+            raise self.UpstreamError(f"Error from GitHub GraphQL: {response_json}")
 
-        comments_dict = comments_response_json["data"]["repository"]["pullRequest"][
-            "reviewThreads"
-        ]["nodes"]
+        return response_json["data"]
 
+    @staticmethod
+    def _review_threads_to_comments(threads: list[dict]) -> list[dict]:
+        """Return the first comment of each review thread, with its resolution."""
         comments = []
 
-        for thread in comments_dict:
+        for thread in threads:
             # We only grab the first comment of each thread.
-            comment = thread["comments"]["nodes"][0]
-            comment["updated_at"] = comment["updatedAt"]
-            del comment["updatedAt"]
+            comment = dict(thread["comments"]["nodes"][0])
+            comment["updated_at"] = comment.pop("updatedAt")
             comment["is_resolved"] = thread["isResolved"]
 
             comments.append(comment)
@@ -495,6 +854,9 @@ class PullRequest:
     def __init__(self, client: GitHubAPIClient, data: dict):
         self.client = client
 
+        # Data fetched ahead of time by `prefetch_check_data` and `prefetch`.
+        self._prefetched = {}
+
         self.url = data["url"]
         self.base_ref = data["base"]["ref"]  # "target" branch name
         self.base_sha = data["base"]["sha"]  # "target" branch sha
@@ -545,6 +907,42 @@ class PullRequest:
         self.user_html_url = data["user"]["html_url"]
         self.user_login = data["user"]["login"]
 
+    def prefetch_check_data(self):
+        """Fetch the commits, reviews and comments checks need in one request.
+
+        Properties which weren't prefetched, or if prefetching fails, are
+        fetched from the REST API when first accessed.
+        """
+        try:
+            self._prefetched = self.client.get_pull_request_check_data(self.number)
+        except (requests.RequestException, GitHubAPIClient.UpstreamError) as exc:
+            logger.warning(f"Couldn't prefetch check data for {self}: {exc}")
+
+    def prefetch(self, attributes: Iterable[str], *, max_workers: int = 1):
+        """Concurrently fetch lazy `attributes` which weren't prefetched yet.
+
+        Failures are only logged, so the error is raised again when the
+        attribute is accessed, as if it hadn't been prefetched.
+        """
+        missing = sorted(set(attributes) - self._prefetched.keys())
+        if not missing:
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(missing))),
+            thread_name_prefix="github",
+        ) as executor:
+            futures = {
+                attribute: executor.submit(getattr, self, attribute)
+                for attribute in missing
+            }
+
+        for attribute, future in futures.items():
+            try:
+                self._prefetched[attribute] = future.result()
+            except Exception as exc:
+                logger.warning(f"Couldn't prefetch {attribute} for {self}: {exc}")
+
     def _select_commit_author(
         self, commits: list[dict]
     ) -> tuple[str | None, str | None]:
@@ -572,7 +970,9 @@ class PullRequest:
     @property
     @pr_cache_method
     def comments(self) -> list:
-        comments = self.client.get_pull_request_comments(self.number)
+        comments = self._prefetched.get("comments")
+        if comments is None:
+            comments = self.client.get_pull_request_comments(self.number)
         if any(
             self.client.convert_timestamp_from_github(comment["updated_at"])
             > self.client.convert_timestamp_from_github(self.updated_at)
@@ -587,7 +987,9 @@ class PullRequest:
     @property
     @pr_cache_method
     def commits(self) -> list[dict]:
-        commits = self.client.get_pull_request_commits(self.number)
+        commits = self._prefetched.get("commits")
+        if commits is None:
+            commits = self.client.get_pull_request_commits(self.number)
 
         if commits[-1]["sha"] != self.head_sha:
             raise self.StaleMetadataException(
@@ -613,7 +1015,11 @@ class PullRequest:
     @pr_cache_method
     def commit_comments(self) -> list:
         """Return a list of comments on specific changes of the PR."""
-        commits_comments = self.client.get_pull_request_commits_comments(self.number)
+        commits_comments = self._prefetched.get("commit_comments")
+        if commits_comments is None:
+            commits_comments = self.client.get_pull_request_commits_comments(
+                self.number
+            )
 
         if any(
             self.client.convert_timestamp_from_github(comment["updated_at"])
@@ -649,7 +1055,9 @@ class PullRequest:
     @pr_cache_method
     def reviews(self) -> list:
         """Return a list of reviews for the PR."""
-        reviews = self.client.get_pull_request_reviews(self.number)
+        reviews = self._prefetched.get("reviews")
+        if reviews is None:
+            reviews = self.client.get_pull_request_reviews(self.number)
 
         if any(
             self.client.convert_timestamp_from_github(review["submitted_at"])
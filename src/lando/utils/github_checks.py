@@ -1,6 +1,7 @@
 import logging
 from abc import ABC, abstractmethod
-from typing import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import ClassVar, Iterable
 
 from django.http import HttpRequest
 from typing_extensions import override
@@ -15,6 +16,17 @@ logger = logging.getLogger("__name__")
 
 
 class PullRequestCheck(Check, ABC):
+    """A check of a GitHub pull request.
+
+    Checks list the lazily fetched `PullRequest` attributes they use in
+    `pull_request_attributes`, so they can be fetched concurrently ahead of
+    time. Checks querying the database set `uses_database`, and are always
+    evaluated in the requesting thread.
+    """
+
+    pull_request_attributes: ClassVar[tuple[str, ...]] = ()
+    uses_database: ClassVar[bool] = False
+
     @classmethod
     @abstractmethod
     def run(
@@ -38,6 +50,8 @@ class PullRequestBlocker(PullRequestCheck, ABC):
 class PullRequestUserSCMLevelBlocker(PullRequestBlocker):
     """You have insufficient permissions to land or your access has expired."""
 
+    uses_database = True
+
     @override
     @classmethod
     def name(cls) -> str:
@@ -95,6 +109,8 @@ class PullRequestDiffAuthorIsKnownBlocker(PullRequestBlocker):
     # """"Diff does not have proper author information in Phabricator."""
     """Commit does not have proper author information."""
 
+    pull_request_attributes = ("commits",)
+
     @override
     @classmethod
     def name(cls) -> str:
@@ -336,6 +352,8 @@ class PullRequestBlockingReviewersWarning(PullRequestWarning):
 class PullRequestBlockingReviewsWarning(PullRequestWarning):
     """Has a review intended to block landing."""
 
+    pull_request_attributes = ("reviews",)
+
     @override
     @classmethod
     def name(cls) -> str:
@@ -374,6 +392,8 @@ class PullRequestBlockingReviewsWarning(PullRequestWarning):
 class PullRequestPreviouslyLandedWarning(PullRequestWarning):
     """Has previously landed."""
 
+    uses_database = True
+
     @override
     @classmethod
     def name(cls) -> str:
@@ -403,6 +423,8 @@ class PullRequestPreviouslyLandedWarning(PullRequestWarning):
 class PullRequestNotAcceptedWarning(PullRequestWarning):
     """Is not Accepted."""
 
+    pull_request_attributes = ("reviews",)
+
     @override
     @classmethod
     def name(cls) -> str:
@@ -432,6 +454,8 @@ class PullRequestNotAcceptedWarning(PullRequestWarning):
 class PullRequestReviewsNotCurrentWarning(PullRequestWarning):
     """No reviewer has accepted the current diff."""
 
+    pull_request_attributes = ("reviews",)
+
     @override
     @classmethod
     def name(cls) -> str:
@@ -529,6 +553,8 @@ class PullRequestWIPWarning(PullRequestWarning):
 class PullRequestUnresolvedCommentsWarning(PullRequestWarning):
     """Pull request has unresolved comments."""
 
+    pull_request_attributes = ("commit_comments",)
+
     @override
     @classmethod
     def name(cls) -> str:
@@ -562,6 +588,8 @@ class PullRequestUnresolvedCommentsWarning(PullRequestWarning):
 class PullRequestMultipleAuthorsWarning(PullRequestWarning):
     """Pull request has multiple authors."""
 
+    pull_request_attributes = ("commits",)
+
     @override
     @classmethod
     def name(cls) -> str:
@@ -606,36 +634,78 @@ ALL_PULL_REQUEST_CHECKS = ALL_PULL_REQUEST_BLOCKERS + ALL_PULL_REQUEST_WARNINGS
 
 
 class PullRequestChecks:
-    """Utility class to check a GitHub pull request for a given list of issues."""
+    """Utility class to check a GitHub pull request for a given list of issues.
+
+    With `max_workers` above 1, the pull request attributes needed by the checks
+    are fetched concurrently first, then checks are evaluated in parallel.
+    """
 
     _client: GitHubAPIClient
     _request: HttpRequest
     _target_repo: Repo
+    _max_workers: int
 
     def __init__(
         self,
         client: GitHubAPIClient,
         target_repo: Repo,
         request: HttpRequest,
+        max_workers: int = 1,
     ):
         self._client = client
         self._target_repo = target_repo
         self._request = request
+        self._max_workers = max_workers
 
     def run(self, checks_list: list[str], pull_request: PullRequest) -> list[str]:
-        messages = []
+        checks = [chk for chk in ALL_PULL_REQUEST_CHECKS if chk.name() in checks_list]
 
-        for check in [
-            chk for chk in ALL_PULL_REQUEST_CHECKS if chk.name() in checks_list
-        ]:
-            try:
-                if outcome := check.run(pull_request, self._target_repo, self._request):
-                    messages.extend(outcome)
-            except NotImplementedError:
-                messages.append(f"{check.name()} is not implemented")
+        if self._max_workers <= 1:
+            outcomes = [self._run_check(check, pull_request) for check in checks]
+        else:
+            pull_request.prefetch(
+                {
+                    attribute
+                    for check in checks
+                    for attribute in check.pull_request_attributes
+                },
+                max_workers=self._max_workers,
+            )
 
-            except Exception as exc:
-                logger.exception(exc)
-                messages.append(f"{check.name()} failed to run with error: {exc}")
+            # Database connections are per thread, so checks querying the
+            # database are evaluated here while the others run in the pool.
+            with ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="pr-checks"
+            ) as executor:
+                futures = {
+                    check: executor.submit(self._run_check, check, pull_request)
+                    for check in checks
+                    if not check.uses_database
+                }
+                local_outcomes = {
+                    check: self._run_check(check, pull_request)
+                    for check in checks
+                    if check.uses_database
+                }
 
-        return messages
+            outcomes = [
+                local_outcomes[check]
+                if check.uses_database
+                else futures[check].result()
+                for check in checks
+            ]
+
+        return [message for outcome in outcomes for message in outcome]
+
+    def _run_check(
+        self, check: type[PullRequestCheck], pull_request: PullRequest
+    ) -> list[str]:
+        """Run `check`, returning an error message rather than raising."""
+        try:
+            return check.run(pull_request, self._target_repo, self._request) or []
+        except NotImplementedError:
+            return [f"{check.name()} is not implemented"]
+
+        except Exception as exc:
+            logger.exception(exc)
+            return [f"{check.name()} failed to run with error: {exc}"]
@@ -0,0 +1,119 @@
+"""Pooled HTTP sessions for outbound integrations (Phabricator, BMO, GitHub).
+
+Each integration shares a single `PooledHTTPAdapter` per process, so keep-alive
+connections are reused across requests and threads instead of paying for TCP
+and TLS setup on every client. Sessions themselves are cheap and are still
+created per client, so headers such as credentials are never shared.
+"""
+
+import functools
+import logging
+import time
+from urllib.parse import urlsplit
+
+import requests
+from datadog import statsd
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from typing_extensions import override
+from urllib3.response import BaseHTTPResponse
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# Transient upstream failures worth retrying. Retries on these statuses only
+# apply to idempotent methods (see `Retry.DEFAULT_ALLOWED_METHODS`).
+RETRY_STATUSES = (429, 502, 503, 504)
+
+
+class CappedRetry(Retry):
+    """A `Retry` which waits at most `HTTP_RETRY_AFTER_MAX` seconds for `Retry-After`.
+
+    Otherwise, an upstream could hold a request thread for as long as it asks.
+    """
+
+    @override
+    def get_retry_after(self, response: BaseHTTPResponse) -> float | None:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, settings.HTTP_RETRY_AFTER_MAX)
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """An `HTTPAdapter` with a default timeout which reports request latency."""
+
+    def __init__(self, service: str, *args, timeout: float | None = None, **kwargs):
+        self.service = service
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(
+        self, request: requests.PreparedRequest, *args, **kwargs
+    ) -> requests.Response:
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+
+        host = urlsplit(request.url).hostname or ""
+        start = time.monotonic()
+        error = True
+        try:
+            response = super().send(request, *args, **kwargs)
+            error = response.status_code >= 500
+            return response
+        finally:
+            elapsed = time.monotonic() - start
+            tags = [f"service:{self.service}", f"host:{host}"]
+            statsd.timing("lando-api.http.request_time", elapsed * 1000, tags=tags)
+            if error:
+                statsd.increment("lando-api.http.request_errors", tags=tags)
+            logger.debug(
+                "outbound http request",
+                extra={
+                    "host": host,
+                    "method": request.method,
+                    "elapsed_ms": round(elapsed * 1000),
+                    "error": error,
+                },
+            )
+
+
+@functools.cache
+def get_http_adapter(service: str) -> PooledHTTPAdapter:
+    """Return the process-wide adapter for the named outbound service.
+
+    `service` distinguishes pools, and tags their metrics; all services share the
+    pool settings `HTTP_POOL_MAXSIZE`, `HTTP_RETRIES`, `HTTP_RETRY_AFTER_MAX` and
+    `HTTP_TIMEOUT`.
+    """
+    retries = CappedRetry(
+        total=settings.HTTP_RETRIES,
+        backoff_factor=0.5,
+        status_forcelist=RETRY_STATUSES,
+        raise_on_status=False,
+        respect_retry_after_header=True,
+    )
+    return PooledHTTPAdapter(
+        service,
+        pool_connections=settings.HTTP_POOL_MAXSIZE,
+        pool_maxsize=settings.HTTP_POOL_MAXSIZE,
+        max_retries=retries,
+        timeout=settings.HTTP_TIMEOUT,
+    )
+
+
+def create_session(service: str, headers: dict | None = None) -> requests.Session:
+    """Return a new `requests.Session` using the pooled adapter for `service`.
+
+    Sessions shouldn't be closed, since closing a session closes the
+    connections in its adapter's pool.
+    """
+    adapter = get_http_adapter(service)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"User-Agent": settings.HTTP_USER_AGENT})
+    if headers:
+        session.headers.update(headers)
+    return session
@@ -1,15 +1,27 @@
+import atexit
+import functools
+import hashlib
+import io
+import multiprocessing
 import re
+import threading
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
+from typing import ClassVar
 
+import django
 import requests
-import rs_parsepatch
+from django.conf import settings
+from django.core.cache import cache
 from typing_extensions import override
 
 from lando.api.legacy.bmo import (
-    get_status_code_for_bug,
-    search_bugs,
+    BugVisibility,
+    get_bug_visibility,
 )
 from lando.api.legacy.commit_message import (
     ACCEPTABLE_MESSAGE_FORMAT_RES,
@@ -21,6 +33,10 @@ from lando.api.legacy.commit_message import (
     parse_bugs,
 )
 from lando.main.scm.helpers import PatchHelper
+from lando.utils.parsed_diffs import get_parsed_diff, hash_diff
+
+# Default duration, in seconds, for which landing check results are memoized.
+CHECK_RESULT_MEMO_TIMEOUT = 24 * 60 * 60
 
 
 def wrap_filenames(filenames: list[str]) -> str:
@@ -28,9 +44,32 @@ def wrap_filenames(filenames: list[str]) -> str:
     return ",".join(f"`{filename}`" for filename in filenames)
 
 
+def hash_check_inputs(*inputs: str | None) -> str:
+    """Return a hex SHA-256 digest identifying the given check inputs."""
+    digest = hashlib.sha256()
+    for value in inputs:
+        # Distinguish `None` from the empty string, and separate each input.
+        digest.update(
+            b"\x01"
+            if value is None
+            else b"\x00" + value.encode("utf-8", errors="surrogateescape")
+        )
+        digest.update(b"\xff")
+    return digest.hexdigest()
+
+
 @dataclass
 class Check(ABC):
-    """A base class for checks, providing human-friendly identification attributes."""
+    """A base class for checks, providing human-friendly identification attributes.
+
+    Check results are memoized in the shared cache (see `CheckResultMemo`), keyed
+    on the check's `name` and `version` and on its inputs. Bump `version` when
+    changing what a check reports. Checks depending on external state should set
+    `memo_timeout` to a short duration, or to 0 to disable memoization.
+    """
+
+    version: ClassVar[int] = 1
+    memo_timeout: ClassVar[int | None] = CHECK_RESULT_MEMO_TIMEOUT
 
     @classmethod
     @abstractmethod
@@ -49,6 +88,67 @@ class Check(ABC):
         """Human-friendly description for this check."""
 
 
+class CheckResultMemo:
+    """Memoize the results of deterministic landing checks in the shared cache.
+
+    Results are stored per check name and version, `inputs_hash` (a digest of
+    everything the checks inspect), and repository. This lets the stack page,
+    the dryrun, the Try API and the workers reuse each other's results.
+
+    For `PatchCheck`s, `inputs_hash` identifies the diff, and the patch `metadata`
+    is only part of the key as far as each check inspects it (see
+    `PatchCheck.memo_inputs`). Checks of the diff alone therefore share results
+    between the stack page, which only knows the revision title, and the workers,
+    which check the full commit.
+    """
+
+    def __init__(
+        self,
+        inputs_hash: str,
+        repo_name: str | None = None,
+        metadata: dict[str, str | None] | None = None,
+    ):
+        self.inputs_hash = inputs_hash
+        self.repo_name = repo_name or ""
+        self.metadata = metadata
+
+    def key(self, check_type: type[Check]) -> str:
+        """Return the cache key for the result of `check_type`."""
+        inputs_hash = self.inputs_hash
+        if self.metadata is not None:
+            inputs_hash = hash_check_inputs(
+                inputs_hash,
+                *(self.metadata[name] for name in check_type.memo_inputs),
+            )
+        return (
+            f"landing_check_{check_type.name()}_v{check_type.version}_"
+            f"{self.repo_name}_{inputs_hash}"
+        )
+
+    def results(
+        self, check_types: Iterable[type[Check]]
+    ) -> dict[type[Check], str | None]:
+        """Return the memoized results of those `check_types` that have one."""
+        keys = {
+            self.key(check_type): check_type
+            for check_type in check_types
+            if check_type.memo_timeout != 0
+        }
+        if not keys:
+            return {}
+
+        # Results are wrapped in a tuple, to distinguish a passing check from a miss.
+        return {
+            keys[key]: value[0] for key, value in cache.get_many(list(keys)).items()
+        }
+
+    def store(self, results: dict[type[Check], str | None]):
+        """Memoize `results`, according to each check's `memo_timeout`."""
+        for check_type, result in results.items():
+            if check_type.memo_timeout != 0:
+                cache.set(self.key(check_type), (result,), check_type.memo_timeout)
+
+
 @dataclass
 class PatchCheck(Check, ABC):
     """Provides an interface to implement patch checks.
@@ -56,8 +156,14 @@ class PatchCheck(Check, ABC):
     When looping over each diff in the patch, `next_diff` is called to give the
     current diff to the patch as a `rs_parsepatch` diff `dict`. Then, `result` is
     called to receive the result of the check.
+
+    Checks which don't inspect all of `author`, `email` and `commit_message` should
+    list those they do in `memo_inputs`, so their results are memoized regardless of
+    the others.
     """
 
+    memo_inputs: ClassVar[tuple[str, ...]] = ("author", "email", "commit_message")
+
     author: str | None = None
     email: str | None = None
     commit_message: str | None = None
@@ -71,15 +177,96 @@ class PatchCheck(Check, ABC):
         """Calculate and return the result of the check."""
 
 
-class PreventPathCheckMixin(ABC):
+class PathCheckMixin(ABC):
+    """Restrict a `PatchCheck` to diffs touching specific paths.
+
+    Subclasses declare the paths they are interested in with the following
+    attributes, and implement `next_path_match` instead of `next_diff`.
+
+    Attributes:
+
+    path_names: tuple[str, ...]
+        filenames to match exactly
+
+    path_prefixes: tuple[str, ...]
+        prefixes to match the start of each filename with
+
+    When several such checks run together, `DiffAssessor` classifies each file
+    against all of them in a single pass using a `PathMatcher`.
+    """
+
+    path_names: tuple[str, ...] = ()
+    path_prefixes: tuple[str, ...] = ()
+
+    @classmethod
+    def matches_path(cls, filename: str) -> bool:
+        """Return `True` if `filename` matches one of the paths of this check."""
+        return filename in cls.path_names or filename.startswith(cls.path_prefixes)
+
+    def next_diff(self, diff: dict):
+        """Pass the next `rs_parsepatch` diff `dict` into the check."""
+        if self.matches_path(diff["filename"]):
+            self.next_path_match(diff)
+
+    @abstractmethod
+    def next_path_match(self, diff: dict):
+        """Pass the next `rs_parsepatch` diff `dict` matching the check's paths."""
+
+
+class PathMatcher:
+    """Classify filenames against the paths of several `PathCheckMixin` checks.
+
+    Exact names are looked up in a `dict`, and prefixes by walking a character
+    trie, so the cost of matching a filename depends on the length of the
+    matching prefixes rather than on the number of checks.
+    """
+
+    # Key under which trie nodes store the owners of the prefix ending there.
+    OWNERS = ""
+
+    def __init__(self, check_types: Iterable[type[PathCheckMixin]]):
+        self.names: dict[str, list[int]] = defaultdict(list)
+        self.prefix_trie: dict = {}
+
+        for owner, check_type in enumerate(check_types):
+            for name in check_type.path_names:
+                self.names[name].append(owner)
+
+            for prefix in check_type.path_prefixes:
+                node = self.prefix_trie
+                for char in prefix:
+                    node = node.setdefault(char, {})
+                node.setdefault(self.OWNERS, []).append(owner)
+
+    def match(self, filename: str) -> list[int]:
+        """Return the sorted indices of the checks whose paths match `filename`."""
+        owners = set(self.names.get(filename, ()))
+
+        node = self.prefix_trie
+        for char in filename:
+            node = node.get(char)
+            if node is None:
+                break
+            owners.update(node.get(self.OWNERS, ()))
+
+        return sorted(owners)
+
+
+@functools.cache
+def compile_path_matcher(check_types: tuple[type[PathCheckMixin], ...]) -> PathMatcher:
+    """Return a `PathMatcher` for `check_types`, compiled once per combination."""
+    return PathMatcher(check_types)
+
+
+class PreventPathCheckMixin(PathCheckMixin):
     """Prevent changes to arbitrary directories.
 
     To use this check, create a subclass that defines the following attributes:
 
     Attributes:
 
-    paths: list[re.Pattern]
-        list of patterm to match() each filename with
+    path_prefixes: tuple[str, ...]
+        prefixes to match the start of each filename with
 
     override_commit_message: str
         a string to allow users to bypass the check
@@ -97,10 +284,11 @@ class PreventPathCheckMixin(ABC):
 
     """
 
-    paths: list[re.Pattern]
     override_commit_message: str
     error_cause_details: str
 
+    memo_inputs: ClassVar[tuple[str, ...]] = ("commit_message",)
+
     disallowed_changes: list[str] = field(init=False)
 
     BASE_ERROR_MESSAGE = "Revision makes changes to restricted directories:"
@@ -125,19 +313,13 @@ class PreventPathCheckMixin(ABC):
 
         return f"{' '.join(return_error_message)}."
 
-    def next_diff(self, diff: dict):
-        """Pass the next `rs_parsepatch` diff `dict` into the check."""
+    def next_path_match(self, diff: dict):
+        """Record a diff to a restricted path, unless the check is overridden."""
         if not self.commit_message:
             return
 
-        filename = diff["filename"]
-
-        for pattern in self.paths:
-            if (
-                pattern.match(filename)
-                and self.override_commit_message not in self.commit_message
-            ):
-                self.disallowed_changes.append(filename)
+        if self.override_commit_message not in self.commit_message:
+            self.disallowed_changes.append(diff["filename"])
 
     def result(self) -> str | None:
         """Calculate and return the result of the check."""
@@ -152,9 +334,7 @@ class PreventPathCheckMixin(ABC):
 class PreventDotGithubCheck(PreventPathCheckMixin, PatchCheck):
     """Prevent changes in GitHub workflows directory."""
 
-    paths = [
-        re.compile("^.github/workflows"),
-    ]
+    path_prefixes = (".github/workflows",)
     override_commit_message = "DOT_GITHUB_OVERRIDE"
     error_cause_details = "GitHub workflows directory"
 
@@ -173,9 +353,7 @@ class PreventDotGithubCheck(PreventPathCheckMixin, PatchCheck):
 class PreventNSPRCheck(PreventPathCheckMixin, PatchCheck):
     """Prevent changes to vendored NSPR directories."""
 
-    paths = [
-        re.compile("^nsprpub/"),
-    ]
+    path_prefixes = ("nsprpub/",)
     override_commit_message = "UPGRADE_NSPR_RELEASE"
     error_cause_details = "vendored NSPR directories"
 
@@ -194,9 +372,7 @@ class PreventNSPRCheck(PreventPathCheckMixin, PatchCheck):
 class PreventNSSCheck(PreventPathCheckMixin, PatchCheck):
     """Prevent changes to vendored NSS directories."""
 
-    paths = [
-        re.compile("^security/nss/"),
-    ]
+    path_prefixes = ("security/nss/",)
     override_commit_message = "UPGRADE_NSS_RELEASE"
     error_cause_details = "vendored NSS directories"
 
@@ -212,13 +388,17 @@ class PreventNSSCheck(PreventPathCheckMixin, PatchCheck):
 
 
 @dataclass
-class PreventNSPRNSSCheck(PatchCheck):
+class PreventNSPRNSSCheck(PathCheckMixin, PatchCheck):
     """Prevent changes to vendored NSPR and NSS directories.
 
     This is a backward-compatible façade wrapping the PreventNSPRCheck and
     PreventNSSCheck blockers.
     """
 
+    path_prefixes = PreventNSPRCheck.path_prefixes + PreventNSSCheck.path_prefixes
+
+    memo_inputs = ("commit_message",)
+
     _prevent_nspr_check: PreventNSPRCheck = field(init=False)
     _prevent_nss_check: PreventNSSCheck = field(init=False)
 
@@ -264,9 +444,8 @@ class PreventNSPRNSSCheck(PatchCheck):
 
         return f"{' '.join(return_error_message)}."
 
-    def next_diff(self, diff: dict):
-        """Pass the next `rs_parsepatch` diff `dict` into the check."""
-
+    def next_path_match(self, diff: dict):
+        """Pass a diff to NSPR or NSS directories into the wrapped checks."""
         self._prevent_nspr_check.next_diff(diff)
         self._prevent_nss_check.next_diff(diff)
 
@@ -283,9 +462,11 @@ class PreventNSPRNSSCheck(PatchCheck):
 
 
 @dataclass
-class PreventSubmodulesCheck(PatchCheck):
+class PreventSubmodulesCheck(PathCheckMixin, PatchCheck):
     """Prevent introduction of Git submodules into the repository."""
 
+    memo_inputs = ()
+
     @override
     @classmethod
     def name(cls) -> str:
@@ -296,12 +477,13 @@ class PreventSubmodulesCheck(PatchCheck):
     def description(cls) -> str:
         return "Prevent introduction of Git submodules into the repository."
 
+    path_names = (".gitmodules",)
+
     includes_gitmodules: bool = False
 
-    def next_diff(self, diff: dict):
-        """Check if a diff adds the `.gitmodules` file."""
-        if diff["filename"] == ".gitmodules":
-            self.includes_gitmodules = True
+    def next_path_match(self, diff: dict):
+        """Record that a diff adds the `.gitmodules` file."""
+        self.includes_gitmodules = True
 
     def result(self) -> str | None:
         """Return an error if the `.gitmodules` file was found."""
@@ -310,9 +492,14 @@ class PreventSubmodulesCheck(PatchCheck):
 
 
 @dataclass
-class PreventHgDirectoryCheck(PatchCheck):
+class PreventHgDirectoryCheck(PathCheckMixin, PatchCheck):
     """Prevent patches from modifying .hg/ directory."""
 
+    memo_inputs = ()
+
+    path_names = (".hg",)
+    path_prefixes = (".hg/",)
+
     hg_files: list[str] = field(default_factory=list)
 
     @override
@@ -325,10 +512,8 @@ class PreventHgDirectoryCheck(PatchCheck):
     def description(cls) -> str:
         return "Prevent patches from modifying .hg/ directory."
 
-    def next_diff(self, diff: dict):
-        filename = diff["filename"]
-        if filename.startswith(".hg/") or filename == ".hg":
-            self.hg_files.append(filename)
+    def next_path_match(self, diff: dict):
+        self.hg_files.append(diff["filename"])
 
     def result(self) -> str | None:
         if self.hg_files:
@@ -341,6 +526,8 @@ class PreventHgDirectoryCheck(PatchCheck):
 class PreventSymlinksCheck(PatchCheck):
     """Check for symlinks introduced in the diff."""
 
+    memo_inputs = ()
+
     # Decimal notation for the `symlink` file mode.
     SYMLINK_MODE = 40960  # == 0120000
 
@@ -374,9 +561,11 @@ class PreventSymlinksCheck(PatchCheck):
 
 
 @dataclass
-class TryTaskConfigCheck(PatchCheck):
+class TryTaskConfigCheck(PathCheckMixin, PatchCheck):
     """Check for `try_task_config.json` introduced in the diff."""
 
+    memo_inputs = ()
+
     @override
     @classmethod
     def name(cls) -> str:
@@ -387,12 +576,13 @@ class TryTaskConfigCheck(PatchCheck):
     def description(cls) -> str:
         return "Check for `try_task_config.json` introduced in the diff."
 
+    path_names = ("try_task_config.json",)
+
     includes_try_task_config: bool = False
 
-    def next_diff(self, diff: dict):
-        """Check each diff for the `try_task_config.json` file."""
-        if diff["filename"] == "try_task_config.json":
-            self.includes_try_task_config = True
+    def next_path_match(self, diff: dict):
+        """Record that a diff touches the `try_task_config.json` file."""
+        self.includes_try_task_config = True
 
     def result(self) -> str | None:
         """Return an error if the `try_task_config.json` was found."""
@@ -404,18 +594,47 @@ class TryTaskConfigCheck(PatchCheck):
 class DiffAssessor:
     """Assess diffs for landing issues.
 
-    Diffs should be passed in `rs-parsepatch` format.
+    Diffs should be passed in `rs-parsepatch` format. If `diff_hash`, the digest
+    of the raw diff that was parsed, is passed, results are memoized.
     """
 
     parsed_diff: list[dict]
     author: str | None = None
     email: str | None = None
     commit_message: str | None = None
+    diff_hash: str | None = None
+
+    def memo(self) -> CheckResultMemo | None:
+        """Return the `CheckResultMemo` for this diff, if it can be identified."""
+        if not self.diff_hash:
+            return None
+
+        return CheckResultMemo(
+            self.diff_hash,
+            metadata={
+                "author": self.author,
+                "email": self.email,
+                "commit_message": self.commit_message,
+            },
+        )
 
     def run_diff_checks(self, patch_checks: list[type[PatchCheck]]) -> list[str]:
         """Execute the set of checks on the diffs."""
-        issues = []
+        memo = self.memo()
+        results = memo.results(patch_checks) if memo else {}
+
+        if missing_checks := [check for check in patch_checks if check not in results]:
+            computed = self.check_results(missing_checks)
+            if memo:
+                memo.store(computed)
+            results |= computed
 
+        return [issue for check in patch_checks if (issue := results[check])]
+
+    def check_results(
+        self, patch_checks: list[type[PatchCheck]]
+    ) -> dict[type[PatchCheck], str | None]:
+        """Run the set of checks on the diffs, returning the result of each check."""
         checks = [
             check(
                 author=self.author,
@@ -425,17 +644,24 @@ class DiffAssessor:
             for check in patch_checks
         ]
 
+        # Path-restricted checks only receive diffs to their paths. Files are
+        # classified against all of them at once, in a single pass.
+        path_checks = [check for check in checks if isinstance(check, PathCheckMixin)]
+        other_checks = [
+            check for check in checks if not isinstance(check, PathCheckMixin)
+        ]
+        path_matcher = compile_path_matcher(tuple(type(check) for check in path_checks))
+
         # Iterate through each diff in the patch and pass it into each check.
         for parsed in self.parsed_diff:
-            for check in checks:
+            for index in path_matcher.match(parsed["filename"]):
+                path_checks[index].next_path_match(parsed)
+
+            for check in other_checks:
                 check.next_diff(parsed)
 
         # Collect the results from each check.
-        for check in checks:
-            if issue := check.result():
-                issues.append(issue)
-
-        return issues
+        return {type(check): check.result() for check in checks}
 
 
 @dataclass
@@ -621,7 +847,7 @@ class WPTSyncCheck(PatchCollectionCheck):
         if self.push_user_email != "wptsync@mozilla.com":
             return
 
-        diffs = rs_parsepatch.get_diffs(patch_helper.get_diff())
+        diffs = get_parsed_diff(patch_helper.get_diff())
         for parsed_diff in diffs:
             filename = parsed_diff["filename"]
             if not self.WPTSYNC_ALLOWED_PATHS_RE.match(filename):
@@ -648,6 +874,9 @@ BUG_REFERENCES_BMO_ERROR_TEMPLATE = (
 class BugReferencesCheck(PatchCollectionCheck):
     """Prevent commit messages referencing non-public bugs from try."""
 
+    # Bug visibility on BMO can change at any time.
+    memo_timeout = 0
+
     @override
     @classmethod
     def name(cls) -> str:
@@ -677,52 +906,174 @@ class BugReferencesCheck(PatchCollectionCheck):
         self.bug_ids |= set(parse_bugs(commit_message))
 
     def result(self) -> str | None:
-        """Ensure all bug numbers detected in commit messages reference public bugs."""
+        """Ensure all bug numbers detected in commit messages reference public bugs.
+
+        Every private, nonexistent or unverifiable bug is reported.
+        """
         if self.skip_check or not self.bug_ids:
             return
 
         try:
-            found_bugs = search_bugs(self.bug_ids)
+            visibility = get_bug_visibility(self.bug_ids)
         except requests.exceptions.RequestException as exc:
             return BUG_REFERENCES_BMO_ERROR_TEMPLATE.format(error=str(exc))
 
-        invalid_bugs = self.bug_ids - found_bugs
-        if not invalid_bugs:
-            return
+        invalid_bugs = defaultdict(list)
+        for bug_id in sorted(self.bug_ids):
+            invalid_bugs[visibility[bug_id]].append(bug_id)
 
-        # Check a single bug to determine which error to return.
-        bug_id = invalid_bugs.pop()
-        try:
-            status_code = get_status_code_for_bug(bug_id)
-        except requests.exceptions.RequestException as exc:
-            return BUG_REFERENCES_BMO_ERROR_TEMPLATE.format(error=str(exc))
+        messages = []
 
-        if status_code == 401:
-            return (
-                f"Your commit message references bug {bug_id}, which is currently private. To avoid "
-                "disclosing the nature of this bug publicly, please remove the affected bug ID "
-                f"from the commit message. {BMO_SKIP_HINT}"
+        if private := invalid_bugs[BugVisibility.PRIVATE]:
+            messages.append(
+                f"Your commit message references {self._bugs_str(private)}, which "
+                f"{'is' if len(private) == 1 else 'are'} currently private. To avoid "
+                "disclosing the nature of "
+                f"{'this bug' if len(private) == 1 else 'these bugs'} publicly, please "
+                f"remove the affected bug {'ID' if len(private) == 1 else 'IDs'} "
+                "from the commit message."
             )
 
-        if status_code == 404:
-            return (
-                f"Your commit message references bug {bug_id}, which does not exist. "
-                f"Please check your commit message and try again. {BMO_SKIP_HINT}"
+        if nonexistent := invalid_bugs[BugVisibility.NONEXISTENT]:
+            messages.append(
+                f"Your commit message references {self._bugs_str(nonexistent)}, which "
+                f"{'does' if len(nonexistent) == 1 else 'do'} not exist. "
+                "Please check your commit message and try again."
             )
 
-        return (
-            f"While checking if bug {bug_id} in your commit message is a security bug, "
-            f"an error occurred and the bug could not be verified. {BMO_SKIP_HINT}"
+        if unknown := invalid_bugs[BugVisibility.UNKNOWN]:
+            messages.append(
+                f"While checking if {self._bugs_str(unknown)} in your commit message "
+                f"{'is a security bug' if len(unknown) == 1 else 'are security bugs'}, "
+                "an error occurred and "
+                f"{'the bug' if len(unknown) == 1 else 'the bugs'} could not be "
+                "verified."
+            )
+
+        if not messages:
+            return
+
+        return " ".join([*messages, BMO_SKIP_HINT])
+
+    @classmethod
+    def _bugs_str(cls, bug_ids: list[int]) -> str:
+        if len(bug_ids) == 1:
+            return f"bug {bug_ids[0]}"
+
+        return "bugs " + ", ".join(str(bug_id) for bug_id in bug_ids)
+
+
+@dataclass(frozen=True)
+class PatchCheckInput:
+    """The parts of a single patch needed to run `PatchCheck`s.
+
+    Unlike `PatchHelper`, this is picklable, so it can be sent to a process pool.
+    """
+
+    diff: str
+    author: str | None = None
+    email: str | None = None
+    commit_message: str | None = None
+
+    def memo(self) -> CheckResultMemo:
+        """Return the `CheckResultMemo` for this patch."""
+        return CheckResultMemo(
+            hash_diff(self.diff),
+            metadata={
+                "author": self.author,
+                "email": self.email,
+                "commit_message": self.commit_message,
+            },
+        )
+
+    def check_results(
+        self, patch_checks: list[type[PatchCheck]], parsed_diff: list[dict]
+    ) -> dict[type[PatchCheck], str | None]:
+        """Run `patch_checks` against `parsed_diff`, returning each check's result."""
+        diff_assessor = DiffAssessor(
+            author=self.author,
+            email=self.email,
+            commit_message=self.commit_message,
+            parsed_diff=parsed_diff,
         )
+        return diff_assessor.check_results(patch_checks)
+
+
+def assess_patch(
+    patch_checks: list[type[PatchCheck]], patch_input: PatchCheckInput
+) -> dict[type[PatchCheck], str | None]:
+    """Parse a single patch, using the shared cache, and run `patch_checks` on it."""
+    if not patch_checks:
+        return {}
+
+    return patch_input.check_results(patch_checks, get_parsed_diff(patch_input.diff))
+
+
+class PatchCheckPool:
+    """The process pool `PatchCheck`s are run in, shared by this process.
+
+    The pool has `LANDING_CHECKS_PROCESSES` processes, is started on first use, and
+    is shut down when the process exits. Workers are started from a fork server,
+    rather than forked from the calling process, so they don't inherit its threads
+    and connections. They set up Django once, when they start, and are reused
+    across assessments.
+    """
+
+    def __init__(self):
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def get(self) -> ProcessPoolExecutor:
+        """Return the pool, starting it if needed."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=settings.LANDING_CHECKS_PROCESSES,
+                    mp_context=multiprocessing.get_context("forkserver"),
+                    initializer=django.setup,
+                )
+                atexit.register(self._executor.shutdown)
+            return self._executor
+
+    def discard(self, executor: ProcessPoolExecutor):
+        """Shut down `executor`, e.g. once broken, so the next use starts a new pool."""
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        atexit.unregister(executor.shutdown)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+patch_check_pool = PatchCheckPool()
+
+
+def hash_patch_helpers(patch_helpers: Iterable[PatchHelper]) -> str:
+    """Return a digest of the full content and metadata of `patch_helpers`."""
+    contents = []
+    for patch_helper in patch_helpers:
+        buf = io.StringIO()
+        patch_helper.write(buf)
+        contents += [buf.getvalue(), repr(patch_helper.metadata)]
+    return hash_check_inputs(*contents)
 
 
 @dataclass
 class PatchCollectionAssessor:
-    """Assess pushes for landing issues."""
+    """Assess pushes for landing issues.
+
+    When `processes` is greater than 1, patches are parsed and `PatchCheck`s are
+    run in the shared `patch_check_pool`. `PatchCollectionCheck`s always run in
+    the calling process and see patches in order, and issues are returned in the
+    same order as in the serial case.
+
+    Check results are memoized, so only checks without a result for the same
+    inputs are run.
+    """
 
     patch_helpers: Iterable[PatchHelper]
     push_user_email: str | None = None
     repo_name: str | None = None
+    processes: int = 1
 
     def run_patch_collection_checks(
         self,
@@ -737,37 +1088,97 @@ class PatchCollectionAssessor:
         """
         issues = []
 
+        patch_helpers = list(self.patch_helpers)
+
+        collection_memo = CheckResultMemo(
+            hash_check_inputs(hash_patch_helpers(patch_helpers), self.push_user_email),
+            self.repo_name,
+        )
+        collection_results = collection_memo.results(patch_collection_checks)
+
         checks = [
             check(self.push_user_email, self.repo_name)
             for check in patch_collection_checks
+            if check not in collection_results
         ]
 
-        for patch_helper in self.patch_helpers:
+        patch_inputs = []
+        for patch_helper in patch_helpers:
             # Pass the patch information into the push-wide check.
             for check in checks:
                 check.next_diff(patch_helper)
 
-            parsed_diff = rs_parsepatch.get_diffs(patch_helper.get_diff())
-
             author, email = patch_helper.parse_author_information()
-
-            # Run diff-wide checks.
-            diff_assessor = DiffAssessor(
-                author=author,
-                email=email,
-                commit_message=patch_helper.get_commit_description(),
-                parsed_diff=parsed_diff,
+            patch_inputs.append(
+                PatchCheckInput(
+                    diff=patch_helper.get_diff(),
+                    author=author,
+                    email=email,
+                    commit_message=patch_helper.get_commit_description(),
+                )
             )
-            if diff_issues := diff_assessor.run_diff_checks(patch_checks):
-                issues.extend(diff_issues)
+
+        # Run diff-wide checks.
+        for diff_issues in self.run_patch_checks(patch_checks, patch_inputs):
+            issues.extend(diff_issues)
 
         # Collect the result of the push-wide checks.
-        for check in checks:
-            if issue := check.result():
+        computed = {type(check): check.result() for check in checks}
+        collection_memo.store(computed)
+        collection_results |= computed
+
+        for check in patch_collection_checks:
+            if issue := collection_results[check]:
                 issues.append(issue)
 
         return issues
 
+    def run_patch_checks(
+        self,
+        patch_checks: list[type[PatchCheck]],
+        patch_inputs: list[PatchCheckInput],
+    ) -> list[list[str]]:
+        """Run `patch_checks` on each patch, returning issues in patch order."""
+        memos = [patch_input.memo() for patch_input in patch_inputs]
+        results = [memo.results(patch_checks) for memo in memos]
+        missing_checks = [
+            [check for check in patch_checks if check not in patch_results]
+            for patch_results in results
+        ]
+
+        computed = self.compute_patch_check_results(missing_checks, patch_inputs)
+        for memo, patch_results, patch_computed in zip(
+            memos, results, computed, strict=True
+        ):
+            memo.store(patch_computed)
+            patch_results |= patch_computed
+
+        return [
+            [issue for check in patch_checks if (issue := patch_results[check])]
+            for patch_results in results
+        ]
+
+    def compute_patch_check_results(
+        self,
+        patch_checks: list[list[type[PatchCheck]]],
+        patch_inputs: list[PatchCheckInput],
+    ) -> list[dict[type[PatchCheck], str | None]]:
+        """Run the given checks on each patch, serially or in a process pool."""
+        processes = min(self.processes, sum(1 for checks in patch_checks if checks))
+        if processes <= 1:
+            return [
+                assess_patch(checks, patch_input)
+                for checks, patch_input in zip(patch_checks, patch_inputs, strict=True)
+            ]
+
+        pool = patch_check_pool.get()
+        try:
+            return list(pool.map(assess_patch, patch_checks, patch_inputs))
+        except BrokenProcessPool:
+            # A worker died; start a new pool for the next assessment.
+            patch_check_pool.discard(pool)
+            raise
+
 
 ALL_STACK_CHECKS = PatchCollectionCheck.__subclasses__()
 ALL_COMMIT_CHECKS = PatchCheck.__subclasses__()
@@ -779,10 +1190,12 @@ class LandingChecks:
 
     requester_email: str
     repo_name: str
+    processes: int
 
-    def __init__(self, requester_email: str, repo_name: str):
+    def __init__(self, requester_email: str, repo_name: str, processes: int = 1):
         self.requester_email = requester_email
         self.repo_name = repo_name
+        self.processes = processes
 
     def run(
         self,
@@ -813,6 +1226,7 @@ class LandingChecks:
             patches,
             push_user_email=self.requester_email,
             repo_name=self.repo_name,
+            processes=self.processes,
         )
         return assessor.run_patch_collection_checks(
             patch_collection_checks=stack_checks, patch_checks=commit_checks
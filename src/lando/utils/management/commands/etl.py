@@ -277,7 +277,7 @@ class RevisionTransformer(ModelTransformer):
         "pull_number",
         "commit_id",
     )
-    defer = ("patch", "patches")
+    # Patch text lives in `PatchBlob` rows, which are never loaded here.
 
     def transform(self, instance: BaseModel) -> dict[str, Any]:
         """Transform a `Revision` instance for loading.
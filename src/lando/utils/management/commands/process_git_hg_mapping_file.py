@@ -1,20 +1,25 @@
 import argparse
 import csv
-from io import StringIO
+import io
+import json
+import time
+from collections.abc import Iterator
+from itertools import islice
 from pathlib import Path
-from zipfile import ZipFile
+from zipfile import ZipFile, is_zipfile
 
 import requests
 from django.core.management.base import BaseCommand
-from django.db.utils import IntegrityError
+from django.db import transaction
 
 from lando.main.models import CommitMap
 
+# Size of the chunks written to disk while downloading the mapping file.
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 class Command(BaseCommand):
     help = "Download and process the git to hg mapping file"
-    file_paths = None
-    rows = []
 
     def add_arguments(self, parser: argparse.ArgumentParser):
         parser.add_argument(
@@ -35,50 +40,143 @@ class Command(BaseCommand):
             default="",
             help="Full alternate URL to fetch a CommitMap CSV file from",
         )
+        parser.add_argument(
+            "--batch-size",
+            "-b",
+            type=int,
+            default=10000,
+            help="Number of rows inserted per transaction",
+        )
+        parser.add_argument(
+            "--work-dir",
+            type=Path,
+            default=Path("/tmp"),
+            help="Directory to download the mapping file and store the checkpoint in",
+        )
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            help="Ignore any checkpoint from an interrupted run and start over",
+        )
 
-    def _prepare_rows(self, **options):
-        if not options["url"]:
-            filename = options["csv_name"]
-            url = f"https://archive.mozilla.org/pub/vcs-archive/{filename}.zip"
-            zip_file_path = Path("/tmp") / f"{filename}.zip"
-            file_path = Path("/tmp") / filename
+    def _download(self, url: str, path: Path):
+        """Stream the file at `url` to `path`, without holding it in memory."""
+        self.stdout.write(f"Downloading {url} to {path}...")
+        partial_path = path.with_name(f"{path.name}.part")
 
-            with zip_file_path.open("wb") as f:
-                self.stdout.write(f"Downloading {url}...")
-                f.write(requests.get(url).content)
+        with requests.get(url, stream=True) as response:
+            response.raise_for_status()
+            with partial_path.open("wb") as f:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
 
-            with ZipFile(zip_file_path, "r") as f:
-                self.stdout.write(f"Extracting {zip_file_path}...")
-                f.extractall(Path("/tmp"))
+        partial_path.rename(path)
 
-            with file_path.open("r") as f:
-                self.rows += list(csv.DictReader(f))
-        else:
-            # Download second (remainder) backup file.
-            url = options["url"]
-            self.stdout.write(f"Downloading {url}...")
-            content = requests.get(url).text
-            self.rows += list(csv.DictReader(StringIO(content)))
+    def _iter_rows(self, path: Path) -> Iterator[dict[str, str]]:
+        """Yield the rows of the CSV file at `path`, or of the CSV in that zip file."""
+        if not is_zipfile(path):
+            with path.open("r", newline="") as f:
+                yield from csv.DictReader(f)
+            return
 
-    def handle(self, *args, **options):
-        git_repo_name = options["repo"]
+        with ZipFile(path) as zip_file:
+            member = next(name for name in zip_file.namelist() if name.endswith(".csv"))
+            with zip_file.open(member) as f:
+                yield from csv.DictReader(io.TextIOWrapper(f, newline=""))
+
+    def _read_checkpoint(self, path: Path, url: str) -> int:
+        """Return the number of rows already loaded from `url`, per the checkpoint."""
+        try:
+            checkpoint = json.loads(path.read_text())
+        except FileNotFoundError:
+            return 0
+        except ValueError as exc:
+            self.stdout.write(f"Ignoring unreadable checkpoint {path}: {exc}")
+            return 0
+
+        if checkpoint.get("url") != url:
+            self.stdout.write(
+                f"Ignoring checkpoint {path} for another URL: {checkpoint.get('url')}"
+            )
+            return 0
+
+        return checkpoint["rows"]
 
-        self._prepare_rows(**options)
-        count = 0
-        skipped_count = 0
+    def _write_checkpoint(self, path: Path, url: str, rows: int):
+        path.write_text(json.dumps({"url": url, "rows": rows}))
 
-        for row in self.rows:
-            try:
-                CommitMap.objects.create(
+    def _insert_batch(self, git_repo_name: str, batch: list[dict[str, str]]) -> int:
+        """Create CommitMap objects for the rows of `batch`, and return the number created.
+
+        Rows conflicting with existing entries are skipped. As `bulk_create` doesn't
+        report which rows were inserted with `ignore_conflicts`, the batch's entries
+        are counted before and after.
+        """
+        existing = CommitMap.objects.filter(
+            git_repo_name=git_repo_name, git_hash__in=[row["git"] for row in batch]
+        )
+        initial_count = existing.count()
+
+        CommitMap.objects.bulk_create(
+            [
+                CommitMap(
                     git_hash=row["git"],
                     hg_hash=row["hg"],
                     git_repo_name=git_repo_name,
                 )
-            except IntegrityError:
-                self.stdout.write(f"Skipped {row}.")
-                skipped_count += 1
-            else:
-                count += 1
-
-        self.stdout.write(f"Created {count} records.")
-        self.stdout.write(f"Skipped {skipped_count} records.")
+                for row in batch
+            ],
+            ignore_conflicts=True,
+        )
+
+        return existing.count() - initial_count
+
+    def handle(self, *args, **options):
+        git_repo_name = options["repo"]
+        batch_size = options["batch_size"]
+        work_dir = options["work_dir"]
+
+        if options["url"]:
+            url = options["url"]
+            filename = Path(url.rstrip("/")).name or "mapping.csv"
+        else:
+            filename = f"{options['csv_name']}.zip"
+            url = f"https://archive.mozilla.org/pub/vcs-archive/{filename}"
+
+        file_path = work_dir / filename
+        checkpoint_path = work_dir / f"{filename}.{git_repo_name}.checkpoint"
+
+        if options["restart"]:
+            checkpoint_path.unlink(missing_ok=True)
+            file_path.unlink(missing_ok=True)
+
+        loaded = self._read_checkpoint(checkpoint_path, url)
+        if not loaded or not file_path.exists():
+            loaded = 0
+            self._download(url, file_path)
+        else:
+            self.stdout.write(f"Resuming after {loaded} rows of {file_path}...")
+
+        start = time.monotonic()
+        processed = 0
+        created_count = 0
+
+        rows = islice(self._iter_rows(file_path), loaded, None)
+        while batch := list(islice(rows, batch_size)):
+            with transaction.atomic():
+                created_count += self._insert_batch(git_repo_name, batch)
+
+            processed += len(batch)
+            self._write_checkpoint(checkpoint_path, url, loaded + processed)
+
+            elapsed = time.monotonic() - start
+            self.stdout.write(
+                f"Processed {loaded + processed} rows "
+                f"({processed / elapsed if elapsed else 0:.0f} rows/s)..."
+            )
+
+        # The file was fully loaded, so there is nothing left to resume.
+        checkpoint_path.unlink(missing_ok=True)
+
+        self.stdout.write(f"Created {created_count} records.")
+        self.stdout.write(f"Skipped {processed - created_count} records.")
@@ -0,0 +1,54 @@
+"""Shared cache of `rs_parsepatch` results, keyed by diff content.
+
+The same raw diff is parsed when rendering stack pages, during dryruns, and again
+when the landing worker or Try API runs landing checks. Parsing large patches is
+expensive, so parsed results are stored in the shared cache in a compact form
+that only retains what checks need (file names, modes, and file flags).
+"""
+
+import hashlib
+
+import rs_parsepatch
+
+from lando.utils.cache import cache_method
+
+# Keys retained from each `rs_parsepatch` diff `dict`. Diff lines are dropped.
+PARSED_DIFF_KEYS = (
+    "filename",
+    "new",
+    "deleted",
+    "binary",
+    "copied_from",
+    "renamed_from",
+    "modes",
+)
+
+
+def hash_diff(raw_diff: str) -> str:
+    """Return the hex SHA-256 digest of `raw_diff`."""
+    return hashlib.sha256(
+        raw_diff.encode("utf-8", errors="surrogateescape")
+    ).hexdigest()
+
+
+def parsed_diff_cache_key(raw_diff: str) -> str:
+    """Return the cache key for the parsed form of `raw_diff`."""
+    return f"parsed_diff_{hash_diff(raw_diff)}"
+
+
+def compact_parsed_diff(parsed_diff: list[dict]) -> list[dict]:
+    """Strip an `rs_parsepatch` result down to the keys in `PARSED_DIFF_KEYS`."""
+    return [
+        {key: diff[key] for key in PARSED_DIFF_KEYS if key in diff}
+        for diff in parsed_diff
+    ]
+
+
+@cache_method(parsed_diff_cache_key)
+def get_parsed_diff(raw_diff: str) -> list[dict]:
+    """Return the compact `rs_parsepatch` parsed form of `raw_diff`.
+
+    Results are cached by content hash, so the same diff is only parsed once
+    across the UI, the API and the workers.
+    """
+    return compact_parsed_diff(rs_parsepatch.get_diffs(raw_diff))
@@ -1,5 +1,11 @@
+import copy
+import hashlib
 import json
 import logging
+import threading
+import time
+from collections.abc import Callable, Hashable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import (
     datetime,
     timezone,
@@ -14,15 +20,42 @@ from typing import (
     Iterable,
     Optional,
     Self,
+    TypeVar,
 )
 
 import requests
+from datadog import statsd
 from django.conf import settings
+from django.core.cache import cache
+
+from lando.utils.http import create_session
 
 logger = logging.getLogger(__name__)
 
 PHABRICATOR_API_KEY_HEADER = "X-Phabricator-API-Key"
 
+# Read-only Conduit methods which aren't named `*.search`.
+READ_ONLY_CONDUIT_METHODS = frozenset(
+    (
+        "conduit.ping",
+        "differential.getrawdiff",
+        "differential.query",
+        "user.whoami",
+    )
+)
+
+# How long objects are kept in the Phabricator object cache. Entries are
+# checked against the object's `dateModified` before use, so this only bounds
+# how long unused objects take up space.
+PHABRICATOR_OBJECT_CACHE_TIMEOUT = 7 * 24 * 60 * 60
+
+# Cached objects are only trusted if they were fetched at least this many seconds
+# after their `dateModified`, which is truncated to the second. This also allows
+# for some clock skew between Lando and Phabricator.
+PHABRICATOR_OBJECT_CACHE_SETTLE_TIME = 5
+
+K = TypeVar("K", bound=Hashable)
+
 
 @unique
 class PhabricatorRevisionStatus(Enum):
@@ -239,12 +272,129 @@ class PhabricatorClient:
             data = data[:limit]
         return {"data": data}
 
+    def cached_search(
+        self,
+        method: str,
+        *,
+        constraints: dict,
+        attachments: Optional[dict] = None,
+    ) -> dict[str, list[dict]]:
+        """Return the collated results of a `*.search` call, using cached objects.
+
+        Objects are cached by PHID in the `default` cache, separately for each API
+        token, so they are only ever returned to callers who could see them.
+
+        A search without attachments is made first to find the matching objects and
+        their `dateModified`, and only objects which are missing from the cache or
+        may have since been modified are fetched with `attachments`. If none of the
+        requested `phids` are cached, they are fetched directly instead.
+
+        Returns:
+            A dict like `call_conduit_collated`, with results in the order
+            Phabricator returned them.
+        """
+        attachments = attachments or {}
+        key_digest = hashlib.sha256(
+            json.dumps([self.api_token, method, attachments], sort_keys=True).encode(
+                "utf-8"
+            )
+        ).hexdigest()[:24]
+
+        def cache_key(phid: str) -> str:
+            return f"phabricator_object_{key_digest}_{phid}"
+
+        tags = [f"method:{method}"]
+        requested_phids = constraints.get("phids") if len(constraints) == 1 else None
+        if requested_phids is not None and not cache.get_many(
+            [cache_key(phid) for phid in requested_phids]
+        ):
+            data = self.expect(
+                self.call_conduit_collated(
+                    method, constraints=constraints, attachments=attachments
+                ),
+                "data",
+            )
+            self._cache_objects(
+                {cache_key(self.expect(obj, "phid")): obj for obj in data}
+            )
+            statsd.increment(
+                "lando-api.phabricator.object_cache.misses", len(data), tags=tags
+            )
+            return {"data": data}
+
+        listing = self.expect(
+            self.call_conduit_collated(method, constraints=constraints), "data"
+        )
+        modified = {
+            self.expect(item, "phid"): self.expect(item, "fields", "dateModified")
+            for item in listing
+        }
+
+        cached = cache.get_many([cache_key(phid) for phid in modified])
+        objects = {}
+        stale = 0
+        for phid, date_modified in modified.items():
+            entry = cached.get(cache_key(phid))
+            if entry is None:
+                continue
+            # `dateModified` only has a one second resolution, so an object modified
+            # again shortly after it was fetched would keep the same date. Only trust
+            # entries fetched well after their last modification.
+            if (
+                entry["object"]["fields"]["dateModified"] != date_modified
+                or entry["fetched_at"]
+                < date_modified + PHABRICATOR_OBJECT_CACHE_SETTLE_TIME
+            ):
+                stale += 1
+                continue
+            objects[phid] = entry["object"]
+
+        missing = [phid for phid in modified if phid not in objects]
+        if missing:
+            fetched = result_list_to_phid_dict(
+                self.expect(
+                    self.call_conduit_collated(
+                        method,
+                        constraints={"phids": missing},
+                        attachments=attachments,
+                    ),
+                    "data",
+                )
+            )
+            self._cache_objects({cache_key(phid): obj for phid, obj in fetched.items()})
+            objects.update(fetched)
+
+        statsd.increment(
+            "lando-api.phabricator.object_cache.hits",
+            len(modified) - len(missing),
+            tags=tags,
+        )
+        statsd.increment(
+            "lando-api.phabricator.object_cache.misses",
+            len(missing) - stale,
+            tags=tags,
+        )
+        statsd.increment("lando-api.phabricator.object_cache.stale", stale, tags=tags)
+
+        # Objects may disappear between the two searches; omit them as if the
+        # first search hadn't found them.
+        return {"data": [objects[phid] for phid in modified if phid in objects]}
+
+    @staticmethod
+    def _cache_objects(objects: dict[str, dict]):
+        """Store `objects`, by cache key, along with the time they were fetched."""
+        fetched_at = time.time()
+        cache.set_many(
+            {
+                key: {"object": obj, "fetched_at": fetched_at}
+                for key, obj in objects.items()
+            },
+            PHABRICATOR_OBJECT_CACHE_TIMEOUT,
+        )
+
     @staticmethod
     def create_session() -> requests.Session:
-        session = requests.Session()
-        headers = {"User-Agent": settings.HTTP_USER_AGENT}
-        session.headers.update(headers)
-        return session
+        return create_session("phabricator")
 
     @classmethod
     def single(
@@ -334,6 +484,52 @@ class PhabricatorClient:
             return None
 
 
+class MemoizedPhabricatorClient(PhabricatorClient):
+    """A `PhabricatorClient` which makes each read-only Conduit call at most once.
+
+    Results of read-only calls are kept for the lifetime of the client, so
+    a client should only be used for the duration of a single request. Any
+    other call may modify Phabricator state and clears the memo.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._memo = {}
+        self._memo_lock = threading.Lock()
+        self.conduit_requests = 0
+        self.conduit_memo_hits = 0
+
+    @staticmethod
+    def is_read_only(method: str) -> bool:
+        """Return `True` if calling `method` doesn't modify Phabricator state."""
+        return method.endswith(".search") or method in READ_ONLY_CONDUIT_METHODS
+
+    def call_conduit(self, method: str, **kwargs) -> Any:  # noqa: ANN401
+        """Return the result of an RPC call, reusing earlier read-only results.
+
+        See `PhabricatorClient.call_conduit`.
+        """
+        if not self.is_read_only(method):
+            with self._memo_lock:
+                self._memo.clear()
+                self.conduit_requests += 1
+            return super().call_conduit(method, **kwargs)
+
+        key = (method, json.dumps(kwargs, sort_keys=True, default=str))
+        with self._memo_lock:
+            if key in self._memo:
+                self.conduit_memo_hits += 1
+                # Callers may modify results, so always hand out copies.
+                return copy.deepcopy(self._memo[key])
+            self.conduit_requests += 1
+
+        result = super().call_conduit(method, **kwargs)
+
+        with self._memo_lock:
+            self._memo[key] = copy.deepcopy(result)
+        return result
+
+
 class PhabricatorAPIException(Exception):
     """Exception to be raised when Phabricator returns an error response."""
 
@@ -393,3 +589,38 @@ def get_phabricator_client(
             else settings.PHABRICATOR_UNPRIVILEGED_API_KEY
         )
     return PhabricatorClient(settings.PHABRICATOR_URL, api_key)
+
+
+def call_concurrently(
+    calls: dict[K, Callable[[], Any]], *, max_workers: Optional[int] = None
+) -> dict[K, Any]:
+    """Run independent Phabricator calls concurrently and return their results.
+
+    Args:
+        calls: A mapping of keys to zero-argument callables, each performing
+            one or more Conduit requests.
+        max_workers: The maximum number of calls in flight at once. Defaults
+            to `settings.PHABRICATOR_CONDUIT_CONCURRENCY`.
+
+    Returns:
+        A mapping of the same keys to the value returned by each callable.
+
+    Raises:
+        The exception raised by the first failing callable, in the order of
+        `calls`, once every call has completed. This is the same exception
+        that calling them one after another would have raised.
+    """
+    if max_workers is None:
+        max_workers = settings.PHABRICATOR_CONDUIT_CONCURRENCY
+
+    max_workers = min(max_workers, len(calls))
+    if max_workers <= 1:
+        return {key: call() for key, call in calls.items()}
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="conduit"
+    ) as executor:
+        futures = {key: executor.submit(call) for key, call in calls.items()}
+
+    # Leaving the executor waits for all calls, so no request is left running.
+    return {key: future.result() for key, future in futures.items()}
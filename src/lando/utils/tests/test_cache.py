@@ -2,7 +2,7 @@ import pytest
 from django.core.cache import cache
 from django.test import override_settings
 
-from lando.utils.cache import cache_method
+from lando.utils.cache import LRUCache, cache_method
 
 
 def sample_cache_key(name: str) -> str:
@@ -51,3 +51,21 @@ def test_cache_method():
     assert cache.get("test-cache-Bob") == "Hello, Bob!", (
         "The cached value should be stored under the key function's output."
     )
+
+
+def test_lru_cache():
+    lru = LRUCache(2)
+    lru.set("a", 1)
+    lru.set("b", 2)
+
+    assert lru.get("a") == 1
+    lru.set("c", 3)
+
+    assert lru.get("b") is None, "The least recently used entry should be evicted."
+    assert lru.get("a") == 1
+    assert lru.get("c") == 3
+    assert len(lru) == 2
+
+    disabled = LRUCache(0)
+    disabled.set("a", 1)
+    assert disabled.get("a") is None, "A cache of size 0 should store nothing."
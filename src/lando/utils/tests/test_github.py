@@ -1,21 +1,32 @@
 import json
+from datetime import UTC, datetime, timedelta
 from textwrap import dedent
 from typing import Callable
 from unittest import mock
 
 import pytest
+import requests_mock
 from django.conf import settings
+from django.core.cache import cache
+from django.test import override_settings
 from requests import Response
 
 from lando.utils.github import (
+    INSTALLATION_TOKEN_REFRESH_MARGIN,
     PR_DELIMITER,
     GitHub,
     GitHubAPI,
     GitHubAPIClient,
     PullRequest,
     PullRequestPatchHelper,
+    installation_tokens,
     verify_github_signature,
 )
+from lando.utils.github_checks import (
+    ALL_PULL_REQUEST_CHECKS,
+    PullRequestChecks,
+    PullRequestPreviouslyLandedWarning,
+)
 
 
 @pytest.mark.parametrize(
@@ -63,6 +74,109 @@ def mock_github_fetch_token(monkeypatch: pytest.MonkeyPatch) -> mock.Mock:
     return mock_fetch_token
 
 
+def test_github_installation_token_is_cached(monkeypatch: pytest.MonkeyPatch):
+    installation_tokens.clear()
+    expires_at = datetime.now(tz=UTC) + timedelta(minutes=30)
+    tokens = iter(("token-1", "token-2", "token-3"))
+    mint_token = mock.MagicMock(side_effect=lambda: (next(tokens), expires_at))
+    monkeypatch.setattr("lando.utils.github.GitHub._mint_token", mint_token)
+
+    assert GitHub("https://github.com/owner/repo")._fetch_token() == "token-1"
+    assert GitHub("https://github.com/Owner/repo.git")._fetch_token() == "token-1"
+    assert mint_token.call_count == 1, "Tokens should be reused for the same repo."
+
+    assert GitHub("https://github.com/owner/other")._fetch_token() == "token-2", (
+        "Tokens should be minted per repo."
+    )
+
+    # Tokens are refreshed before GitHub's expiry time.
+    refresh_at = expires_at.timestamp() - INSTALLATION_TOKEN_REFRESH_MARGIN
+    monkeypatch.setattr("lando.utils.github.time.time", lambda: refresh_at)
+    assert GitHub("https://github.com/owner/repo")._fetch_token() == "token-3"
+    installation_tokens.clear()
+
+
+def test_github_api_mints_new_token_on_401(monkeypatch: pytest.MonkeyPatch):
+    installation_tokens.clear()
+    expires_at = datetime.now(tz=UTC) + timedelta(hours=1)
+    tokens = iter(("revoked-token", "new-token"))
+    mint_token = mock.MagicMock(side_effect=lambda: (next(tokens), expires_at))
+    monkeypatch.setattr("lando.utils.github.GitHub._mint_token", mint_token)
+
+    api = GitHubAPI("https://github.com/owner/repo")
+    url = f"{GitHubAPI.GITHUB_BASE_URL}/repos/owner/repo/pulls/1/reviews"
+    with requests_mock.Mocker() as m:
+        m.post(
+            url,
+            [
+                {"status_code": 401, "json": {"message": "Bad credentials"}},
+                {"status_code": 200, "json": {"id": 1}},
+            ],
+        )
+        response = api.post("repos/owner/repo/pulls/1/reviews", json={})
+
+        assert response.status_code == 200, "The request should be retried."
+        assert m.request_history[-1].headers["Authorization"] == "Bearer new-token"
+
+    assert mint_token.call_count == 2, "A new token should be minted after a 401."
+    assert GitHub("https://github.com/owner/repo")._fetch_token() == "new-token", (
+        "The rejected token should be replaced in the cache."
+    )
+    installation_tokens.clear()
+
+
+# Enable the local memory cache since we use the dummy cache in tests.
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "test-github-http-cache",
+        }
+    }
+)
+def test_github_api_get_revalidates_cached_responses(mock_github_fetch_token):
+    cache.clear()
+    url = f"{GitHubAPI.GITHUB_BASE_URL}/repos/owner/repo/pulls/1"
+    json_headers = {"content-type": "application/json; charset=utf-8"}
+    rate_limit_headers = {
+        "X-RateLimit-Limit": "5000",
+        "X-RateLimit-Remaining": "4999",
+        "X-RateLimit-Reset": "1700000000",
+        "X-RateLimit-Resource": "core",
+    }
+    api = GitHubAPI("https://github.com/owner/repo")
+
+    with requests_mock.mock() as mocker:
+        mocker.get(
+            url,
+            [
+                {
+                    "json": {"number": 1},
+                    "headers": {"ETag": '"v1"', **json_headers, **rate_limit_headers},
+                },
+                {"status_code": 304, "headers": rate_limit_headers},
+            ],
+        )
+
+        first = api.get("repos/owner/repo/pulls/1")
+        second = api.get("repos/owner/repo/pulls/1")
+
+        assert "If-None-Match" not in mocker.request_history[0].headers
+        assert mocker.request_history[1].headers["If-None-Match"] == '"v1"', (
+            "Requests for cached URLs should be conditional."
+        )
+
+    assert first.json() == second.json() == {"number": 1}
+    assert second.status_code == 200, "A 304 should be answered from the cache."
+    assert second.headers["content-type"] == json_headers["content-type"]
+    assert api.rate_limit == {
+        "resource": "core",
+        "limit": 5000,
+        "remaining": 4999,
+        "reset": 1700000000,
+    }, "The rate limit reported by GitHub should be recorded."
+
+
 @pytest.fixture
 def mock_github_api_get(
     monkeypatch: pytest.MonkeyPatch, mock_response: Callable
@@ -575,3 +689,119 @@ def test_PullRequestPatchHelper(github_api_client_pr: mock.Mock):
 )
 def test_verify_github_signature(secret, payload, signature, is_valid):
     assert verify_github_signature(secret, payload, signature) is is_valid
+
+
+@pytest.fixture
+def github_pr_check_data_response() -> str:
+    """Return a canned GitHub GraphQL response for `PULL_REQUEST_CHECK_DATA_QUERY`.
+
+    The commits match the `github_pr_commits_response` fixture. The review
+    threads have a further page, to exercise the fallback to the REST API.
+    """
+    json_data_path = (
+        settings.BASE_DIR
+        / "utils"
+        / "tests"
+        / "data"
+        / "github_graphql_response_pull_check_data.json"
+    )
+    with open(json_data_path) as f:
+        return f.read()
+
+
+def test_PullRequest_prefetch_check_data(
+    github_api_client_pr: GitHubAPIClient,
+    github_pr_commits_response: str,
+    github_pr_check_data_response: str,
+    mock_response: Callable,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    post = mock.Mock(
+        return_value=mock_response(json_dict=json.loads(github_pr_check_data_response))
+    )
+    monkeypatch.setattr(github_api_client_pr.session, "post", post)
+    get_commits_comments = mock.Mock(return_value=[])
+    monkeypatch.setattr(
+        github_api_client_pr, "get_pull_request_commits_comments", get_commits_comments
+    )
+
+    pr = github_api_client_pr.build_pull_request(1)
+    pr.prefetch_check_data()
+
+    assert post.call_count == 1, "Check data should be fetched in one query."
+    rest_get_calls = github_api_client_pr._api.get.call_count
+
+    rest_commits = json.loads(github_pr_commits_response)
+    assert [c["sha"] for c in pr.commits] == [c["sha"] for c in rest_commits]
+    assert [c["commit"]["author"] for c in pr.commits] == [
+        c["commit"]["author"] for c in rest_commits
+    ], "Prefetched commits should match the REST API's."
+    assert pr.author == ("Olivier Mehani", "omehani@mozilla.com")
+
+    assert [(r["user"]["login"], r["state"]) for r in pr.reviews] == [
+        ("reviewer", PullRequest.Review.APPROVED)
+    ], "Pending reviews should be left out, like the REST API does."
+    assert pr.reviews[0]["commit_id"] == pr.head_sha
+    assert [c["user"]["login"] for c in pr.comments] == ["zzzeid"]
+
+    assert github_api_client_pr._api.get.call_count == rest_get_calls, (
+        "Prefetched data should not be fetched from the REST API."
+    )
+
+    assert pr.commit_comments == []
+    assert get_commits_comments.call_count == 1, (
+        "Data which didn't fit in one page should be fetched separately."
+    )
+
+
+def test_PullRequestChecks_parallel(
+    github_api_client_pr: GitHubAPIClient,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    review = {
+        "user": {"login": "reviewer"},
+        "state": PullRequest.Review.CHANGES_REQUESTED,
+        "body": "Needs work\nSee comments.",
+        "html_url": "https://github.com/mozilla-conduit/test-repo/pull/1#review",
+        "commit_id": "79250dceba7ff53b9e7e813262b6162c3a1c776a",
+        "submitted_at": "2025-10-21T03:00:00Z",
+    }
+    get_reviews = mock.Mock(return_value=[review])
+    monkeypatch.setattr(github_api_client_pr, "get_pull_request_reviews", get_reviews)
+    monkeypatch.setattr(
+        github_api_client_pr,
+        "get_pull_request_commits_comments",
+        mock.Mock(side_effect=RuntimeError("upstream is down")),
+    )
+
+    target_repo = mock.Mock(required_permission="scm_level_3", default_branch="main")
+    request = mock.Mock()
+    request.user.get_user_permissions.return_value = set()
+    # This check queries the database, which isn't needed here.
+    checks_list = [
+        chk.name()
+        for chk in ALL_PULL_REQUEST_CHECKS
+        if chk is not PullRequestPreviouslyLandedWarning
+    ]
+
+    serial = PullRequestChecks(github_api_client_pr, target_repo, request).run(
+        checks_list, github_api_client_pr.build_pull_request(1)
+    )
+    serial_review_calls = get_reviews.call_count
+    get_reviews.reset_mock()
+
+    parallel = PullRequestChecks(
+        github_api_client_pr, target_repo, request, max_workers=4
+    ).run(checks_list, github_api_client_pr.build_pull_request(1))
+
+    assert parallel == serial, (
+        "Parallel checks should return the same messages, in the same order."
+    )
+    assert (
+        "PullRequestUnresolvedCommentsWarning failed to run with error: "
+        "upstream is down" in parallel
+    ), "Errors should still be captured per check."
+    assert "Has a review intended to block landing. Needs work… " in " ".join(parallel)
+    assert get_reviews.call_count == 1 < serial_review_calls, (
+        "Reviews should only be fetched once for all checks in parallel mode."
+    )
@@ -0,0 +1,70 @@
+from unittest import mock
+
+import requests
+from django.conf import settings
+from django.test import override_settings
+from requests.adapters import HTTPAdapter
+from urllib3.response import HTTPResponse
+
+from lando.utils.http import CappedRetry, create_session, get_http_adapter
+
+
+def test_create_session_shares_adapter_per_service():
+    first = create_session("phabricator", headers={"X-Test": "1"})
+    second = create_session("phabricator")
+
+    assert first.get_adapter("https://phabricator.test") is second.get_adapter(
+        "https://phabricator.test"
+    ), "Sessions for the same service should share a connection pool."
+    assert first.get_adapter("https://phabricator.test") is not get_http_adapter(
+        "bmo"
+    ), "Each service should have its own connection pool."
+
+    assert first.headers["User-Agent"] == settings.HTTP_USER_AGENT
+    assert first.headers["X-Test"] == "1"
+    assert "X-Test" not in second.headers, "Headers should not be shared."
+
+
+def test_pooled_adapter_applies_timeout_and_reports_latency(monkeypatch):
+    sent = []
+
+    def send(self, request, **kwargs):
+        sent.append(kwargs["timeout"])
+        response = requests.Response()
+        response.status_code = 503 if "fail" in request.url else 200
+        response.request = request
+        return response
+
+    monkeypatch.setattr(HTTPAdapter, "send", send)
+    mock_statsd = mock.MagicMock()
+    monkeypatch.setattr("lando.utils.http.statsd", mock_statsd)
+
+    session = create_session("latency-test")
+    session.get("https://latency.test/ok")
+    session.get("https://latency.test/ok", timeout=5)
+    session.get("https://latency.test/fail")
+
+    assert sent == [settings.HTTP_TIMEOUT, 5, settings.HTTP_TIMEOUT], (
+        "The default timeout should only apply when none is given."
+    )
+
+    tags = ["service:latency-test", "host:latency.test"]
+    assert mock_statsd.timing.call_count == 3
+    assert mock_statsd.timing.call_args.kwargs["tags"] == tags
+    assert mock_statsd.increment.call_args_list == [
+        mock.call("lando-api.http.request_errors", tags=tags)
+    ], "Server errors should be counted."
+
+
+@override_settings(HTTP_RETRY_AFTER_MAX=10)
+def test_capped_retry_limits_retry_after():
+    retry = CappedRetry(total=3, respect_retry_after_header=True)
+
+    assert retry.get_retry_after(HTTPResponse(headers={"Retry-After": "3600"})) == 10, (
+        "Long Retry-After waits should be capped."
+    )
+    assert retry.get_retry_after(HTTPResponse(headers={"Retry-After": "2"})) == 2
+    assert retry.get_retry_after(HTTPResponse()) is None
+    assert isinstance(retry.increment(method="GET"), CappedRetry), (
+        "Retries should keep the cap."
+    )
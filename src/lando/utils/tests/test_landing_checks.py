@@ -1,9 +1,14 @@
 import io
+import os
+import time
+from collections.abc import Callable
 from unittest.mock import patch
 
 import pytest
 import requests
 import rs_parsepatch
+from django.core.cache import cache
+from django.test import override_settings
 
 from lando.main.scm.helpers import (
     GitPatchHelper,
@@ -11,18 +16,27 @@ from lando.main.scm.helpers import (
 )
 from lando.utils.landing_checks import (
     ALL_CHECKS,
+    ALL_COMMIT_CHECKS,
+    ALL_STACK_CHECKS,
     BugReferencesCheck,
     CommitMessagesCheck,
+    DiffAssessor,
     LandingChecks,
+    PatchCheckInput,
     PatchCollectionAssessor,
+    PathMatcher,
     PreventDotGithubCheck,
     PreventHgDirectoryCheck,
+    PreventNSPRCheck,
     PreventNSPRNSSCheck,
+    PreventNSSCheck,
     PreventSignedCommitsCheck,
     PreventSubmodulesCheck,
+    PreventSymlinksCheck,
     TryTaskConfigCheck,
     WPTSyncCheck,
 )
+from lando.utils.parsed_diffs import hash_diff
 
 GIT_DIFF_FILENAME_TEMPLATE = r"""\
 diff --git a/{filename} b/{filename}
@@ -503,6 +517,74 @@ def test_check_prevent_hg_directory():
     ), "Check should not allow changes to .hg directory"
 
 
+@pytest.mark.parametrize(
+    "filename,expected_checks",
+    [
+        (".hg", [PreventHgDirectoryCheck]),
+        (".hg/hgrc", [PreventHgDirectoryCheck]),
+        (".hgignore", []),
+        ("nsprpub/lib/file.c", [PreventNSPRCheck, PreventNSPRNSSCheck]),
+        ("security/nss/lib/file.c", [PreventNSSCheck, PreventNSPRNSSCheck]),
+        ("security/manager/file.c", []),
+        (".github/workflows/ci.yml", [PreventDotGithubCheck]),
+        ("try_task_config.json", [TryTaskConfigCheck]),
+        ("dom/try_task_config.json", []),
+        (".gitmodules", [PreventSubmodulesCheck]),
+    ],
+)
+def test_path_matcher(filename: str, expected_checks: list[type]):
+    check_types = (
+        PreventDotGithubCheck,
+        PreventHgDirectoryCheck,
+        PreventNSPRCheck,
+        PreventNSSCheck,
+        PreventNSPRNSSCheck,
+        PreventSubmodulesCheck,
+        TryTaskConfigCheck,
+    )
+    matcher = PathMatcher(check_types)
+
+    matched = [check_types[index] for index in matcher.match(filename)]
+
+    assert set(matched) == set(expected_checks), (
+        f"`{filename}` should be routed to exactly {expected_checks}."
+    )
+    for check_type in check_types:
+        assert check_type.matches_path(filename) == (check_type in expected_checks)
+
+
+def test_diff_assessor_routes_path_matches():
+    patch = "".join(
+        GIT_DIFF_FILENAME_TEMPLATE.format(filename=filename)
+        for filename in (
+            "dom/base/file.cpp",
+            ".hg/hgrc",
+            "nsprpub/file.c",
+            "try_task_config.json",
+        )
+    )
+    diff_assessor = DiffAssessor(
+        parsed_diff=rs_parsepatch.get_diffs(patch),
+        commit_message=COMMIT_MESSAGE,
+    )
+
+    issues = diff_assessor.run_diff_checks(
+        [
+            PreventHgDirectoryCheck,
+            PreventSymlinksCheck,
+            PreventNSPRNSSCheck,
+            TryTaskConfigCheck,
+        ]
+    )
+
+    assert issues == [
+        "Patch attempts to modify repository metadata: `.hg/hgrc`",
+        "Revision makes changes to restricted directories: "
+        "vendored NSPR directories: `nsprpub/file.c`.",
+        "Revision introduces the `try_task_config.json` file.",
+    ], "Each file should only be reported by the checks owning its path."
+
+
 def test_check_prevent_nspr_nss_missing_fields():
     parsed_diff = rs_parsepatch.get_diffs(
         GIT_DIFF_FILENAME_TEMPLATE.format(filename="security/nss/testfile.txt")
@@ -671,8 +753,8 @@ diff --git a/autoland/autoland/transplant.py b/autoland/autoland/transplant.py
 
     # Simulate contacting BMO returning a public bug state.
     with (
-        patch("lando.utils.landing_checks.get_status_code_for_bug") as mock_status_code,
-        patch("lando.utils.landing_checks.search_bugs") as mock_bug_search,
+        patch("lando.api.legacy.bmo.get_status_code_for_bug") as mock_status_code,
+        patch("lando.api.legacy.bmo.search_bugs") as mock_bug_search,
     ):
         mock_bug_search.side_effect = lambda bug_ids: bug_ids
 
@@ -708,8 +790,8 @@ Bug 999999: Fix issue with feature X
 
     # Simulate Bugzilla (BMO) responding that the bug is private.
     with (
-        patch("lando.utils.landing_checks.get_status_code_for_bug") as mock_status_code,
-        patch("lando.utils.landing_checks.search_bugs") as mock_bug_search,
+        patch("lando.api.legacy.bmo.get_status_code_for_bug") as mock_status_code,
+        patch("lando.api.legacy.bmo.search_bugs") as mock_bug_search,
     ):
         # Mock out bug search to simulate our bug not being found.
         mock_bug_search.return_value = set()
@@ -748,8 +830,8 @@ SKIP_BMO_CHECK
 
     # Simulate Bugzilla (BMO) responding that the bug is private.
     with (
-        patch("lando.utils.landing_checks.get_status_code_for_bug") as mock_status_code,
-        patch("lando.utils.landing_checks.search_bugs") as mock_bug_search,
+        patch("lando.api.legacy.bmo.get_status_code_for_bug") as mock_status_code,
+        patch("lando.api.legacy.bmo.search_bugs") as mock_bug_search,
     ):
         # Mock out bug search to simulate our bug not being found.
         mock_bug_search.return_value = set()
@@ -786,8 +868,8 @@ Bug 123456: Fix issue with feature Y
 
     # Simulate an error occurring when trying to contact BMO.
     with (
-        patch("lando.utils.landing_checks.get_status_code_for_bug") as mock_status_code,
-        patch("lando.utils.landing_checks.search_bugs") as mock_bug_search,
+        patch("lando.api.legacy.bmo.get_status_code_for_bug") as mock_status_code,
+        patch("lando.api.legacy.bmo.search_bugs") as mock_bug_search,
     ):
         mock_bug_search.return_value = set()
 
@@ -809,6 +891,53 @@ Bug 123456: Fix issue with feature Y
         )
 
 
+def test_check_bug_references_reports_all_invalid_bugs():
+    patch_helper = HgPatchHelper.from_string_io(
+        io.StringIO(
+            """
+# HG changeset patch
+# User byron jones <glob@mozilla.com>
+# Date 1523427125 -28800
+# Node ID 3379ea3cea34ecebdcb2cf7fb9f7845861ea8f07
+# Parent  46c36c18528fe2cc780d5206ed80ae8e37d3545d
+Bug 100: Fix issue with features X, Y and Z, r?reviewer
+
+Also fixes bug 200, bug 300 and bug 400.
+""".strip()
+        )
+    )
+
+    status_codes = {200: 401, 300: 401, 400: 404}
+
+    with (
+        patch("lando.api.legacy.bmo.get_status_code_for_bug") as mock_status_code,
+        patch("lando.api.legacy.bmo.search_bugs") as mock_bug_search,
+    ):
+        mock_bug_search.return_value = {100}
+        mock_status_code.side_effect = status_codes.get
+
+        assessor = PatchCollectionAssessor(patch_helpers=[patch_helper])
+        issues = assessor.run_patch_collection_checks(
+            patch_collection_checks=[BugReferencesCheck],
+            patch_checks=[],
+        )
+
+    assert mock_bug_search.call_count == 1, "Bugs should be searched in one request."
+    assert sorted(call.args[0] for call in mock_status_code.call_args_list) == [
+        200,
+        300,
+        400,
+    ], "Only bugs which weren't found should be looked up individually."
+    assert len(issues) == 1
+    assert (
+        "Your commit message references bugs 200, 300, which are currently private."
+        in issues[0]
+    ), "All private bugs should be reported."
+    assert (
+        "Your commit message references bug 400, which does not exist." in issues[0]
+    ), "Nonexistent bugs should be reported alongside private bugs."
+
+
 def test_check_try_task_config():
     parsed_diff = rs_parsepatch.get_diffs(
         GIT_DIFF_FILENAME_TEMPLATE.format(filename="security/nss/testfile.txt")
@@ -856,3 +985,169 @@ def test_landing_checks_run():
     names_run = landing_checks.run([chk.name() for chk in ALL_CHECKS], patch_helpers)
 
     assert len(names_run) == 4
+
+
+# Enable the local memory cache since we use the dummy cache in tests.
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "test-landing-checks",
+        }
+    }
+)
+@pytest.mark.django_db
+def test_patch_collection_assessor_memoizes_results():
+    cache.clear()
+    patch_helpers = [
+        GitPatchHelper.from_string_io(
+            io.StringIO(
+                GIT_PATCH_FILENAME_TEMPLATE.format(filename="try_task_config.json")
+            )
+        )
+    ]
+
+    def run_checks() -> list[str]:
+        assessor = PatchCollectionAssessor(
+            patch_helpers=patch_helpers, repo_name="some-repo"
+        )
+        return assessor.run_patch_collection_checks(
+            patch_collection_checks=[CommitMessagesCheck, BugReferencesCheck],
+            patch_checks=[TryTaskConfigCheck, PreventSymlinksCheck],
+        )
+
+    first = run_checks()
+
+    with (
+        patch.object(TryTaskConfigCheck, "result") as try_task_config_result,
+        patch.object(PreventSymlinksCheck, "result") as symlinks_result,
+        patch.object(CommitMessagesCheck, "result") as commit_messages_result,
+        patch.object(
+            BugReferencesCheck, "result", return_value=None
+        ) as bug_references_result,
+    ):
+        second = run_checks()
+
+    assert second == first, "Memoized results should match the computed ones."
+    assert "Revision introduces the `try_task_config.json` file." in second
+    assert not try_task_config_result.called, "Patch check should be memoized."
+    assert not symlinks_result.called, "Passing patch check should be memoized."
+    assert not commit_messages_result.called, "Collection check should be memoized."
+    assert bug_references_result.called, (
+        "`BugReferencesCheck` depends on BMO and should not be memoized."
+    )
+
+    TryTaskConfigCheck.version += 1
+    try:
+        with patch.object(
+            TryTaskConfigCheck, "result", return_value=None
+        ) as try_task_config_result:
+            run_checks()
+    finally:
+        TryTaskConfigCheck.version -= 1
+
+    assert try_task_config_result.called, (
+        "Bumping a check's version should invalidate its memoized results."
+    )
+
+
+# Enable the local memory cache since we use the dummy cache in tests.
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "test-landing-checks-shared-memo",
+        }
+    }
+)
+def test_diff_checks_share_memo_between_stack_page_and_workers():
+    cache.clear()
+    diff = GIT_DIFF_FILENAME_TEMPLATE.format(filename="try_task_config.json")
+
+    # The stack page only knows the revision title.
+    DiffAssessor(
+        parsed_diff=rs_parsepatch.get_diffs(diff),
+        commit_message="Bug 1 - Some title",
+        diff_hash=hash_diff(diff),
+    ).run_diff_checks([TryTaskConfigCheck, PreventDotGithubCheck])
+
+    # Workers check the full commit.
+    worker_input = PatchCheckInput(
+        diff=diff,
+        author="Some Author",
+        email="author@example.com",
+        commit_message="Bug 1 - Some title r=reviewer\n\nSome summary.",
+    )
+    results = worker_input.memo().results([TryTaskConfigCheck, PreventDotGithubCheck])
+
+    assert results == {
+        TryTaskConfigCheck: "Revision introduces the `try_task_config.json` file."
+    }, (
+        "Results of checks which only inspect the diff should be shared, unlike "
+        "those of checks inspecting the commit message."
+    )
+
+
+def synthetic_stack(size: int) -> list[GitPatchHelper]:
+    """Return a stack of `size` patches, some of which trigger landing checks."""
+    filenames = (
+        "try_task_config.json",
+        "nsprpub/testfile.txt",
+        ".hg/hgrc",
+        "some/ordinary/file.txt",
+    )
+    return [
+        GitPatchHelper.from_string_io(
+            io.StringIO(
+                GIT_PATCH_FILENAME_TEMPLATE.format(
+                    filename=filenames[i % len(filenames)]
+                )
+            )
+        )
+        for i in range(size)
+    ]
+
+
+def test_patch_collection_assessor_parallel_matches_serial():
+    patch_checks = ALL_COMMIT_CHECKS
+
+    serial = PatchCollectionAssessor(
+        patch_helpers=synthetic_stack(12)
+    ).run_patch_collection_checks(
+        patch_collection_checks=[CommitMessagesCheck], patch_checks=patch_checks
+    )
+    parallel = PatchCollectionAssessor(
+        patch_helpers=synthetic_stack(12), processes=4
+    ).run_patch_collection_checks(
+        patch_collection_checks=[CommitMessagesCheck], patch_checks=patch_checks
+    )
+
+    assert serial, "The synthetic stack should trigger some checks."
+    assert parallel == serial, (
+        "Parallel checks should return the same issues, in the same order."
+    )
+
+
+@pytest.mark.skipif(
+    not os.getenv("LANDO_BENCHMARKS"), reason="Set LANDO_BENCHMARKS=1 to run."
+)
+@pytest.mark.parametrize("processes", [1, 2, 4, 8])
+def test_patch_collection_assessor_benchmark(
+    processes: int, record_property: Callable[[str, object], None]
+):
+    """Time landing checks on a synthetic 500-commit stack.
+
+    Timings are recorded as test properties, e.g. in the `--junitxml` report.
+    """
+    patch_helpers = synthetic_stack(500)
+    assessor = PatchCollectionAssessor(patch_helpers=patch_helpers, processes=processes)
+
+    start = time.perf_counter()
+    issues = assessor.run_patch_collection_checks(
+        patch_collection_checks=ALL_STACK_CHECKS, patch_checks=ALL_COMMIT_CHECKS
+    )
+    elapsed = time.perf_counter() - start
+
+    record_property("elapsed", elapsed)
+    record_property("issues", len(issues))
+    assert issues
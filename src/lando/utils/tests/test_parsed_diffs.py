@@ -0,0 +1,61 @@
+from unittest import mock
+
+import pytest
+import rs_parsepatch
+from django.core.cache import cache
+from django.test import override_settings
+
+from lando.utils.parsed_diffs import (
+    get_parsed_diff,
+    parsed_diff_cache_key,
+)
+
+SYMLINK_DIFF = """
+diff --git a/link b/link
+new file mode 120000
+--- /dev/null
++++ b/link
+@@ -0,0 +1 @@
++target
+""".lstrip()
+
+
+def test_parsed_diff_is_compact():
+    parsed = get_parsed_diff(SYMLINK_DIFF)
+
+    assert parsed == [
+        {
+            "filename": "link",
+            "new": True,
+            "deleted": False,
+            "binary": False,
+            "copied_from": None,
+            "renamed_from": None,
+            "modes": {"new": 0o120000},
+        }
+    ], "Parsed diff should retain file metadata without diff lines."
+
+
+# Enable the local memory cache since we use the dummy cache in tests.
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "test-parsed-diffs",
+        }
+    }
+)
+@pytest.mark.django_db
+def test_parsed_diff_is_cached_by_content():
+    cache.clear()
+
+    with mock.patch(
+        "lando.utils.parsed_diffs.rs_parsepatch.get_diffs",
+        wraps=rs_parsepatch.get_diffs,
+    ) as get_diffs:
+        first = get_parsed_diff(SYMLINK_DIFF)
+        second = get_parsed_diff(SYMLINK_DIFF)
+
+    assert first == second
+    assert get_diffs.call_count == 1, "The same diff should only be parsed once."
+    assert cache.get(parsed_diff_cache_key(SYMLINK_DIFF)) == first
@@ -1,7 +1,19 @@
+import threading
+import time
+
 import pytest
 from django.conf import settings
+from django.core.cache import cache
+from django.test import override_settings
 
-from lando.utils.phabricator import get_phabricator_client
+from lando.utils.phabricator import (
+    MemoizedPhabricatorClient,
+    PhabricatorAPIException,
+    PhabricatorClient,
+    PhabricatorCommunicationException,
+    call_concurrently,
+    get_phabricator_client,
+)
 
 USER_KEY = "api-userprovidedkey00000000000000"
 
@@ -29,3 +41,172 @@ def test_get_phabricator_client_api_key_selection(privileged, api_key, expected_
         f"`get_phabricator_client(privileged={privileged}, api_key={api_key!r})` "
         f"should produce a client with `api_token` `{expected_token!r}`."
     )
+
+
+@pytest.mark.parametrize("max_workers", (1, 4))
+def test_call_concurrently_returns_results_by_key(max_workers):
+    results = call_concurrently(
+        {"a": lambda: 1, ("b", 2): lambda: [2], "c": lambda: None},
+        max_workers=max_workers,
+    )
+
+    assert results == {"a": 1, ("b", 2): [2], "c": None}, (
+        "Results should be returned under the key of each call."
+    )
+
+
+def test_call_concurrently_runs_calls_in_parallel():
+    # Each call waits for all the others to start, which can only happen
+    # if they are running at the same time.
+    barrier = threading.Barrier(3, timeout=5)
+
+    results = call_concurrently(dict.fromkeys(range(3), barrier.wait), max_workers=3)
+
+    assert sorted(results.values()) == [0, 1, 2]
+
+
+@pytest.mark.parametrize("max_workers", (1, 4))
+def test_call_concurrently_raises_first_error_in_order(max_workers):
+    completed = []
+
+    def fail(exc: Exception):
+        def call():
+            raise exc
+
+        return call
+
+    with pytest.raises(PhabricatorCommunicationException) as exc_info:
+        call_concurrently(
+            {
+                "ok": lambda: completed.append("ok"),
+                "first": fail(PhabricatorCommunicationException("first")),
+                "second": fail(PhabricatorAPIException("second")),
+            },
+            max_workers=max_workers,
+        )
+
+    assert str(exc_info.value) == "first", (
+        "The error from the first failing call should be raised."
+    )
+    assert completed == ["ok"], "Calls which succeed should still run."
+
+
+def test_memoized_client_reuses_read_only_results(monkeypatch):
+    calls = []
+
+    def call_conduit(self, method, **kwargs):
+        calls.append(method)
+        return {"data": [{"phid": "PHID-DREV-1"}], "method": method}
+
+    monkeypatch.setattr(PhabricatorClient, "call_conduit", call_conduit)
+    phab = MemoizedPhabricatorClient("http://phabricator.test", "api-key")
+
+    first = phab.call_conduit("differential.revision.search", constraints={"ids": [1]})
+    first["data"].append({"phid": "PHID-DREV-2"})
+    second = phab.call_conduit("differential.revision.search", constraints={"ids": [1]})
+    phab.call_conduit("differential.revision.search", constraints={"ids": [2]})
+
+    assert calls == ["differential.revision.search"] * 2, (
+        "Identical read-only calls should only be made once."
+    )
+    assert second == {
+        "data": [{"phid": "PHID-DREV-1"}],
+        "method": "differential.revision.search",
+    }, "Modifying a returned result should not affect the memo."
+    assert (phab.conduit_requests, phab.conduit_memo_hits) == (2, 1)
+
+    # Edits may change any result, so the memo is cleared.
+    phab.call_conduit("differential.revision.edit", objectIdentifier="D1")
+    phab.call_conduit("differential.revision.search", constraints={"ids": [1]})
+
+    assert calls[-2:] == [
+        "differential.revision.edit",
+        "differential.revision.search",
+    ], "Read-only calls should be repeated after an edit."
+    assert (phab.conduit_requests, phab.conduit_memo_hits) == (4, 1)
+
+
+# Enable the local memory cache since we use the dummy cache in tests.
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "test-phabricator-object-cache",
+        }
+    }
+)
+def test_cached_search_fetches_only_new_or_modified_objects(monkeypatch):
+    cache.clear()
+    objects = {
+        "PHID-DREV-1": {"dateModified": 1, "title": "one"},
+        "PHID-DREV-2": {"dateModified": 1, "title": "two"},
+    }
+    fetched = []
+
+    listings = 0
+
+    def call_conduit(self, method, constraints, attachments=None, **kwargs):
+        nonlocal listings
+        phids = [phid for phid in objects if phid in constraints["phids"]]
+        if attachments:
+            fetched.extend(phids)
+        else:
+            listings += 1
+        return {
+            "data": [
+                {
+                    "phid": phid,
+                    "fields": dict(objects[phid]),
+                    "attachments": attachments or {},
+                }
+                for phid in phids
+            ],
+            "cursor": {"after": None},
+        }
+
+    monkeypatch.setattr(PhabricatorClient, "call_conduit", call_conduit)
+    phab = PhabricatorClient("http://phabricator.test", "api-key")
+
+    def search() -> list[dict]:
+        return phab.cached_search(
+            "differential.revision.search",
+            constraints={"phids": ["PHID-DREV-1", "PHID-DREV-2"]},
+            attachments={"projects": True},
+        )["data"]
+
+    first = search()
+    assert fetched == ["PHID-DREV-1", "PHID-DREV-2"]
+    assert listings == 0, "Uncached objects should be fetched without a listing."
+    assert [r["attachments"] for r in first] == [{"projects": True}] * 2
+
+    assert search() == first, "Unmodified objects should be served from the cache."
+    assert len(fetched) == 2, "Unmodified objects should not be fetched again."
+
+    objects["PHID-DREV-2"] = {"dateModified": 2, "title": "two, again"}
+    third = search()
+    assert fetched[2:] == ["PHID-DREV-2"], "Modified objects should be fetched."
+    assert third[1]["fields"]["title"] == "two, again"
+
+    del objects["PHID-DREV-1"]
+    assert [r["phid"] for r in search()] == ["PHID-DREV-2"], (
+        "Cached objects should not be returned once they can't be found."
+    )
+
+    other_phab = PhabricatorClient("http://phabricator.test", "other-api-key")
+    other_phab.cached_search(
+        "differential.revision.search",
+        constraints={"phids": ["PHID-DREV-2"]},
+        attachments={"projects": True},
+    )
+    assert fetched[3:] == ["PHID-DREV-2"], (
+        "Objects should not be shared between API tokens."
+    )
+
+    # `dateModified` is truncated to the second, so objects modified just before
+    # they were fetched may have been modified again since.
+    objects["PHID-DREV-2"] = {"dateModified": int(time.time()), "title": "recent"}
+    search()
+    search()
+    assert fetched[4:] == ["PHID-DREV-2", "PHID-DREV-2"], (
+        "Recently modified objects should be fetched again."
+    )
@@ -0,0 +1,77 @@
+import io
+import json
+import zipfile
+
+import pytest
+import requests_mock
+from django.core.management import call_command
+
+from lando.main.models import CommitMap
+
+MAPPING_ROWS = [(f"{i:040x}", f"{i + 100:040x}") for i in range(5)]
+
+
+def mapping_csv(rows: list[tuple[str, str]]) -> str:
+    return "git,hg\n" + "".join(f"{git},{hg}\n" for git, hg in rows)
+
+
+@pytest.mark.django_db
+def test_process_git_hg_mapping_file_zip(tmp_path):
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as f:
+        f.writestr("git2hg_test.csv", mapping_csv(MAPPING_ROWS))
+
+    git_hash, hg_hash = MAPPING_ROWS[1]
+    CommitMap.objects.create(git_hash=git_hash, hg_hash=hg_hash, git_repo_name="test")
+
+    stdout = io.StringIO()
+    with requests_mock.mock() as mocker:
+        mocker.get(
+            "https://archive.mozilla.org/pub/vcs-archive/git2hg_test.csv.zip",
+            content=archive.getvalue(),
+        )
+        call_command(
+            "process_git_hg_mapping_file",
+            csv_name="git2hg_test.csv",
+            repo="test",
+            batch_size=2,
+            work_dir=tmp_path,
+            stdout=stdout,
+        )
+
+    assert set(
+        CommitMap.objects.filter(git_repo_name="test").values_list(
+            "git_hash", "hg_hash"
+        )
+    ) == set(MAPPING_ROWS), "All rows should be loaded."
+    assert "Created 4 records." in stdout.getvalue()
+    assert "Skipped 1 records." in stdout.getvalue(), "Existing rows should be skipped."
+    assert "Processed 4 rows" in stdout.getvalue(), "Progress should be reported."
+    assert not list(tmp_path.glob("*.checkpoint")), (
+        "The checkpoint should be removed once the file is fully loaded."
+    )
+
+
+@pytest.mark.django_db
+def test_process_git_hg_mapping_file_resumes_from_checkpoint(tmp_path):
+    url = "https://example.test/mapping.csv"
+    (tmp_path / "mapping.csv").write_text(mapping_csv(MAPPING_ROWS))
+    (tmp_path / "mapping.csv.test.checkpoint").write_text(
+        json.dumps({"url": url, "rows": 3})
+    )
+
+    # No URL is mocked, so the file must not be downloaded again.
+    with requests_mock.mock():
+        call_command(
+            "process_git_hg_mapping_file",
+            url=url,
+            repo="test",
+            work_dir=tmp_path,
+            stdout=io.StringIO(),
+        )
+
+    assert set(
+        CommitMap.objects.filter(git_repo_name="test").values_list(
+            "git_hash", "hg_hash"
+        )
+    ) == set(MAPPING_ROWS[3:]), "Only rows after the checkpoint should be loaded."